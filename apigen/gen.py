@@ -12,3 +12,9 @@ def gen(api: Api):
 
     with open(gen_path / "teleapi.py", "w", encoding="utf-8") as f:
         api.gen(f)
+
+    with open(gen_path / "teleclient.py", "w", encoding="utf-8") as f:
+        api.gen_client(f)
+
+    with open(gen_path / "telemethods.py", "w", encoding="utf-8") as f:
+        api.gen_methods(f)
@@ -1,12 +1,57 @@
 import re
-from typing import IO, List, Optional
+from typing import IO, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
 from apigen.helpers import formatted
+from apigen.overrides import METHOD_OVERRIDES
 
 Row = List[str]
 
+# Tag fields of union members, i.e. "The member's status in the chat, always “creator”"
+TAG_RE = re.compile(r"(?:always|must be) “?([a-z0-9_]+)”?$")
+
+# Methods which can be safely repeated if it's unknown whether the first attempt
+# reached Telegram, because repeating them has the same effect.
+IDEMPOTENT_PREFIXES = (
+    "get",
+    "set",
+    "delete",
+    "edit",
+    "pin",
+    "unpin",
+    "ban",
+    "unban",
+    "restrict",
+    "promote",
+    "approve",
+    "decline",
+    "close",
+    "reopen",
+    "hide",
+    "unhide",
+    "leave",
+    "answer",
+    "verify",
+    "remove",
+    "read",
+    "logOut",
+)
+
+METHOD_INFO_DESCRIPTION = (
+    "Classification of api method: read_only methods don't change anything, "
+    "idempotent ones can be safely repeated, upload ones can take files, "
+    "bulk ones take a list of identifiers to process many objects at once. "
+    "Limits are (min, max) of length or value of params, taken from docs."
+)
+
+CLIENT_DESCRIPTION = (
+    "Concrete implementation of Teleapi methods with explicit signatures, "
+    "no attribute lookup magic on call. "
+    "Files for InputMedia, InputPaidMedia and InputSticker params can be passed "
+    "as extra keyword arguments and referred with attach://<name>."
+)
+
 
 class ParseError(Exception):
     pass
@@ -53,19 +98,17 @@ class ApiType(BaseModel):
     def parse(*, original_type: str, optional: bool) -> "ApiType":
         is_list = False
         is_list_of_list = False
-        types = []
 
         if original_type.startswith("Array of Array of"):
-            types.append(original_type[18:])
+            original_type = original_type[18:]
             is_list = True
             is_list_of_list = True
         elif original_type.startswith("Array of"):
-            types.append(original_type[9:])
+            original_type = original_type[9:]
             is_list = True
-        elif " or " in original_type:
-            types = original_type.split(" or ")
-        else:
-            types.append(original_type)
+
+        # i.e. "Integer or String", "InputMediaAudio, InputMediaDocument, InputMediaPhoto and InputMediaVideo"
+        types = re.split(r", | or | and ", original_type)
 
         types = [
             (
@@ -148,6 +191,19 @@ class ApiType(BaseModel):
         )
 
 
+class ApiMethodInfo:
+    """Fields of generated ApiMethodInfo with their annotations"""
+
+    name: "str"
+    return_type: "str"
+    read_only: "bool"
+    idempotent: "bool"
+    upload: "bool"
+    bulk: "bool"
+    file_params: "Tuple[str, ...]"
+    limits: "Dict[str, Tuple[int, int]]"
+
+
 class ApiParam(BaseModel):
     name: str
     api_type: ApiType
@@ -170,6 +226,20 @@ class ApiParam(BaseModel):
             optional=optional,
         )
 
+    def may_be_file(self) -> bool:
+        return "'InputFile'" in self.api_type.py_annotation
+
+    def may_have_attachments(self) -> bool:
+        """Params which can refer to files uploaded along with request by attach://<name>"""
+        return any(t in self.api_type.py_annotation for t in ["'InputMedia", "'InputPaidMedia'", "'InputSticker'"])
+
+    def limits(self) -> Optional[Tuple[int, int]]:
+        """Documented limits of length or value, i.e. "1-4096 characters" """
+        for lo, hi in re.findall(r"(\d+)-(\d+)", self.description):
+            if int(lo) <= int(hi):
+                return int(lo), int(hi)
+        return None
+
 
 class ApiMethod(BaseModel):
     name: str
@@ -186,6 +256,45 @@ class ApiMethod(BaseModel):
             description=el.description,
         )
 
+    def is_read_only(self) -> bool:
+        return self.name.startswith("get")
+
+    def is_idempotent(self) -> bool:
+        return self.name.startswith(IDEMPOTENT_PREFIXES)
+
+    def is_upload(self) -> bool:
+        return any(p.may_be_file() or p.may_have_attachments() for p in self.params)
+
+    def is_bulk(self) -> bool:
+        return any(
+            not p.optional and p.name.endswith("_ids") and p.api_type.py_annotation.startswith("List[")
+            for p in self.params
+        )
+
+    def info(self) -> dict:
+        info = dict(
+            name=self.name,
+            return_type=self.return_type.py_annotation,
+            read_only=self.is_read_only(),
+            idempotent=self.is_idempotent(),
+            upload=self.is_upload(),
+            bulk=self.is_bulk(),
+            file_params=tuple(p.name for p in self.params if p.may_be_file()),
+            limits={p.name: p.limits() for p in self.params if p.limits() is not None},
+        )
+        info.update(METHOD_OVERRIDES.get(self.name, {}))
+        return info
+
+    def gen_info(self, f):
+        f.write(f'    "{self.name}": ApiMethodInfo(\n')
+        for k, v in self.info().items():
+            f.write(f"        {k}={v!r},\n")
+        f.write("    ),\n")
+
+    def annotation_names(self) -> List[str]:
+        annotations = [p.api_type.py_annotation for p in self.params] + [self.return_type.py_annotation]
+        return [n for a in annotations for n in re.findall(r"'(\w+)'", a)]
+
     def gen(self, f, is_async: bool = False):
         params = sorted(self.params, key=lambda p: 1 if p.optional else -1)
         sig = (
@@ -214,6 +323,47 @@ class ApiMethod(BaseModel):
             f.write(f"        :param {p.name}: {desc}")
         f.write('        """\n        pass\n\n')
 
+    def gen_client(self, f, is_async: bool = False):
+        params = sorted(self.params, key=lambda p: 1 if p.optional else -1)
+        file_params = [p for p in params if p.may_be_file()]
+        attachments = any(p.may_have_attachments() for p in params)
+        sig = (
+            "            self,\n"
+            + ("            *,\n" if params else "")
+            + (
+                "".join(
+                    f"            {p.name}: {p.api_type.py_annotation}"
+                    + (" = None" if p.optional else "")
+                    + ","
+                    + ("  # noqa" if p.name in ["type", "format"] else "")
+                    + "\n"
+                    for p in params
+                )
+            )
+            + ("            **attachments: 'InputFile',\n" if attachments else "")
+        )
+        f.write(
+            f"    {'async ' if is_async else ''}def {self.name}(\n{sig}    ) -> {self.return_type.py_annotation}:\n"
+        )
+        f.write(f"        return {'await ' if is_async else ''}self._call(\n")
+        f.write(f'            "{self.name}",\n')
+        f.write("            drop_none(\n")
+        for p in params:
+            if p not in file_params:
+                f.write(f"                {p.name}={p.name},\n")
+        f.write("            ),\n")
+        if file_params or attachments:
+            f.write("            drop_none(\n")
+            for p in file_params:
+                f.write(f"                {p.name}={p.name},\n")
+            if attachments:
+                f.write("                **attachments,\n")
+            f.write("            ),\n")
+        else:
+            f.write("            None,\n")
+        f.write(f"            call_plans.{self.name},\n")
+        f.write("        )\n\n")
+
 
 class ApiField(BaseModel):
     name: str
@@ -236,6 +386,13 @@ class ApiField(BaseModel):
             optional=optional,
         )
 
+    def tag(self) -> Optional[str]:
+        """Value of tag field, which is always the same for type and tells it from other members of union"""
+        if self.optional or self.api_type.py_annotation != "str":
+            return None
+        m = TAG_RE.search(" ".join(self.description.split()))
+        return m.group(1) if m else None
+
     def gen(self, f):
         name = self.name if self.name != "from" else "from_"
         alias = 'alias="from"' if self.name == "from" else ""
@@ -250,7 +407,9 @@ class ApiField(BaseModel):
         else:
             eq = ""
 
-        f.write(f"    {name}: {self.api_type.py_annotation}{eq}\n")
+        tag = self.tag()
+        annotation = f'Literal["{tag}"]' if tag is not None else self.api_type.py_annotation
+        f.write(f"    {name}: {annotation}{eq}\n")
         f.write('    """ ')
         f.write(formatted(self.description, "    ", ""))
         f.write(' """\n\n')
@@ -299,12 +458,31 @@ class ApiUnion(BaseModel):
             union=el.ul,
         )
 
-    def gen(self, f):
+    def discriminator(self, objects: Dict[str, ApiObject]) -> Optional[str]:
+        """Name of tag field, if all members have it with different values"""
+        tags = []
+        for name in self.union:
+            o = objects.get(name)
+            tag = next(((f.name, f.tag()) for f in o.fields if f.tag() is not None), None) if o else None
+            if tag is None:
+                return None
+            tags.append(tag)
+        if len({name for name, _ in tags}) != 1 or len({value for _, value in tags}) != len(tags):
+            return None
+        return tags[0][0]
+
+    def gen(self, f, objects: Dict[str, ApiObject]):
         f.write('"""\n')
         f.write(formatted(self.description) + "\n")
         f.write('"""\n')
-        res = "".join(f"    {l},\n" for l in self.union)
-        f.write(f"{self.name} = Union[\n{res}]\n\n")
+        discriminator = self.discriminator(objects)
+        if discriminator is None:
+            res = "".join(f"    {l},\n" for l in self.union)
+            f.write(f"{self.name} = Union[\n{res}]\n\n")
+        else:
+            res = "".join(f"        {l},\n" for l in self.union)
+            f.write(f"{self.name} = Annotated[\n    Union[\n{res}    ],\n")
+            f.write(f'    Field(discriminator="{discriminator}"),\n]\n\n')
 
 
 class Api(BaseModel):
@@ -339,12 +517,14 @@ class Api(BaseModel):
 
     def gen(self, f):
         f.write(
-            "from typing import Any, List, Optional, Protocol, Union\n\nfrom pydantic import BaseModel, Field\n\n\n"
+            "from typing import Any, List, Literal, Optional, Protocol, Union\n\n"
+            "from pydantic import BaseModel, Field\nfrom typing_extensions import Annotated\n\n\n"
         )
         for o in self.objects:
             o.gen(f)
+        objects = {o.name: o for o in self.objects}
         for u in self.unions:
-            u.gen(f)
+            u.gen(f, objects)
 
         f.write(
             '"""InputFile should be file-like object, supported only in api calls, not models"""\nInputFile = Any\n\n'
@@ -366,3 +546,43 @@ class Api(BaseModel):
             m.gen(f, True)
 
         f.write("# EOF\n")
+
+    def gen_methods(self, f):
+        f.write("from typing import Dict, NamedTuple, Tuple\n\n\n")
+        f.write("class ApiMethodInfo(NamedTuple):\n")
+        f.write('    """\n')
+        f.write(formatted(METHOD_INFO_DESCRIPTION, "    ") + "\n")
+        f.write('    """\n\n')
+        for k, t in ApiMethodInfo.__annotations__.items():
+            f.write(f"    {k}: {t}\n")
+        f.write("\n\n")
+        f.write("METHODS: Dict[str, ApiMethodInfo] = {\n")
+        for m in self.methods:
+            m.gen_info(f)
+        f.write("}\n")
+
+    def gen_client(self, f):
+        names = sorted({n for m in self.methods for n in m.annotation_names()})
+        f.write("from typing import Any, List, Optional, Union\n\n")
+        f.write("from teleapi.teleapi import (\n")
+        f.write("".join(f"    {n},\n" for n in names))
+        f.write(")\n")
+        f.write("from teleapi.teleproxy import TeleProxy, TeleProxyAsync, call_plans, drop_none\n\n\n")
+
+        f.write("class TeleapiClient(TeleProxy):\n")
+        f.write('    """\n')
+        f.write(formatted(CLIENT_DESCRIPTION, "    ") + "\n")
+        f.write('    """\n\n')
+        for m in self.methods:
+            m.gen_client(f)
+
+        f.write("\n")
+
+        f.write("class TeleapiClientAsync(TeleProxyAsync):\n")
+        f.write('    """\n')
+        f.write(formatted(CLIENT_DESCRIPTION, "    ") + "\n")
+        f.write('    """\n\n')
+        for m in self.methods:
+            m.gen_client(f, True)
+
+        f.write("# EOF\n")
@@ -0,0 +1,8 @@
+# Curated corrections of method classification derived from names and docs.
+
+METHOD_OVERRIDES = {
+    # confirms updates by offset, so it's not read-only, but repeating it with the same offset is safe
+    "getUpdates": {"read_only": False},
+    # "1-6" in emoji description are dice values, not length of emoji
+    "sendDice": {"limits": {}},
+}
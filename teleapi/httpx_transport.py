@@ -1,62 +1,100 @@
-import json
+from contextlib import nullcontext
+from typing import Optional
 
 import httpx
 
 from teleapi.teleapi import Teleapi, TeleapiAsync
-from teleapi.teleproxy import TeleProxy, TeleProxyAsync
+from teleapi.teleclient import TeleapiClient, TeleapiClientAsync
+from teleapi.telecodec import JsonCodec, default_codec
+from teleapi.teletracing import NOOP_SPAN, Tracer
 
 # use with httpx extras !
 
 
 class HttpxTeleTransport:
-    def __init__(self, bot_token: str, telegram_api: str, timeout: int):
+    def __init__(
+        self,
+        bot_token: str,
+        telegram_api: str,
+        timeout: int,
+        codec: JsonCodec = default_codec,
+        tracer: Optional[Tracer] = None,
+    ):
         self.bot_token = bot_token
         self.telegram_api = telegram_api
         self.timeout = timeout
+        self.codec = codec
+        self.tracer = tracer
 
-    def request(self, api_method_name: str, params: dict, files: dict) -> dict:
-        params = {k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in params.items()}
-        resp = httpx.post(
-            f"{self.telegram_api}bot{self.bot_token}/{api_method_name}",
-            data=params,
-            files=files,
-            timeout=self.timeout,
-        )
-
-        # 400 response still contain valid ApiResponse with ok=False,
-        # so TeleProxy raise TeleError with informative description
-        if resp.status_code != 400:
-            resp.raise_for_status()
-
-        return resp.json()
+    def _span(self, api_method_name: str):
+        if self.tracer is None:
+            return nullcontext(NOOP_SPAN)
+        return self.tracer.span("http.post", method=api_method_name)
 
-    async def request_async(self, api_method_name: str, params: dict, files: dict) -> dict:
-        params = {k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in params.items()}
+    def _encode(self, params: dict) -> dict:
+        dumps = self.codec.dumps
+        return {k: dumps(v) if isinstance(v, (dict, list)) else v for k, v in params.items()}
 
-        async with httpx.AsyncClient() as cli:
-            resp = await cli.post(
+    def request(self, api_method_name: str, params: dict, files: dict) -> bytes:
+        params = self._encode(params)
+        with self._span(api_method_name) as span:
+            resp = httpx.post(
                 f"{self.telegram_api}bot{self.bot_token}/{api_method_name}",
                 data=params,
                 files=files,
                 timeout=self.timeout,
             )
-            if resp.status_code != 400:
+            span.set("http.status_code", resp.status_code)
+            span.set("response.size", len(resp.content))
+
+        # 400 and 429 responses still contain valid ApiResponse with ok=False,
+        # so TeleProxy raise TeleError with informative description and parameters
+        if resp.status_code not in (400, 429):
+            resp.raise_for_status()
+
+        return resp.content
+
+    async def request_async(self, api_method_name: str, params: dict, files: dict) -> bytes:
+        params = self._encode(params)
+
+        async with httpx.AsyncClient() as cli:
+            with self._span(api_method_name) as span:
+                resp = await cli.post(
+                    f"{self.telegram_api}bot{self.bot_token}/{api_method_name}",
+                    data=params,
+                    files=files,
+                    timeout=self.timeout,
+                )
+                span.set("http.status_code", resp.status_code)
+                span.set("response.size", len(resp.content))
+
+            if resp.status_code not in (400, 429):
                 resp.raise_for_status()
 
-            return resp.json()
+            return resp.content
 
 
 def httpx_teleapi_factory(
     bot_token: str,
     telegram_api: str = "https://api.telegram.org/",
     timeout: int = 60,
+    **options,
 ) -> Teleapi:
-    return TeleProxy(HttpxTeleTransport(bot_token, telegram_api, timeout))  # noqa
+    """
+    :param options: options of TeleProxy, i.e. retry, metrics, tracer
+    """
+    transport = HttpxTeleTransport(bot_token, telegram_api, timeout, tracer=options.get("tracer"))
+    return TeleapiClient(transport, **options)  # noqa
 
 
 def httpx_teleapi_factory_async(
     bot_token: str,
     telegram_api: str = "https://api.telegram.org/",
     timeout: int = 60,
+    **options,
 ) -> TeleapiAsync:
-    return TeleProxyAsync(HttpxTeleTransport(bot_token, telegram_api, timeout))  # noqa
+    """
+    :param options: options of TeleProxyAsync, i.e. retry, metrics, tracer
+    """
+    transport = HttpxTeleTransport(bot_token, telegram_api, timeout, tracer=options.get("tracer"))
+    return TeleapiClientAsync(transport, **options)  # noqa
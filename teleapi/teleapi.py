@@ -1,6 +1,7 @@
-from typing import Any, List, Optional, Protocol, Union
+from typing import Any, List, Literal, Optional, Protocol, Union
 
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated
 
 
 class Update(BaseModel):
@@ -991,7 +992,7 @@ class MessageOriginUser(BaseModel):
     The message was originally sent by a known user.
     """
 
-    type: str
+    type: Literal["user"]
     """ Type of the message origin, always “user” """
 
     date: int
@@ -1006,7 +1007,7 @@ class MessageOriginHiddenUser(BaseModel):
     The message was originally sent by an unknown user.
     """
 
-    type: str
+    type: Literal["hidden_user"]
     """ Type of the message origin, always “hidden_user” """
 
     date: int
@@ -1021,7 +1022,7 @@ class MessageOriginChat(BaseModel):
     The message was originally sent on behalf of a chat to a group chat.
     """
 
-    type: str
+    type: Literal["chat"]
     """ Type of the message origin, always “chat” """
 
     date: int
@@ -1040,7 +1041,7 @@ class MessageOriginChannel(BaseModel):
     The message was originally sent to a channel chat.
     """
 
-    type: str
+    type: Literal["channel"]
     """ Type of the message origin, always “channel” """
 
     date: int
@@ -1330,7 +1331,7 @@ class PaidMediaPreview(BaseModel):
     The paid media isn't available before the payment.
     """
 
-    type: str
+    type: Literal["preview"]
     """ Type of the paid media, always “preview” """
 
     width: Optional[int] = None
@@ -1348,7 +1349,7 @@ class PaidMediaPhoto(BaseModel):
     The paid media is a photo.
     """
 
-    type: str
+    type: Literal["photo"]
     """ Type of the paid media, always “photo” """
 
     photo: List['PhotoSize']
@@ -1360,7 +1361,7 @@ class PaidMediaVideo(BaseModel):
     The paid media is a video.
     """
 
-    type: str
+    type: Literal["video"]
     """ Type of the paid media, always “video” """
 
     video: 'Video'
@@ -1627,7 +1628,7 @@ class BackgroundFillSolid(BaseModel):
     The background is filled using the selected color.
     """
 
-    type: str
+    type: Literal["solid"]
     """ Type of the background fill, always “solid” """
 
     color: int
@@ -1639,7 +1640,7 @@ class BackgroundFillGradient(BaseModel):
     The background is a gradient fill.
     """
 
-    type: str
+    type: Literal["gradient"]
     """ Type of the background fill, always “gradient” """
 
     top_color: int
@@ -1658,7 +1659,7 @@ class BackgroundFillFreeformGradient(BaseModel):
     in the chat.
     """
 
-    type: str
+    type: Literal["freeform_gradient"]
     """ Type of the background fill, always “freeform_gradient” """
 
     colors: List[int]
@@ -1671,7 +1672,7 @@ class BackgroundTypeFill(BaseModel):
     The background is automatically filled based on the selected colors.
     """
 
-    type: str
+    type: Literal["fill"]
     """ Type of the background, always “fill” """
 
     fill: 'BackgroundFill'
@@ -1686,7 +1687,7 @@ class BackgroundTypeWallpaper(BaseModel):
     The background is a wallpaper in the JPEG format.
     """
 
-    type: str
+    type: Literal["wallpaper"]
     """ Type of the background, always “wallpaper” """
 
     document: 'Document'
@@ -1711,7 +1712,7 @@ class BackgroundTypePattern(BaseModel):
     background fill chosen by the user.
     """
 
-    type: str
+    type: Literal["pattern"]
     """ Type of the background, always “pattern” """
 
     document: 'Document'
@@ -1739,7 +1740,7 @@ class BackgroundTypeChatTheme(BaseModel):
     The background is taken directly from a built-in chat theme.
     """
 
-    type: str
+    type: Literal["chat_theme"]
     """ Type of the background, always “chat_theme” """
 
     theme_name: str
@@ -2759,7 +2760,7 @@ class ChatMemberOwner(BaseModel):
     privileges.
     """
 
-    status: str
+    status: Literal["creator"]
     """ The member's status in the chat, always “creator” """
 
     user: 'User'
@@ -2777,7 +2778,7 @@ class ChatMemberAdministrator(BaseModel):
     Represents a chat member that has some additional privileges.
     """
 
-    status: str
+    status: Literal["administrator"]
     """ The member's status in the chat, always “administrator” """
 
     user: 'User'
@@ -2855,7 +2856,7 @@ class ChatMemberMember(BaseModel):
     restrictions.
     """
 
-    status: str
+    status: Literal["member"]
     """ The member's status in the chat, always “member” """
 
     user: 'User'
@@ -2871,7 +2872,7 @@ class ChatMemberRestricted(BaseModel):
     chat. Supergroups only.
     """
 
-    status: str
+    status: Literal["restricted"]
     """ The member's status in the chat, always “restricted” """
 
     user: 'User'
@@ -2937,7 +2938,7 @@ class ChatMemberLeft(BaseModel):
     but may join it themselves.
     """
 
-    status: str
+    status: Literal["left"]
     """ The member's status in the chat, always “left” """
 
     user: 'User'
@@ -2950,7 +2951,7 @@ class ChatMemberBanned(BaseModel):
     to the chat or view chat messages.
     """
 
-    status: str
+    status: Literal["kicked"]
     """ The member's status in the chat, always “kicked” """
 
     user: 'User'
@@ -3138,7 +3139,7 @@ class ReactionTypeEmoji(BaseModel):
     The reaction is based on an emoji.
     """
 
-    type: str
+    type: Literal["emoji"]
     """ Type of the reaction, always “emoji” """
 
     emoji: str
@@ -3157,7 +3158,7 @@ class ReactionTypeCustomEmoji(BaseModel):
     The reaction is based on a custom emoji.
     """
 
-    type: str
+    type: Literal["custom_emoji"]
     """ Type of the reaction, always “custom_emoji” """
 
     custom_emoji_id: str
@@ -3169,7 +3170,7 @@ class ReactionTypePaid(BaseModel):
     The reaction is paid.
     """
 
-    type: str
+    type: Literal["paid"]
     """ Type of the reaction, always “paid” """
 
 
@@ -3273,7 +3274,7 @@ class BotCommandScopeDefault(BaseModel):
     used if no commands with a narrower scope are specified for the user.
     """
 
-    type: str
+    type: Literal["default"]
     """ Scope type, must be default """
 
 
@@ -3282,7 +3283,7 @@ class BotCommandScopeAllPrivateChats(BaseModel):
     Represents the scope of bot commands, covering all private chats.
     """
 
-    type: str
+    type: Literal["all_private_chats"]
     """ Scope type, must be all_private_chats """
 
 
@@ -3292,7 +3293,7 @@ class BotCommandScopeAllGroupChats(BaseModel):
     supergroup chats.
     """
 
-    type: str
+    type: Literal["all_group_chats"]
     """ Scope type, must be all_group_chats """
 
 
@@ -3302,7 +3303,7 @@ class BotCommandScopeAllChatAdministrators(BaseModel):
     supergroup chat administrators.
     """
 
-    type: str
+    type: Literal["all_chat_administrators"]
     """ Scope type, must be all_chat_administrators """
 
 
@@ -3311,7 +3312,7 @@ class BotCommandScopeChat(BaseModel):
     Represents the scope of bot commands, covering a specific chat.
     """
 
-    type: str
+    type: Literal["chat"]
     """ Scope type, must be chat """
 
     chat_id: Union[int, str]
@@ -3325,7 +3326,7 @@ class BotCommandScopeChatAdministrators(BaseModel):
     specific group or supergroup chat.
     """
 
-    type: str
+    type: Literal["chat_administrators"]
     """ Scope type, must be chat_administrators """
 
     chat_id: Union[int, str]
@@ -3339,7 +3340,7 @@ class BotCommandScopeChatMember(BaseModel):
     group or supergroup chat.
     """
 
-    type: str
+    type: Literal["chat_member"]
     """ Scope type, must be chat_member """
 
     chat_id: Union[int, str]
@@ -3382,7 +3383,7 @@ class MenuButtonCommands(BaseModel):
     Represents a menu button, which opens the bot's list of commands.
     """
 
-    type: str
+    type: Literal["commands"]
     """ Type of the button, must be commands """
 
 
@@ -3391,7 +3392,7 @@ class MenuButtonWebApp(BaseModel):
     Represents a menu button, which launches a Web App.
     """
 
-    type: str
+    type: Literal["web_app"]
     """ Type of the button, must be web_app """
 
     text: str
@@ -3411,7 +3412,7 @@ class MenuButtonDefault(BaseModel):
     Describes that no specific value for the menu button was set.
     """
 
-    type: str
+    type: Literal["default"]
     """ Type of the button, must be default """
 
 
@@ -3421,7 +3422,7 @@ class ChatBoostSourcePremium(BaseModel):
     gifting a Telegram Premium subscription to another user.
     """
 
-    source: str
+    source: Literal["premium"]
     """ Source of the boost, always “premium” """
 
     user: 'User'
@@ -3435,7 +3436,7 @@ class ChatBoostSourceGiftCode(BaseModel):
     duration of the corresponding Telegram Premium subscription.
     """
 
-    source: str
+    source: Literal["gift_code"]
     """ Source of the boost, always “gift_code” """
 
     user: 'User'
@@ -3451,7 +3452,7 @@ class ChatBoostSourceGiveaway(BaseModel):
     Telegram Star giveaways.
     """
 
-    source: str
+    source: Literal["giveaway"]
     """ Source of the boost, always “giveaway” """
 
     giveaway_message_id: int
@@ -3602,7 +3603,7 @@ class InputMediaPhoto(BaseModel):
     Represents a photo to be sent.
     """
 
-    type: str
+    type: Literal["photo"]
     """ Type of the result, must be photo """
 
     media: str
@@ -3638,7 +3639,7 @@ class InputMediaVideo(BaseModel):
     Represents a video to be sent.
     """
 
-    type: str
+    type: Literal["video"]
     """ Type of the result, must be video """
 
     media: str
@@ -3708,7 +3709,7 @@ class InputMediaAnimation(BaseModel):
     sound) to be sent.
     """
 
-    type: str
+    type: Literal["animation"]
     """ Type of the result, must be animation """
 
     media: str
@@ -3763,7 +3764,7 @@ class InputMediaAudio(BaseModel):
     Represents an audio file to be treated as music to be sent.
     """
 
-    type: str
+    type: Literal["audio"]
     """ Type of the result, must be audio """
 
     media: str
@@ -3810,7 +3811,7 @@ class InputMediaDocument(BaseModel):
     Represents a general file to be sent.
     """
 
-    type: str
+    type: Literal["document"]
     """ Type of the result, must be document """
 
     media: str
@@ -3853,7 +3854,7 @@ class InputPaidMediaPhoto(BaseModel):
     The paid media to send is a photo.
     """
 
-    type: str
+    type: Literal["photo"]
     """ Type of the media, must be photo """
 
     media: str
@@ -3869,7 +3870,7 @@ class InputPaidMediaVideo(BaseModel):
     The paid media to send is a video.
     """
 
-    type: str
+    type: Literal["video"]
     """ Type of the media, must be video """
 
     media: str
@@ -4151,7 +4152,7 @@ class InlineQueryResultArticle(BaseModel):
     Represents a link to an article or web page.
     """
 
-    type: str
+    type: Literal["article"]
     """ Type of the result, must be article """
 
     id: str
@@ -4190,7 +4191,7 @@ class InlineQueryResultPhoto(BaseModel):
     instead of the photo.
     """
 
-    type: str
+    type: Literal["photo"]
     """ Type of the result, must be photo """
 
     id: str
@@ -4246,7 +4247,7 @@ class InlineQueryResultGif(BaseModel):
     with the specified content instead of the animation.
     """
 
-    type: str
+    type: Literal["gif"]
     """ Type of the result, must be gif """
 
     id: str
@@ -4308,7 +4309,7 @@ class InlineQueryResultMpeg4Gif(BaseModel):
     instead of the animation.
     """
 
-    type: str
+    type: Literal["mpeg4_gif"]
     """ Type of the result, must be mpeg4_gif """
 
     id: str
@@ -4369,7 +4370,7 @@ class InlineQueryResultVideo(BaseModel):
     to send a message with the specified content instead of the video.
     """
 
-    type: str
+    type: Literal["video"]
     """ Type of the result, must be video """
 
     id: str
@@ -4432,7 +4433,7 @@ class InlineQueryResultAudio(BaseModel):
     instead of the audio.
     """
 
-    type: str
+    type: Literal["audio"]
     """ Type of the result, must be audio """
 
     id: str
@@ -4476,7 +4477,7 @@ class InlineQueryResultVoice(BaseModel):
     with the specified content instead of the the voice message.
     """
 
-    type: str
+    type: Literal["voice"]
     """ Type of the result, must be voice """
 
     id: str
@@ -4519,7 +4520,7 @@ class InlineQueryResultDocument(BaseModel):
     using this method.
     """
 
-    type: str
+    type: Literal["document"]
     """ Type of the result, must be document """
 
     id: str
@@ -4573,7 +4574,7 @@ class InlineQueryResultLocation(BaseModel):
     a message with the specified content instead of the location.
     """
 
-    type: str
+    type: Literal["location"]
     """ Type of the result, must be location """
 
     id: str
@@ -4629,7 +4630,7 @@ class InlineQueryResultVenue(BaseModel):
     with the specified content instead of the venue.
     """
 
-    type: str
+    type: Literal["venue"]
     """ Type of the result, must be venue """
 
     id: str
@@ -4685,7 +4686,7 @@ class InlineQueryResultContact(BaseModel):
     instead of the contact.
     """
 
-    type: str
+    type: Literal["contact"]
     """ Type of the result, must be contact """
 
     id: str
@@ -4725,7 +4726,7 @@ class InlineQueryResultGame(BaseModel):
     Represents a Game.
     """
 
-    type: str
+    type: Literal["game"]
     """ Type of the result, must be game """
 
     id: str
@@ -4746,7 +4747,7 @@ class InlineQueryResultCachedPhoto(BaseModel):
     with the specified content instead of the photo.
     """
 
-    type: str
+    type: Literal["photo"]
     """ Type of the result, must be photo """
 
     id: str
@@ -4793,7 +4794,7 @@ class InlineQueryResultCachedGif(BaseModel):
     of the animation.
     """
 
-    type: str
+    type: Literal["gif"]
     """ Type of the result, must be gif """
 
     id: str
@@ -4838,7 +4839,7 @@ class InlineQueryResultCachedMpeg4Gif(BaseModel):
     with the specified content instead of the animation.
     """
 
-    type: str
+    type: Literal["mpeg4_gif"]
     """ Type of the result, must be mpeg4_gif """
 
     id: str
@@ -4882,7 +4883,7 @@ class InlineQueryResultCachedSticker(BaseModel):
     instead of the sticker.
     """
 
-    type: str
+    type: Literal["sticker"]
     """ Type of the result, must be sticker """
 
     id: str
@@ -4906,7 +4907,7 @@ class InlineQueryResultCachedDocument(BaseModel):
     with the specified content instead of the file.
     """
 
-    type: str
+    type: Literal["document"]
     """ Type of the result, must be document """
 
     id: str
@@ -4948,7 +4949,7 @@ class InlineQueryResultCachedVideo(BaseModel):
     message with the specified content instead of the video.
     """
 
-    type: str
+    type: Literal["video"]
     """ Type of the result, must be video """
 
     id: str
@@ -4994,7 +4995,7 @@ class InlineQueryResultCachedVoice(BaseModel):
     with the specified content instead of the voice message.
     """
 
-    type: str
+    type: Literal["voice"]
     """ Type of the result, must be voice """
 
     id: str
@@ -5033,7 +5034,7 @@ class InlineQueryResultCachedAudio(BaseModel):
     content instead of the audio.
     """
 
-    type: str
+    type: Literal["audio"]
     """ Type of the result, must be audio """
 
     id: str
@@ -5542,7 +5543,7 @@ class RevenueWithdrawalStatePending(BaseModel):
     The withdrawal is in progress.
     """
 
-    type: str
+    type: Literal["pending"]
     """ Type of the state, always “pending” """
 
 
@@ -5551,7 +5552,7 @@ class RevenueWithdrawalStateSucceeded(BaseModel):
     The withdrawal succeeded.
     """
 
-    type: str
+    type: Literal["succeeded"]
     """ Type of the state, always “succeeded” """
 
     date: int
@@ -5566,7 +5567,7 @@ class RevenueWithdrawalStateFailed(BaseModel):
     The withdrawal failed and the transaction was refunded.
     """
 
-    type: str
+    type: Literal["failed"]
     """ Type of the state, always “failed” """
 
 
@@ -5603,7 +5604,7 @@ class TransactionPartnerUser(BaseModel):
     Describes a transaction with a user.
     """
 
-    type: str
+    type: Literal["user"]
     """ Type of the transaction partner, always “user” """
 
     user: 'User'
@@ -5634,7 +5635,7 @@ class TransactionPartnerChat(BaseModel):
     Describes a transaction with a chat.
     """
 
-    type: str
+    type: Literal["chat"]
     """ Type of the transaction partner, always “chat” """
 
     chat: 'Chat'
@@ -5650,7 +5651,7 @@ class TransactionPartnerAffiliateProgram(BaseModel):
     received via this transaction.
     """
 
-    type: str
+    type: Literal["affiliate_program"]
     """ Type of the transaction partner, always “affiliate_program” """
 
     commission_per_mille: int
@@ -5668,7 +5669,7 @@ class TransactionPartnerFragment(BaseModel):
     Describes a withdrawal transaction with Fragment.
     """
 
-    type: str
+    type: Literal["fragment"]
     """ Type of the transaction partner, always “fragment” """
 
     withdrawal_state: Optional['RevenueWithdrawalState'] = None
@@ -5680,7 +5681,7 @@ class TransactionPartnerTelegramAds(BaseModel):
     Describes a withdrawal transaction to the Telegram Ads platform.
     """
 
-    type: str
+    type: Literal["telegram_ads"]
     """ Type of the transaction partner, always “telegram_ads” """
 
 
@@ -5689,7 +5690,7 @@ class TransactionPartnerTelegramApi(BaseModel):
     Describes a transaction with payment for paid broadcasting.
     """
 
-    type: str
+    type: Literal["telegram_api"]
     """ Type of the transaction partner, always “telegram_api” """
 
     request_count: int
@@ -5702,7 +5703,7 @@ class TransactionPartnerOther(BaseModel):
     Describes a transaction with an unknown source or recipient.
     """
 
-    type: str
+    type: Literal["other"]
     """ Type of the transaction partner, always “other” """
 
 
@@ -5880,7 +5881,7 @@ class PassportElementErrorDataField(BaseModel):
     user. The error is considered resolved when the field's value changes.
     """
 
-    source: str
+    source: Literal["data"]
     """ Error source, must be data """
 
     type: str
@@ -5905,7 +5906,7 @@ class PassportElementErrorFrontSide(BaseModel):
     changes.
     """
 
-    source: str
+    source: Literal["front_side"]
     """ Error source, must be front_side """
 
     type: str
@@ -5926,7 +5927,7 @@ class PassportElementErrorReverseSide(BaseModel):
     changes.
     """
 
-    source: str
+    source: Literal["reverse_side"]
     """ Error source, must be reverse_side """
 
     type: str
@@ -5946,7 +5947,7 @@ class PassportElementErrorSelfie(BaseModel):
     considered resolved when the file with the selfie changes.
     """
 
-    source: str
+    source: Literal["selfie"]
     """ Error source, must be selfie """
 
     type: str
@@ -5966,7 +5967,7 @@ class PassportElementErrorFile(BaseModel):
     resolved when the file with the document scan changes.
     """
 
-    source: str
+    source: Literal["file"]
     """ Error source, must be file """
 
     type: str
@@ -5987,7 +5988,7 @@ class PassportElementErrorFiles(BaseModel):
     resolved when the list of files containing the scans changes.
     """
 
-    source: str
+    source: Literal["files"]
     """ Error source, must be files """
 
     type: str
@@ -6009,7 +6010,7 @@ class PassportElementErrorTranslationFile(BaseModel):
     file changes.
     """
 
-    source: str
+    source: Literal["translation_file"]
     """ Error source, must be translation_file """
 
     type: str
@@ -6032,7 +6033,7 @@ class PassportElementErrorTranslationFiles(BaseModel):
     change.
     """
 
-    source: str
+    source: Literal["translation_files"]
     """ Error source, must be translation_files """
 
     type: str
@@ -6054,7 +6055,7 @@ class PassportElementErrorUnspecified(BaseModel):
     resolved when new data is added.
     """
 
-    source: str
+    source: Literal["unspecified"]
     """ Error source, must be unspecified """
 
     type: str
@@ -6132,118 +6133,151 @@ MaybeInaccessibleMessage = Union[
 """
 This object describes the origin of a message. It can be one of
 """
-MessageOrigin = Union[
-    MessageOriginUser,
-    MessageOriginHiddenUser,
-    MessageOriginChat,
-    MessageOriginChannel,
+MessageOrigin = Annotated[
+    Union[
+        MessageOriginUser,
+        MessageOriginHiddenUser,
+        MessageOriginChat,
+        MessageOriginChannel,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object describes paid media. Currently, it can be one of
 """
-PaidMedia = Union[
-    PaidMediaPreview,
-    PaidMediaPhoto,
-    PaidMediaVideo,
+PaidMedia = Annotated[
+    Union[
+        PaidMediaPreview,
+        PaidMediaPhoto,
+        PaidMediaVideo,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object describes the way a background is filled based on the
 selected colors. Currently, it can be one of
 """
-BackgroundFill = Union[
-    BackgroundFillSolid,
-    BackgroundFillGradient,
-    BackgroundFillFreeformGradient,
+BackgroundFill = Annotated[
+    Union[
+        BackgroundFillSolid,
+        BackgroundFillGradient,
+        BackgroundFillFreeformGradient,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object describes the type of a background. Currently, it can be
 one of
 """
-BackgroundType = Union[
-    BackgroundTypeFill,
-    BackgroundTypeWallpaper,
-    BackgroundTypePattern,
-    BackgroundTypeChatTheme,
+BackgroundType = Annotated[
+    Union[
+        BackgroundTypeFill,
+        BackgroundTypeWallpaper,
+        BackgroundTypePattern,
+        BackgroundTypeChatTheme,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object contains information about one member of a chat.
 Currently, the following 6 types of chat members are supported:
 """
-ChatMember = Union[
-    ChatMemberOwner,
-    ChatMemberAdministrator,
-    ChatMemberMember,
-    ChatMemberRestricted,
-    ChatMemberLeft,
-    ChatMemberBanned,
+ChatMember = Annotated[
+    Union[
+        ChatMemberOwner,
+        ChatMemberAdministrator,
+        ChatMemberMember,
+        ChatMemberRestricted,
+        ChatMemberLeft,
+        ChatMemberBanned,
+    ],
+    Field(discriminator="status"),
 ]
 
 """
 This object describes the type of a reaction. Currently, it can be one
 of
 """
-ReactionType = Union[
-    ReactionTypeEmoji,
-    ReactionTypeCustomEmoji,
-    ReactionTypePaid,
+ReactionType = Annotated[
+    Union[
+        ReactionTypeEmoji,
+        ReactionTypeCustomEmoji,
+        ReactionTypePaid,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object represents the scope to which bot commands are applied.
 Currently, the following 7 scopes are supported:
 """
-BotCommandScope = Union[
-    BotCommandScopeDefault,
-    BotCommandScopeAllPrivateChats,
-    BotCommandScopeAllGroupChats,
-    BotCommandScopeAllChatAdministrators,
-    BotCommandScopeChat,
-    BotCommandScopeChatAdministrators,
-    BotCommandScopeChatMember,
+BotCommandScope = Annotated[
+    Union[
+        BotCommandScopeDefault,
+        BotCommandScopeAllPrivateChats,
+        BotCommandScopeAllGroupChats,
+        BotCommandScopeAllChatAdministrators,
+        BotCommandScopeChat,
+        BotCommandScopeChatAdministrators,
+        BotCommandScopeChatMember,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object describes the bot's menu button in a private chat. It
 should be one of
 """
-MenuButton = Union[
-    MenuButtonCommands,
-    MenuButtonWebApp,
-    MenuButtonDefault,
+MenuButton = Annotated[
+    Union[
+        MenuButtonCommands,
+        MenuButtonWebApp,
+        MenuButtonDefault,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object describes the source of a chat boost. It can be one of
 """
-ChatBoostSource = Union[
-    ChatBoostSourcePremium,
-    ChatBoostSourceGiftCode,
-    ChatBoostSourceGiveaway,
+ChatBoostSource = Annotated[
+    Union[
+        ChatBoostSourcePremium,
+        ChatBoostSourceGiftCode,
+        ChatBoostSourceGiveaway,
+    ],
+    Field(discriminator="source"),
 ]
 
 """
 This object represents the content of a media message to be sent. It
 should be one of
 """
-InputMedia = Union[
-    InputMediaAnimation,
-    InputMediaDocument,
-    InputMediaAudio,
-    InputMediaPhoto,
-    InputMediaVideo,
+InputMedia = Annotated[
+    Union[
+        InputMediaAnimation,
+        InputMediaDocument,
+        InputMediaAudio,
+        InputMediaPhoto,
+        InputMediaVideo,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object describes the paid media to be sent. Currently, it can be
 one of
 """
-InputPaidMedia = Union[
-    InputPaidMediaPhoto,
-    InputPaidMediaVideo,
+InputPaidMedia = Annotated[
+    Union[
+        InputPaidMediaPhoto,
+        InputPaidMediaVideo,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
@@ -6290,24 +6324,30 @@ InputMessageContent = Union[
 This object describes the state of a revenue withdrawal operation.
 Currently, it can be one of
 """
-RevenueWithdrawalState = Union[
-    RevenueWithdrawalStatePending,
-    RevenueWithdrawalStateSucceeded,
-    RevenueWithdrawalStateFailed,
+RevenueWithdrawalState = Annotated[
+    Union[
+        RevenueWithdrawalStatePending,
+        RevenueWithdrawalStateSucceeded,
+        RevenueWithdrawalStateFailed,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
 This object describes the source of a transaction, or its recipient
 for outgoing transactions. Currently, it can be one of
 """
-TransactionPartner = Union[
-    TransactionPartnerUser,
-    TransactionPartnerChat,
-    TransactionPartnerAffiliateProgram,
-    TransactionPartnerFragment,
-    TransactionPartnerTelegramAds,
-    TransactionPartnerTelegramApi,
-    TransactionPartnerOther,
+TransactionPartner = Annotated[
+    Union[
+        TransactionPartnerUser,
+        TransactionPartnerChat,
+        TransactionPartnerAffiliateProgram,
+        TransactionPartnerFragment,
+        TransactionPartnerTelegramAds,
+        TransactionPartnerTelegramApi,
+        TransactionPartnerOther,
+    ],
+    Field(discriminator="type"),
 ]
 
 """
@@ -6315,16 +6355,19 @@ This object represents an error in the Telegram Passport element which
 was submitted that should be resolved by the user. It should be one
 of:
 """
-PassportElementError = Union[
-    PassportElementErrorDataField,
-    PassportElementErrorFrontSide,
-    PassportElementErrorReverseSide,
-    PassportElementErrorSelfie,
-    PassportElementErrorFile,
-    PassportElementErrorFiles,
-    PassportElementErrorTranslationFile,
-    PassportElementErrorTranslationFiles,
-    PassportElementErrorUnspecified,
+PassportElementError = Annotated[
+    Union[
+        PassportElementErrorDataField,
+        PassportElementErrorFrontSide,
+        PassportElementErrorReverseSide,
+        PassportElementErrorSelfie,
+        PassportElementErrorFile,
+        PassportElementErrorFiles,
+        PassportElementErrorTranslationFile,
+        PassportElementErrorTranslationFiles,
+        PassportElementErrorUnspecified,
+    ],
+    Field(discriminator="source"),
 ]
 
 """InputFile should be file-like object, supported only in api calls, not models"""
@@ -7641,7 +7684,7 @@ class Teleapi(Protocol):
             self,
             *,
             chat_id: Union[int, str],
-            media: List['InputMediaAudio, InputMediaDocument, InputMediaPhoto and InputMediaVideo'],
+            media: List[Union['InputMediaAudio', 'InputMediaDocument', 'InputMediaPhoto', 'InputMediaVideo']],
             business_connection_id: Optional[str] = None,
             message_thread_id: Optional[int] = None,
             disable_notification: Optional[bool] = None,
@@ -11305,7 +11348,7 @@ class TeleapiAsync(Protocol):
             self,
             *,
             chat_id: Union[int, str],
-            media: List['InputMediaAudio, InputMediaDocument, InputMediaPhoto and InputMediaVideo'],
+            media: List[Union['InputMediaAudio', 'InputMediaDocument', 'InputMediaPhoto', 'InputMediaVideo']],
             business_connection_id: Optional[str] = None,
             message_thread_id: Optional[int] = None,
             disable_notification: Optional[bool] = None,
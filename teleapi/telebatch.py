@@ -0,0 +1,137 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, NamedTuple, Optional, Union
+
+# Run many api calls with bounded concurrency. Calls are taken from (possibly
+# lazy and huge) iterable only when there is a free slot, so no more than
+# `concurrency` calls are in flight or waiting to be yielded at once.
+
+
+class Call(NamedTuple):
+    api_method_name: str
+    kwargs: Dict[str, Any]
+
+
+def call(api_method_name: str, **kwargs) -> Call:
+    return Call(api_method_name, kwargs)
+
+
+class BatchResult(NamedTuple):
+    index: int
+    call: Call
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _Window:
+    """Bookkeeping of calls in flight and results waiting to be yielded in order"""
+
+    def __init__(self, calls: Iterable[Union[Call, tuple]], concurrency: int, ordered: bool):
+        if concurrency < 1:
+            raise ValueError("concurrency should be positive")
+        self.calls = enumerate(calls)
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.exhausted = False
+        self.in_flight = 0
+        self.buffer: Dict[int, BatchResult] = {}
+        self.next_index = 0
+
+    def take(self) -> Iterator[tuple]:
+        while not self.exhausted and self.in_flight + len(self.buffer) < self.concurrency:
+            try:
+                i, c = next(self.calls)
+            except StopIteration:
+                self.exhausted = True
+                return
+            self.in_flight += 1
+            yield i, Call(*c)
+
+    def complete(self, r: BatchResult) -> Iterator[BatchResult]:
+        self.in_flight -= 1
+        if not self.ordered:
+            yield r
+            return
+        self.buffer[r.index] = r
+        while self.next_index in self.buffer:
+            yield self.buffer.pop(self.next_index)
+            self.next_index += 1
+
+
+def _run(proxy, i: int, c: Call) -> BatchResult:
+    try:
+        return BatchResult(i, c, getattr(proxy, c.api_method_name)(**c.kwargs))
+    except Exception as e:
+        return BatchResult(i, c, error=e)
+
+
+async def _run_async(proxy, i: int, c: Call) -> BatchResult:
+    try:
+        return BatchResult(i, c, await getattr(proxy, c.api_method_name)(**c.kwargs))
+    except Exception as e:
+        return BatchResult(i, c, error=e)
+
+
+def batch(
+    proxy,
+    calls: Iterable[Union[Call, tuple]],
+    concurrency: int = 8,
+    ordered: bool = False,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> Iterator[BatchResult]:
+    """
+    Run calls with sync proxy in thread pool, yield results as they complete,
+    or in order of calls if `ordered`. Errors are returned, not raised.
+    """
+    window = _Window(calls, concurrency, ordered)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(concurrency)
+
+    pending = set()
+    try:
+        while True:
+            for i, c in window.take():
+                pending.add(executor.submit(_run, proxy, i, c))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield from window.complete(f.result())
+    finally:
+        for f in pending:
+            f.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+async def batch_async(
+    proxy,
+    calls: Iterable[Union[Call, tuple]],
+    concurrency: int = 8,
+    ordered: bool = False,
+) -> AsyncIterator[BatchResult]:
+    """
+    Run calls with async proxy concurrently, yield results as they complete,
+    or in order of calls if `ordered`. Errors are returned, not raised.
+    """
+    window = _Window(calls, concurrency, ordered)
+
+    pending = set()
+    try:
+        while True:
+            for i, c in window.take():
+                pending.add(asyncio.ensure_future(_run_async(proxy, i, c)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                for r in window.complete(t.result()):
+                    yield r
+    finally:
+        for t in pending:
+            t.cancel()
@@ -0,0 +1,291 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from math import inf
+from typing import Any, Callable, Deque, Iterable, Optional, Sequence, Set, Tuple, Union
+
+from teleapi.telebatch import Call
+from teleapi.teleproxy import TeleError
+
+# Broadcast of messages (sendMessage, copyMessage, forwardMessage, ...) to many recipients
+# within Telegram limits: about 30 messages per second overall, 1 message per second
+# to the same private chat and 20 messages per minute to the same group.
+# Recipients are served round-robin, messages to the same recipient are sent in order.
+# Flood control error (429) pauses all sending for its retry_after, not only to its recipient.
+
+ChatId = Union[int, str]
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1, now: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic() if now is None else now
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """Time to wait until token is available"""
+        self._refill(now)
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class BroadcastProgress:
+    def __init__(self, cursor: int = 0):
+        self.cursor = cursor
+        """ Recipients before cursor are done, pass it as `start` to resume broadcast """
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.recipients_done = 0
+
+    def __repr__(self):
+        return (
+            f"BroadcastProgress(cursor={self.cursor}, sent={self.sent}, failed={self.failed}, "
+            f"retried={self.retried}, recipients_done={self.recipients_done})"
+        )
+
+
+class _Recipient:
+    __slots__ = ("index", "chat_id", "step", "bucket", "not_before")
+
+    def __init__(self, index: int, chat_id: ChatId, bucket: TokenBucket):
+        self.index = index
+        self.chat_id = chat_id
+        self.step = 0
+        self.bucket = bucket
+        self.not_before = 0.0
+
+
+def _is_private(chat_id: ChatId) -> bool:
+    return isinstance(chat_id, int) and chat_id > 0
+
+
+def _retry_after(e: TeleError) -> float:
+    return e.retry_after if e.retry_after is not None else 1.0
+
+
+class BroadcastScheduler:
+    """
+    Non-blocking state machine, which decides what to send next,
+    drivers (see broadcast() and broadcast_async()) do actual sending.
+    """
+
+    def __init__(
+        self,
+        recipients: Iterable[ChatId],
+        messages: Sequence[Union[Call, tuple]],
+        start: int = 0,
+        window: int = 1000,
+        rate: float = 30,
+        private_rate: float = 1,
+        group_rate: float = 20 / 60,
+        group_burst: float = 20,
+    ):
+        self.recipients = enumerate(islice(recipients, start, None), start)
+        self.messages = [Call(*m) for m in messages]
+        self.window = window
+        self.private_rate = private_rate
+        self.group_rate = group_rate
+        self.group_burst = group_burst
+        self.bucket = TokenBucket(rate)
+        self.not_before = 0.0
+        self.exhausted = False
+        self.active = 0
+        self.ready: Deque[_Recipient] = deque()
+        self.done: Set[int] = set()
+        self.progress = BroadcastProgress(start)
+
+    def _admit(self, now: float):
+        while not self.exhausted and self.active < self.window:
+            try:
+                i, chat_id = next(self.recipients)
+            except StopIteration:
+                self.exhausted = True
+                return
+            if _is_private(chat_id):
+                bucket = TokenBucket(self.private_rate, now=now)
+            else:
+                bucket = TokenBucket(self.group_rate, self.group_burst, now=now)
+            self.active += 1
+            self.ready.append(_Recipient(i, chat_id, bucket))
+
+    def poll(self, now: float) -> Union[Tuple[_Recipient, Call], float, None]:
+        """
+        Recipient and message to send now, or time to wait until next send
+        (inf if waiting for sends in flight), or None if broadcast is finished.
+        """
+        self._admit(now)
+        if not self.messages and self.ready:
+            while self.ready:
+                self._finish(self.ready.popleft())
+
+        delay = max(self.bucket.delay(now), self.not_before - now)
+        if delay > 0:
+            return delay if self.ready else (inf if self.active else None)
+
+        delay = inf
+        for _ in range(len(self.ready)):
+            r = self.ready.popleft()
+            d = max(r.bucket.delay(now), r.not_before - now)
+            if d <= 0:
+                self.bucket.take(now)
+                r.bucket.take(now)
+                return r, self.messages[r.step]
+            self.ready.append(r)
+            delay = min(delay, d)
+
+        return delay if self.active else None
+
+    def complete(self, r: _Recipient, now: float, error: Optional[BaseException] = None):
+        if error is None:
+            self.progress.sent += 1
+            r.step += 1
+            if r.step < len(self.messages):
+                self.ready.append(r)
+            else:
+                self._finish(r)
+        elif isinstance(error, TeleError) and error.error_code == 429:
+            self.progress.retried += 1
+            r.not_before = now + _retry_after(error)
+            # flood control applies to the bot as a whole
+            self.not_before = max(self.not_before, r.not_before)
+            self.ready.append(r)
+        else:
+            # i.e. bot is blocked by user, nothing to send to this recipient anymore
+            self.progress.failed += 1
+            self._finish(r)
+
+    def _finish(self, r: _Recipient):
+        self.active -= 1
+        self.progress.recipients_done += 1
+        self.done.add(r.index)
+        while self.progress.cursor in self.done:
+            self.done.remove(self.progress.cursor)
+            self.progress.cursor += 1
+
+
+OnProgress = Callable[[BroadcastProgress], Any]
+OnError = Callable[[ChatId, Call, BaseException], Any]
+
+
+def _send(proxy, r: _Recipient, c: Call) -> Tuple[_Recipient, Optional[BaseException]]:
+    try:
+        getattr(proxy, c.api_method_name)(chat_id=r.chat_id, **c.kwargs)
+        return r, None
+    except Exception as e:
+        return r, e
+
+
+async def _send_async(proxy, r: _Recipient, c: Call) -> Tuple[_Recipient, Optional[BaseException]]:
+    try:
+        await getattr(proxy, c.api_method_name)(chat_id=r.chat_id, **c.kwargs)
+        return r, None
+    except Exception as e:
+        return r, e
+
+
+def _complete(
+    scheduler: BroadcastScheduler,
+    r: _Recipient,
+    error: Optional[BaseException],
+    on_progress: Optional[OnProgress],
+    on_error: Optional[OnError],
+):
+    if error is not None and on_error is not None:
+        on_error(r.chat_id, scheduler.messages[r.step], error)
+    scheduler.complete(r, time.monotonic(), error)
+    if on_progress is not None:
+        on_progress(scheduler.progress)
+
+
+def broadcast(
+    proxy,
+    recipients: Iterable[ChatId],
+    messages: Sequence[Union[Call, tuple]],
+    *,
+    start: int = 0,
+    concurrency: int = 30,
+    on_progress: Optional[OnProgress] = None,
+    on_error: Optional[OnError] = None,
+    **limits,
+) -> BroadcastProgress:
+    """
+    Send messages, i.e. [("copyMessage", {"from_chat_id": 1, "message_id": 2})], to every recipient
+    with sync proxy in thread pool.
+
+    :param start: cursor of interrupted broadcast to resume from
+    :param limits: window, rate, private_rate, group_rate, group_burst of BroadcastScheduler
+    """
+    scheduler = BroadcastScheduler(recipients, messages, start, **limits)
+    pending = set()
+    with ThreadPoolExecutor(concurrency) as executor:
+        while True:
+            timeout = None
+            if len(pending) < concurrency:
+                item = scheduler.poll(time.monotonic())
+                if isinstance(item, tuple):
+                    pending.add(executor.submit(_send, proxy, *item))
+                    continue
+                if item is None and not pending:
+                    return scheduler.progress
+                timeout = None if item is None or item == inf else item
+
+            if pending:
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for f in done:
+                    _complete(scheduler, *f.result(), on_progress, on_error)
+            else:
+                time.sleep(timeout)
+
+
+async def broadcast_async(
+    proxy,
+    recipients: Iterable[ChatId],
+    messages: Sequence[Union[Call, tuple]],
+    *,
+    start: int = 0,
+    concurrency: int = 30,
+    on_progress: Optional[OnProgress] = None,
+    on_error: Optional[OnError] = None,
+    **limits,
+) -> BroadcastProgress:
+    """
+    Send messages, i.e. [("copyMessage", {"from_chat_id": 1, "message_id": 2})], to every recipient
+    with async proxy.
+
+    :param start: cursor of interrupted broadcast to resume from
+    :param limits: window, rate, private_rate, group_rate, group_burst of BroadcastScheduler
+    """
+    scheduler = BroadcastScheduler(recipients, messages, start, **limits)
+    pending = set()
+    try:
+        while True:
+            timeout = None
+            if len(pending) < concurrency:
+                item = scheduler.poll(time.monotonic())
+                if isinstance(item, tuple):
+                    pending.add(asyncio.ensure_future(_send_async(proxy, *item)))
+                    continue
+                if item is None and not pending:
+                    return scheduler.progress
+                timeout = None if item is None or item == inf else item
+
+            if pending:
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    _complete(scheduler, *t.result(), on_progress, on_error)
+            else:
+                await asyncio.sleep(timeout)
+    finally:
+        for t in pending:
+            t.cancel()
@@ -0,0 +1,180 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from teleapi.telecoalesce import call_key
+from teleapi.telemiddleware import ApiCall, Handler, HandlerAsync
+
+# LRU + TTL cache of results of read-only methods, as middleware.
+# Successful mutating calls evict cached results they may change,
+# i.e. setChatTitle evicts getChat of the same chat.
+
+# seconds to cache results of methods, other methods are not cached
+DEFAULT_TTL: Dict[str, float] = {
+    "getMe": 3600,
+    "getMyName": 3600,
+    "getMyDescription": 3600,
+    "getMyShortDescription": 3600,
+    "getMyCommands": 3600,
+    "getMyDefaultAdministratorRights": 3600,
+    "getChatMenuButton": 600,
+    "getChat": 60,
+    "getChatAdministrators": 60,
+    "getChatMember": 60,
+    "getChatMemberCount": 60,
+    "getStickerSet": 600,
+    "getCustomEmojiStickers": 3600,
+    "getForumTopicIconStickers": 3600,
+    "getFile": 1800,  # file_path is valid for at least 1 hour
+    "getBusinessConnection": 600,
+}
+
+_CHAT = ("getChat", "getChatAdministrators", "getChatMember", "getChatMemberCount")
+
+# mutating method: (evicted methods, param identifying affected entries or None for all entries)
+DEFAULT_INVALIDATES: Dict[str, Tuple[Tuple[str, ...], Optional[str]]] = {
+    "setChatTitle": (("getChat",), "chat_id"),
+    "setChatDescription": (("getChat",), "chat_id"),
+    "setChatPhoto": (("getChat",), "chat_id"),
+    "deleteChatPhoto": (("getChat",), "chat_id"),
+    "setChatPermissions": (("getChat",), "chat_id"),
+    "setChatStickerSet": (("getChat",), "chat_id"),
+    "deleteChatStickerSet": (("getChat",), "chat_id"),
+    "pinChatMessage": (("getChat",), "chat_id"),
+    "unpinChatMessage": (("getChat",), "chat_id"),
+    "unpinAllChatMessages": (("getChat",), "chat_id"),
+    "promoteChatMember": (("getChat", "getChatAdministrators", "getChatMember"), "chat_id"),
+    "setChatAdministratorCustomTitle": (("getChatAdministrators", "getChatMember"), "chat_id"),
+    "banChatMember": (_CHAT, "chat_id"),
+    "unbanChatMember": (_CHAT, "chat_id"),
+    "restrictChatMember": (("getChatMember",), "chat_id"),
+    "approveChatJoinRequest": (("getChatMemberCount",), "chat_id"),
+    "leaveChat": (_CHAT, "chat_id"),
+    "setChatMenuButton": (("getChatMenuButton",), None),
+    "setMyName": (("getMyName",), None),
+    "setMyDescription": (("getMyDescription",), None),
+    "setMyShortDescription": (("getMyShortDescription",), None),
+    "setMyCommands": (("getMyCommands",), None),
+    "deleteMyCommands": (("getMyCommands",), None),
+    "setMyDefaultAdministratorRights": (("getMyDefaultAdministratorRights",), None),
+    "addStickerToSet": (("getStickerSet",), "name"),
+    "setStickerPositionInSet": (("getStickerSet",), None),
+    "deleteStickerFromSet": (("getStickerSet",), None),
+    "replaceStickerInSet": (("getStickerSet",), "name"),
+    "setStickerSetTitle": (("getStickerSet",), "name"),
+    "setStickerSetThumbnail": (("getStickerSet",), "name"),
+    "setCustomEmojiStickerSetThumbnail": (("getStickerSet",), "name"),
+    "deleteStickerSet": (("getStickerSet",), "name"),
+}
+
+
+class ResultCache:
+    def __init__(
+        self,
+        ttl: Optional[Dict[str, float]] = None,
+        maxsize: int = 10000,
+        invalidates: Optional[Dict[str, Tuple[Tuple[str, ...], Optional[str]]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self.maxsize = maxsize
+        self.invalidates = DEFAULT_INVALIDATES if invalidates is None else invalidates
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, ApiCall]]" = OrderedDict()
+        self._lock = Lock()
+
+    def cached(self, call: ApiCall) -> bool:
+        return not call.files and call.api_method_name in self.ttl
+
+    def get(self, call: ApiCall) -> Tuple[bool, Any]:
+        key = call_key(call)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, call: ApiCall, result: Any):
+        key = call_key(call)
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl[call.api_method_name], result, call)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, call: ApiCall):
+        try:
+            methods, param = self.invalidates[call.api_method_name]
+        except KeyError:
+            return
+        value = call.params.get(param) if param is not None else None
+        with self._lock:
+            evicted = [
+                k
+                for k, (_, _, c) in self._entries.items()
+                if c.api_method_name in methods and (param is None or c.params.get(param) == value)
+            ]
+            for k in evicted:
+                del self._entries[k]
+            self.invalidations += len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class Cache:
+    """Caching middleware for TeleProxy, cache with stats is available as `cache` attribute"""
+
+    def __init__(self, cache: Optional[ResultCache] = None):
+        self.cache = ResultCache() if cache is None else cache
+
+    def __call__(self, call: ApiCall, call_next: Handler):
+        cache = self.cache
+        if not cache.cached(call):
+            result = call_next(call)
+            cache.invalidate(call)
+            return result
+
+        hit, result = cache.get(call)
+        if not hit:
+            result = call_next(call)
+            cache.put(call, result)
+        return result
+
+
+class CacheAsync(Cache):
+    """Caching middleware for TeleProxyAsync, cache with stats is available as `cache` attribute"""
+
+    async def __call__(self, call: ApiCall, call_next: HandlerAsync):
+        cache = self.cache
+        if not cache.cached(call):
+            result = await call_next(call)
+            cache.invalidate(call)
+            return result
+
+        hit, result = cache.get(call)
+        if not hit:
+            result = await call_next(call)
+            cache.put(call, result)
+        return result
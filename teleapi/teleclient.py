@@ -0,0 +1,5926 @@
+from typing import Any, List, Optional, Union
+
+from teleapi.teleapi import (
+    BotCommand,
+    BotCommandScope,
+    BotDescription,
+    BotName,
+    BotShortDescription,
+    BusinessConnection,
+    ChatAdministratorRights,
+    ChatFullInfo,
+    ChatInviteLink,
+    ChatMember,
+    ChatPermissions,
+    File,
+    ForceReply,
+    ForumTopic,
+    GameHighScore,
+    InlineKeyboardMarkup,
+    InlineQueryResult,
+    InlineQueryResultsButton,
+    InputFile,
+    InputMedia,
+    InputMediaAudio,
+    InputMediaDocument,
+    InputMediaPhoto,
+    InputMediaVideo,
+    InputPaidMedia,
+    InputPollOption,
+    InputSticker,
+    LabeledPrice,
+    LinkPreviewOptions,
+    MaskPosition,
+    MenuButton,
+    Message,
+    MessageEntity,
+    MessageId,
+    PassportElementError,
+    Poll,
+    PreparedInlineMessage,
+    ReactionType,
+    ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
+    ReplyParameters,
+    SentWebAppMessage,
+    ShippingOption,
+    StarTransactions,
+    Sticker,
+    StickerSet,
+    Update,
+    User,
+    UserChatBoosts,
+    UserProfilePhotos,
+    WebhookInfo,
+)
+from teleapi.teleproxy import TeleProxy, TeleProxyAsync, call_plans, drop_none
+
+
+class TeleapiClient(TeleProxy):
+    """
+    Concrete implementation of Teleapi methods with explicit signatures,
+    no attribute lookup magic on call. Files for InputMedia,
+    InputPaidMedia and InputSticker params can be passed as extra keyword
+    arguments and referred with attach://<name>.
+    """
+
+    def getUpdates(
+            self,
+            *,
+            offset: Optional[int] = None,
+            limit: Optional[int] = None,
+            timeout: Optional[int] = None,
+            allowed_updates: Optional[List[str]] = None,
+    ) -> List['Update']:
+        return self._call(
+            "getUpdates",
+            drop_none(
+                offset=offset,
+                limit=limit,
+                timeout=timeout,
+                allowed_updates=allowed_updates,
+            ),
+            None,
+            call_plans.getUpdates,
+        )
+
+    def setWebhook(
+            self,
+            *,
+            url: str,
+            certificate: Optional['InputFile'] = None,
+            ip_address: Optional[str] = None,
+            max_connections: Optional[int] = None,
+            allowed_updates: Optional[List[str]] = None,
+            drop_pending_updates: Optional[bool] = None,
+            secret_token: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "setWebhook",
+            drop_none(
+                url=url,
+                ip_address=ip_address,
+                max_connections=max_connections,
+                allowed_updates=allowed_updates,
+                drop_pending_updates=drop_pending_updates,
+                secret_token=secret_token,
+            ),
+            drop_none(
+                certificate=certificate,
+            ),
+            call_plans.setWebhook,
+        )
+
+    def deleteWebhook(
+            self,
+            *,
+            drop_pending_updates: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "deleteWebhook",
+            drop_none(
+                drop_pending_updates=drop_pending_updates,
+            ),
+            None,
+            call_plans.deleteWebhook,
+        )
+
+    def getWebhookInfo(
+            self,
+    ) -> 'WebhookInfo':
+        return self._call(
+            "getWebhookInfo",
+            drop_none(
+            ),
+            None,
+            call_plans.getWebhookInfo,
+        )
+
+    def getMe(
+            self,
+    ) -> 'User':
+        return self._call(
+            "getMe",
+            drop_none(
+            ),
+            None,
+            call_plans.getMe,
+        )
+
+    def logOut(
+            self,
+    ) -> bool:
+        return self._call(
+            "logOut",
+            drop_none(
+            ),
+            None,
+            call_plans.logOut,
+        )
+
+    def close(
+            self,
+    ) -> bool:
+        return self._call(
+            "close",
+            drop_none(
+            ),
+            None,
+            call_plans.close,
+        )
+
+    def sendMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            text: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            parse_mode: Optional[str] = None,
+            entities: Optional[List['MessageEntity']] = None,
+            link_preview_options: Optional['LinkPreviewOptions'] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendMessage",
+            drop_none(
+                chat_id=chat_id,
+                text=text,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                parse_mode=parse_mode,
+                entities=entities,
+                link_preview_options=link_preview_options,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendMessage,
+        )
+
+    def forwardMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_id: int,
+            message_thread_id: Optional[int] = None,
+            video_start_timestamp: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+    ) -> 'Message':
+        return self._call(
+            "forwardMessage",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_id=message_id,
+                message_thread_id=message_thread_id,
+                video_start_timestamp=video_start_timestamp,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+            ),
+            None,
+            call_plans.forwardMessage,
+        )
+
+    def forwardMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_ids: List[int],
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+    ) -> List['MessageId']:
+        return self._call(
+            "forwardMessages",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_ids=message_ids,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+            ),
+            None,
+            call_plans.forwardMessages,
+        )
+
+    def copyMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_id: int,
+            message_thread_id: Optional[int] = None,
+            video_start_timestamp: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'MessageId':
+        return self._call(
+            "copyMessage",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_id=message_id,
+                message_thread_id=message_thread_id,
+                video_start_timestamp=video_start_timestamp,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.copyMessage,
+        )
+
+    def copyMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_ids: List[int],
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            remove_caption: Optional[bool] = None,
+    ) -> List['MessageId']:
+        return self._call(
+            "copyMessages",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_ids=message_ids,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                remove_caption=remove_caption,
+            ),
+            None,
+            call_plans.copyMessages,
+        )
+
+    def sendPhoto(
+            self,
+            *,
+            chat_id: Union[int, str],
+            photo: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            has_spoiler: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendPhoto",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                has_spoiler=has_spoiler,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                photo=photo,
+            ),
+            call_plans.sendPhoto,
+        )
+
+    def sendAudio(
+            self,
+            *,
+            chat_id: Union[int, str],
+            audio: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            duration: Optional[int] = None,
+            performer: Optional[str] = None,
+            title: Optional[str] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendAudio",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                duration=duration,
+                performer=performer,
+                title=title,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                audio=audio,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendAudio,
+        )
+
+    def sendDocument(
+            self,
+            *,
+            chat_id: Union[int, str],
+            document: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            disable_content_type_detection: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendDocument",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                disable_content_type_detection=disable_content_type_detection,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                document=document,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendDocument,
+        )
+
+    def sendVideo(
+            self,
+            *,
+            chat_id: Union[int, str],
+            video: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            duration: Optional[int] = None,
+            width: Optional[int] = None,
+            height: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            cover: Optional[Union['InputFile', str]] = None,
+            start_timestamp: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            has_spoiler: Optional[bool] = None,
+            supports_streaming: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendVideo",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                duration=duration,
+                width=width,
+                height=height,
+                start_timestamp=start_timestamp,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                has_spoiler=has_spoiler,
+                supports_streaming=supports_streaming,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                video=video,
+                thumbnail=thumbnail,
+                cover=cover,
+            ),
+            call_plans.sendVideo,
+        )
+
+    def sendAnimation(
+            self,
+            *,
+            chat_id: Union[int, str],
+            animation: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            duration: Optional[int] = None,
+            width: Optional[int] = None,
+            height: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            has_spoiler: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendAnimation",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                duration=duration,
+                width=width,
+                height=height,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                has_spoiler=has_spoiler,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                animation=animation,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendAnimation,
+        )
+
+    def sendVoice(
+            self,
+            *,
+            chat_id: Union[int, str],
+            voice: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            duration: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendVoice",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                duration=duration,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                voice=voice,
+            ),
+            call_plans.sendVoice,
+        )
+
+    def sendVideoNote(
+            self,
+            *,
+            chat_id: Union[int, str],
+            video_note: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            duration: Optional[int] = None,
+            length: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendVideoNote",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                duration=duration,
+                length=length,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                video_note=video_note,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendVideoNote,
+        )
+
+    def sendPaidMedia(
+            self,
+            *,
+            chat_id: Union[int, str],
+            star_count: int,
+            media: List['InputPaidMedia'],
+            business_connection_id: Optional[str] = None,
+            payload: Optional[str] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+            **attachments: 'InputFile',
+    ) -> 'Message':
+        return self._call(
+            "sendPaidMedia",
+            drop_none(
+                chat_id=chat_id,
+                star_count=star_count,
+                media=media,
+                business_connection_id=business_connection_id,
+                payload=payload,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.sendPaidMedia,
+        )
+
+    def sendMediaGroup(
+            self,
+            *,
+            chat_id: Union[int, str],
+            media: List[Union['InputMediaAudio', 'InputMediaDocument', 'InputMediaPhoto', 'InputMediaVideo']],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            **attachments: 'InputFile',
+    ) -> List['Message']:
+        return self._call(
+            "sendMediaGroup",
+            drop_none(
+                chat_id=chat_id,
+                media=media,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.sendMediaGroup,
+        )
+
+    def sendLocation(
+            self,
+            *,
+            chat_id: Union[int, str],
+            latitude: float,
+            longitude: float,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            horizontal_accuracy: Optional[float] = None,
+            live_period: Optional[int] = None,
+            heading: Optional[int] = None,
+            proximity_alert_radius: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendLocation",
+            drop_none(
+                chat_id=chat_id,
+                latitude=latitude,
+                longitude=longitude,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                horizontal_accuracy=horizontal_accuracy,
+                live_period=live_period,
+                heading=heading,
+                proximity_alert_radius=proximity_alert_radius,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendLocation,
+        )
+
+    def sendVenue(
+            self,
+            *,
+            chat_id: Union[int, str],
+            latitude: float,
+            longitude: float,
+            title: str,
+            address: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            foursquare_id: Optional[str] = None,
+            foursquare_type: Optional[str] = None,
+            google_place_id: Optional[str] = None,
+            google_place_type: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendVenue",
+            drop_none(
+                chat_id=chat_id,
+                latitude=latitude,
+                longitude=longitude,
+                title=title,
+                address=address,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                foursquare_id=foursquare_id,
+                foursquare_type=foursquare_type,
+                google_place_id=google_place_id,
+                google_place_type=google_place_type,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendVenue,
+        )
+
+    def sendContact(
+            self,
+            *,
+            chat_id: Union[int, str],
+            phone_number: str,
+            first_name: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            last_name: Optional[str] = None,
+            vcard: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendContact",
+            drop_none(
+                chat_id=chat_id,
+                phone_number=phone_number,
+                first_name=first_name,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                last_name=last_name,
+                vcard=vcard,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendContact,
+        )
+
+    def sendPoll(
+            self,
+            *,
+            chat_id: Union[int, str],
+            question: str,
+            options: List['InputPollOption'],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            question_parse_mode: Optional[str] = None,
+            question_entities: Optional[List['MessageEntity']] = None,
+            is_anonymous: Optional[bool] = None,
+            type: Optional[str] = None,  # noqa
+            allows_multiple_answers: Optional[bool] = None,
+            correct_option_id: Optional[int] = None,
+            explanation: Optional[str] = None,
+            explanation_parse_mode: Optional[str] = None,
+            explanation_entities: Optional[List['MessageEntity']] = None,
+            open_period: Optional[int] = None,
+            close_date: Optional[int] = None,
+            is_closed: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendPoll",
+            drop_none(
+                chat_id=chat_id,
+                question=question,
+                options=options,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                question_parse_mode=question_parse_mode,
+                question_entities=question_entities,
+                is_anonymous=is_anonymous,
+                type=type,
+                allows_multiple_answers=allows_multiple_answers,
+                correct_option_id=correct_option_id,
+                explanation=explanation,
+                explanation_parse_mode=explanation_parse_mode,
+                explanation_entities=explanation_entities,
+                open_period=open_period,
+                close_date=close_date,
+                is_closed=is_closed,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendPoll,
+        )
+
+    def sendDice(
+            self,
+            *,
+            chat_id: Union[int, str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            emoji: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendDice",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                emoji=emoji,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendDice,
+        )
+
+    def sendChatAction(
+            self,
+            *,
+            chat_id: Union[int, str],
+            action: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+    ) -> bool:
+        return self._call(
+            "sendChatAction",
+            drop_none(
+                chat_id=chat_id,
+                action=action,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.sendChatAction,
+        )
+
+    def setMessageReaction(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+            reaction: Optional[List['ReactionType']] = None,
+            is_big: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "setMessageReaction",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+                reaction=reaction,
+                is_big=is_big,
+            ),
+            None,
+            call_plans.setMessageReaction,
+        )
+
+    def getUserProfilePhotos(
+            self,
+            *,
+            user_id: int,
+            offset: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> 'UserProfilePhotos':
+        return self._call(
+            "getUserProfilePhotos",
+            drop_none(
+                user_id=user_id,
+                offset=offset,
+                limit=limit,
+            ),
+            None,
+            call_plans.getUserProfilePhotos,
+        )
+
+    def setUserEmojiStatus(
+            self,
+            *,
+            user_id: int,
+            emoji_status_custom_emoji_id: Optional[str] = None,
+            emoji_status_expiration_date: Optional[int] = None,
+    ) -> bool:
+        return self._call(
+            "setUserEmojiStatus",
+            drop_none(
+                user_id=user_id,
+                emoji_status_custom_emoji_id=emoji_status_custom_emoji_id,
+                emoji_status_expiration_date=emoji_status_expiration_date,
+            ),
+            None,
+            call_plans.setUserEmojiStatus,
+        )
+
+    def getFile(
+            self,
+            *,
+            file_id: str,
+    ) -> 'File':
+        return self._call(
+            "getFile",
+            drop_none(
+                file_id=file_id,
+            ),
+            None,
+            call_plans.getFile,
+        )
+
+    def banChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            until_date: Optional[int] = None,
+            revoke_messages: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "banChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                until_date=until_date,
+                revoke_messages=revoke_messages,
+            ),
+            None,
+            call_plans.banChatMember,
+        )
+
+    def unbanChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            only_if_banned: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "unbanChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                only_if_banned=only_if_banned,
+            ),
+            None,
+            call_plans.unbanChatMember,
+        )
+
+    def restrictChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            permissions: 'ChatPermissions',
+            use_independent_chat_permissions: Optional[bool] = None,
+            until_date: Optional[int] = None,
+    ) -> bool:
+        return self._call(
+            "restrictChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                permissions=permissions,
+                use_independent_chat_permissions=use_independent_chat_permissions,
+                until_date=until_date,
+            ),
+            None,
+            call_plans.restrictChatMember,
+        )
+
+    def promoteChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            is_anonymous: Optional[bool] = None,
+            can_manage_chat: Optional[bool] = None,
+            can_delete_messages: Optional[bool] = None,
+            can_manage_video_chats: Optional[bool] = None,
+            can_restrict_members: Optional[bool] = None,
+            can_promote_members: Optional[bool] = None,
+            can_change_info: Optional[bool] = None,
+            can_invite_users: Optional[bool] = None,
+            can_post_stories: Optional[bool] = None,
+            can_edit_stories: Optional[bool] = None,
+            can_delete_stories: Optional[bool] = None,
+            can_post_messages: Optional[bool] = None,
+            can_edit_messages: Optional[bool] = None,
+            can_pin_messages: Optional[bool] = None,
+            can_manage_topics: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "promoteChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                is_anonymous=is_anonymous,
+                can_manage_chat=can_manage_chat,
+                can_delete_messages=can_delete_messages,
+                can_manage_video_chats=can_manage_video_chats,
+                can_restrict_members=can_restrict_members,
+                can_promote_members=can_promote_members,
+                can_change_info=can_change_info,
+                can_invite_users=can_invite_users,
+                can_post_stories=can_post_stories,
+                can_edit_stories=can_edit_stories,
+                can_delete_stories=can_delete_stories,
+                can_post_messages=can_post_messages,
+                can_edit_messages=can_edit_messages,
+                can_pin_messages=can_pin_messages,
+                can_manage_topics=can_manage_topics,
+            ),
+            None,
+            call_plans.promoteChatMember,
+        )
+
+    def setChatAdministratorCustomTitle(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            custom_title: str,
+    ) -> bool:
+        return self._call(
+            "setChatAdministratorCustomTitle",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                custom_title=custom_title,
+            ),
+            None,
+            call_plans.setChatAdministratorCustomTitle,
+        )
+
+    def banChatSenderChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sender_chat_id: int,
+    ) -> bool:
+        return self._call(
+            "banChatSenderChat",
+            drop_none(
+                chat_id=chat_id,
+                sender_chat_id=sender_chat_id,
+            ),
+            None,
+            call_plans.banChatSenderChat,
+        )
+
+    def unbanChatSenderChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sender_chat_id: int,
+    ) -> bool:
+        return self._call(
+            "unbanChatSenderChat",
+            drop_none(
+                chat_id=chat_id,
+                sender_chat_id=sender_chat_id,
+            ),
+            None,
+            call_plans.unbanChatSenderChat,
+        )
+
+    def setChatPermissions(
+            self,
+            *,
+            chat_id: Union[int, str],
+            permissions: 'ChatPermissions',
+            use_independent_chat_permissions: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "setChatPermissions",
+            drop_none(
+                chat_id=chat_id,
+                permissions=permissions,
+                use_independent_chat_permissions=use_independent_chat_permissions,
+            ),
+            None,
+            call_plans.setChatPermissions,
+        )
+
+    def exportChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> str:
+        return self._call(
+            "exportChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.exportChatInviteLink,
+        )
+
+    def createChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            name: Optional[str] = None,
+            expire_date: Optional[int] = None,
+            member_limit: Optional[int] = None,
+            creates_join_request: Optional[bool] = None,
+    ) -> 'ChatInviteLink':
+        return self._call(
+            "createChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                name=name,
+                expire_date=expire_date,
+                member_limit=member_limit,
+                creates_join_request=creates_join_request,
+            ),
+            None,
+            call_plans.createChatInviteLink,
+        )
+
+    def editChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            invite_link: str,
+            name: Optional[str] = None,
+            expire_date: Optional[int] = None,
+            member_limit: Optional[int] = None,
+            creates_join_request: Optional[bool] = None,
+    ) -> 'ChatInviteLink':
+        return self._call(
+            "editChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                invite_link=invite_link,
+                name=name,
+                expire_date=expire_date,
+                member_limit=member_limit,
+                creates_join_request=creates_join_request,
+            ),
+            None,
+            call_plans.editChatInviteLink,
+        )
+
+    def createChatSubscriptionInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            subscription_period: int,
+            subscription_price: int,
+            name: Optional[str] = None,
+    ) -> 'ChatInviteLink':
+        return self._call(
+            "createChatSubscriptionInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                subscription_period=subscription_period,
+                subscription_price=subscription_price,
+                name=name,
+            ),
+            None,
+            call_plans.createChatSubscriptionInviteLink,
+        )
+
+    def editChatSubscriptionInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            invite_link: str,
+            name: Optional[str] = None,
+    ) -> 'ChatInviteLink':
+        return self._call(
+            "editChatSubscriptionInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                invite_link=invite_link,
+                name=name,
+            ),
+            None,
+            call_plans.editChatSubscriptionInviteLink,
+        )
+
+    def revokeChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            invite_link: str,
+    ) -> 'ChatInviteLink':
+        return self._call(
+            "revokeChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                invite_link=invite_link,
+            ),
+            None,
+            call_plans.revokeChatInviteLink,
+        )
+
+    def approveChatJoinRequest(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> bool:
+        return self._call(
+            "approveChatJoinRequest",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.approveChatJoinRequest,
+        )
+
+    def declineChatJoinRequest(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> bool:
+        return self._call(
+            "declineChatJoinRequest",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.declineChatJoinRequest,
+        )
+
+    def setChatPhoto(
+            self,
+            *,
+            chat_id: Union[int, str],
+            photo: 'InputFile',
+    ) -> bool:
+        return self._call(
+            "setChatPhoto",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            drop_none(
+                photo=photo,
+            ),
+            call_plans.setChatPhoto,
+        )
+
+    def deleteChatPhoto(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "deleteChatPhoto",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.deleteChatPhoto,
+        )
+
+    def setChatTitle(
+            self,
+            *,
+            chat_id: Union[int, str],
+            title: str,
+    ) -> bool:
+        return self._call(
+            "setChatTitle",
+            drop_none(
+                chat_id=chat_id,
+                title=title,
+            ),
+            None,
+            call_plans.setChatTitle,
+        )
+
+    def setChatDescription(
+            self,
+            *,
+            chat_id: Union[int, str],
+            description: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "setChatDescription",
+            drop_none(
+                chat_id=chat_id,
+                description=description,
+            ),
+            None,
+            call_plans.setChatDescription,
+        )
+
+    def pinChatMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+            business_connection_id: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "pinChatMessage",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+                business_connection_id=business_connection_id,
+                disable_notification=disable_notification,
+            ),
+            None,
+            call_plans.pinChatMessage,
+        )
+
+    def unpinChatMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            business_connection_id: Optional[str] = None,
+            message_id: Optional[int] = None,
+    ) -> bool:
+        return self._call(
+            "unpinChatMessage",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_id=message_id,
+            ),
+            None,
+            call_plans.unpinChatMessage,
+        )
+
+    def unpinAllChatMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "unpinAllChatMessages",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.unpinAllChatMessages,
+        )
+
+    def leaveChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "leaveChat",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.leaveChat,
+        )
+
+    def getChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> 'ChatFullInfo':
+        return self._call(
+            "getChat",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChat,
+        )
+
+    def getChatAdministrators(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> List['ChatMember']:
+        return self._call(
+            "getChatAdministrators",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChatAdministrators,
+        )
+
+    def getChatMemberCount(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> int:
+        return self._call(
+            "getChatMemberCount",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChatMemberCount,
+        )
+
+    def getChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> 'ChatMember':
+        return self._call(
+            "getChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.getChatMember,
+        )
+
+    def setChatStickerSet(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sticker_set_name: str,
+    ) -> bool:
+        return self._call(
+            "setChatStickerSet",
+            drop_none(
+                chat_id=chat_id,
+                sticker_set_name=sticker_set_name,
+            ),
+            None,
+            call_plans.setChatStickerSet,
+        )
+
+    def deleteChatStickerSet(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "deleteChatStickerSet",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.deleteChatStickerSet,
+        )
+
+    def getForumTopicIconStickers(
+            self,
+    ) -> List['Sticker']:
+        return self._call(
+            "getForumTopicIconStickers",
+            drop_none(
+            ),
+            None,
+            call_plans.getForumTopicIconStickers,
+        )
+
+    def createForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            name: str,
+            icon_color: Optional[int] = None,
+            icon_custom_emoji_id: Optional[str] = None,
+    ) -> 'ForumTopic':
+        return self._call(
+            "createForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                name=name,
+                icon_color=icon_color,
+                icon_custom_emoji_id=icon_custom_emoji_id,
+            ),
+            None,
+            call_plans.createForumTopic,
+        )
+
+    def editForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+            name: Optional[str] = None,
+            icon_custom_emoji_id: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "editForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+                name=name,
+                icon_custom_emoji_id=icon_custom_emoji_id,
+            ),
+            None,
+            call_plans.editForumTopic,
+        )
+
+    def closeForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return self._call(
+            "closeForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.closeForumTopic,
+        )
+
+    def reopenForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return self._call(
+            "reopenForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.reopenForumTopic,
+        )
+
+    def deleteForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return self._call(
+            "deleteForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.deleteForumTopic,
+        )
+
+    def unpinAllForumTopicMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return self._call(
+            "unpinAllForumTopicMessages",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.unpinAllForumTopicMessages,
+        )
+
+    def editGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            name: str,
+    ) -> bool:
+        return self._call(
+            "editGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                name=name,
+            ),
+            None,
+            call_plans.editGeneralForumTopic,
+        )
+
+    def closeGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "closeGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.closeGeneralForumTopic,
+        )
+
+    def reopenGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "reopenGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.reopenGeneralForumTopic,
+        )
+
+    def hideGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "hideGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.hideGeneralForumTopic,
+        )
+
+    def unhideGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "unhideGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.unhideGeneralForumTopic,
+        )
+
+    def unpinAllGeneralForumTopicMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "unpinAllGeneralForumTopicMessages",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.unpinAllGeneralForumTopicMessages,
+        )
+
+    def answerCallbackQuery(
+            self,
+            *,
+            callback_query_id: str,
+            text: Optional[str] = None,
+            show_alert: Optional[bool] = None,
+            url: Optional[str] = None,
+            cache_time: Optional[int] = None,
+    ) -> bool:
+        return self._call(
+            "answerCallbackQuery",
+            drop_none(
+                callback_query_id=callback_query_id,
+                text=text,
+                show_alert=show_alert,
+                url=url,
+                cache_time=cache_time,
+            ),
+            None,
+            call_plans.answerCallbackQuery,
+        )
+
+    def getUserChatBoosts(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> 'UserChatBoosts':
+        return self._call(
+            "getUserChatBoosts",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.getUserChatBoosts,
+        )
+
+    def getBusinessConnection(
+            self,
+            *,
+            business_connection_id: str,
+    ) -> 'BusinessConnection':
+        return self._call(
+            "getBusinessConnection",
+            drop_none(
+                business_connection_id=business_connection_id,
+            ),
+            None,
+            call_plans.getBusinessConnection,
+        )
+
+    def setMyCommands(
+            self,
+            *,
+            commands: List['BotCommand'],
+            scope: Optional['BotCommandScope'] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "setMyCommands",
+            drop_none(
+                commands=commands,
+                scope=scope,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyCommands,
+        )
+
+    def deleteMyCommands(
+            self,
+            *,
+            scope: Optional['BotCommandScope'] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "deleteMyCommands",
+            drop_none(
+                scope=scope,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.deleteMyCommands,
+        )
+
+    def getMyCommands(
+            self,
+            *,
+            scope: Optional['BotCommandScope'] = None,
+            language_code: Optional[str] = None,
+    ) -> List['BotCommand']:
+        return self._call(
+            "getMyCommands",
+            drop_none(
+                scope=scope,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyCommands,
+        )
+
+    def setMyName(
+            self,
+            *,
+            name: Optional[str] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "setMyName",
+            drop_none(
+                name=name,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyName,
+        )
+
+    def getMyName(
+            self,
+            *,
+            language_code: Optional[str] = None,
+    ) -> 'BotName':
+        return self._call(
+            "getMyName",
+            drop_none(
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyName,
+        )
+
+    def setMyDescription(
+            self,
+            *,
+            description: Optional[str] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "setMyDescription",
+            drop_none(
+                description=description,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyDescription,
+        )
+
+    def getMyDescription(
+            self,
+            *,
+            language_code: Optional[str] = None,
+    ) -> 'BotDescription':
+        return self._call(
+            "getMyDescription",
+            drop_none(
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyDescription,
+        )
+
+    def setMyShortDescription(
+            self,
+            *,
+            short_description: Optional[str] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "setMyShortDescription",
+            drop_none(
+                short_description=short_description,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyShortDescription,
+        )
+
+    def getMyShortDescription(
+            self,
+            *,
+            language_code: Optional[str] = None,
+    ) -> 'BotShortDescription':
+        return self._call(
+            "getMyShortDescription",
+            drop_none(
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyShortDescription,
+        )
+
+    def setChatMenuButton(
+            self,
+            *,
+            chat_id: Optional[int] = None,
+            menu_button: Optional['MenuButton'] = None,
+    ) -> bool:
+        return self._call(
+            "setChatMenuButton",
+            drop_none(
+                chat_id=chat_id,
+                menu_button=menu_button,
+            ),
+            None,
+            call_plans.setChatMenuButton,
+        )
+
+    def getChatMenuButton(
+            self,
+            *,
+            chat_id: Optional[int] = None,
+    ) -> 'MenuButton':
+        return self._call(
+            "getChatMenuButton",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChatMenuButton,
+        )
+
+    def setMyDefaultAdministratorRights(
+            self,
+            *,
+            rights: Optional['ChatAdministratorRights'] = None,
+            for_channels: Optional[bool] = None,
+    ) -> bool:
+        return self._call(
+            "setMyDefaultAdministratorRights",
+            drop_none(
+                rights=rights,
+                for_channels=for_channels,
+            ),
+            None,
+            call_plans.setMyDefaultAdministratorRights,
+        )
+
+    def getMyDefaultAdministratorRights(
+            self,
+            *,
+            for_channels: Optional[bool] = None,
+    ) -> 'ChatAdministratorRights':
+        return self._call(
+            "getMyDefaultAdministratorRights",
+            drop_none(
+                for_channels=for_channels,
+            ),
+            None,
+            call_plans.getMyDefaultAdministratorRights,
+        )
+
+    def editMessageText(
+            self,
+            *,
+            text: str,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            entities: Optional[List['MessageEntity']] = None,
+            link_preview_options: Optional['LinkPreviewOptions'] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return self._call(
+            "editMessageText",
+            drop_none(
+                text=text,
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                parse_mode=parse_mode,
+                entities=entities,
+                link_preview_options=link_preview_options,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageText,
+        )
+
+    def editMessageCaption(
+            self,
+            *,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return self._call(
+            "editMessageCaption",
+            drop_none(
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageCaption,
+        )
+
+    def editMessageMedia(
+            self,
+            *,
+            media: 'InputMedia',
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+            **attachments: 'InputFile',
+    ) -> Union['Message', bool]:
+        return self._call(
+            "editMessageMedia",
+            drop_none(
+                media=media,
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.editMessageMedia,
+        )
+
+    def editMessageLiveLocation(
+            self,
+            *,
+            latitude: float,
+            longitude: float,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            live_period: Optional[int] = None,
+            horizontal_accuracy: Optional[float] = None,
+            heading: Optional[int] = None,
+            proximity_alert_radius: Optional[int] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return self._call(
+            "editMessageLiveLocation",
+            drop_none(
+                latitude=latitude,
+                longitude=longitude,
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                live_period=live_period,
+                horizontal_accuracy=horizontal_accuracy,
+                heading=heading,
+                proximity_alert_radius=proximity_alert_radius,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageLiveLocation,
+        )
+
+    def stopMessageLiveLocation(
+            self,
+            *,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return self._call(
+            "stopMessageLiveLocation",
+            drop_none(
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.stopMessageLiveLocation,
+        )
+
+    def editMessageReplyMarkup(
+            self,
+            *,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return self._call(
+            "editMessageReplyMarkup",
+            drop_none(
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageReplyMarkup,
+        )
+
+    def stopPoll(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+            business_connection_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> 'Poll':
+        return self._call(
+            "stopPoll",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+                business_connection_id=business_connection_id,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.stopPoll,
+        )
+
+    def deleteMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+    ) -> bool:
+        return self._call(
+            "deleteMessage",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+            ),
+            None,
+            call_plans.deleteMessage,
+        )
+
+    def deleteMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_ids: List[int],
+    ) -> bool:
+        return self._call(
+            "deleteMessages",
+            drop_none(
+                chat_id=chat_id,
+                message_ids=message_ids,
+            ),
+            None,
+            call_plans.deleteMessages,
+        )
+
+    def sendSticker(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sticker: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            emoji: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendSticker",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                emoji=emoji,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                sticker=sticker,
+            ),
+            call_plans.sendSticker,
+        )
+
+    def getStickerSet(
+            self,
+            *,
+            name: str,
+    ) -> 'StickerSet':
+        return self._call(
+            "getStickerSet",
+            drop_none(
+                name=name,
+            ),
+            None,
+            call_plans.getStickerSet,
+        )
+
+    def getCustomEmojiStickers(
+            self,
+            *,
+            custom_emoji_ids: List[str],
+    ) -> List['Sticker']:
+        return self._call(
+            "getCustomEmojiStickers",
+            drop_none(
+                custom_emoji_ids=custom_emoji_ids,
+            ),
+            None,
+            call_plans.getCustomEmojiStickers,
+        )
+
+    def uploadStickerFile(
+            self,
+            *,
+            user_id: int,
+            sticker: 'InputFile',
+            sticker_format: str,
+    ) -> 'File':
+        return self._call(
+            "uploadStickerFile",
+            drop_none(
+                user_id=user_id,
+                sticker_format=sticker_format,
+            ),
+            drop_none(
+                sticker=sticker,
+            ),
+            call_plans.uploadStickerFile,
+        )
+
+    def createNewStickerSet(
+            self,
+            *,
+            user_id: int,
+            name: str,
+            title: str,
+            stickers: List['InputSticker'],
+            sticker_type: Optional[str] = None,
+            needs_repainting: Optional[bool] = None,
+            **attachments: 'InputFile',
+    ) -> bool:
+        return self._call(
+            "createNewStickerSet",
+            drop_none(
+                user_id=user_id,
+                name=name,
+                title=title,
+                stickers=stickers,
+                sticker_type=sticker_type,
+                needs_repainting=needs_repainting,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.createNewStickerSet,
+        )
+
+    def addStickerToSet(
+            self,
+            *,
+            user_id: int,
+            name: str,
+            sticker: 'InputSticker',
+            **attachments: 'InputFile',
+    ) -> bool:
+        return self._call(
+            "addStickerToSet",
+            drop_none(
+                user_id=user_id,
+                name=name,
+                sticker=sticker,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.addStickerToSet,
+        )
+
+    def setStickerPositionInSet(
+            self,
+            *,
+            sticker: str,
+            position: int,
+    ) -> bool:
+        return self._call(
+            "setStickerPositionInSet",
+            drop_none(
+                sticker=sticker,
+                position=position,
+            ),
+            None,
+            call_plans.setStickerPositionInSet,
+        )
+
+    def deleteStickerFromSet(
+            self,
+            *,
+            sticker: str,
+    ) -> bool:
+        return self._call(
+            "deleteStickerFromSet",
+            drop_none(
+                sticker=sticker,
+            ),
+            None,
+            call_plans.deleteStickerFromSet,
+        )
+
+    def replaceStickerInSet(
+            self,
+            *,
+            user_id: int,
+            name: str,
+            old_sticker: str,
+            sticker: 'InputSticker',
+            **attachments: 'InputFile',
+    ) -> bool:
+        return self._call(
+            "replaceStickerInSet",
+            drop_none(
+                user_id=user_id,
+                name=name,
+                old_sticker=old_sticker,
+                sticker=sticker,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.replaceStickerInSet,
+        )
+
+    def setStickerEmojiList(
+            self,
+            *,
+            sticker: str,
+            emoji_list: List[str],
+    ) -> bool:
+        return self._call(
+            "setStickerEmojiList",
+            drop_none(
+                sticker=sticker,
+                emoji_list=emoji_list,
+            ),
+            None,
+            call_plans.setStickerEmojiList,
+        )
+
+    def setStickerKeywords(
+            self,
+            *,
+            sticker: str,
+            keywords: Optional[List[str]] = None,
+    ) -> bool:
+        return self._call(
+            "setStickerKeywords",
+            drop_none(
+                sticker=sticker,
+                keywords=keywords,
+            ),
+            None,
+            call_plans.setStickerKeywords,
+        )
+
+    def setStickerMaskPosition(
+            self,
+            *,
+            sticker: str,
+            mask_position: Optional['MaskPosition'] = None,
+    ) -> bool:
+        return self._call(
+            "setStickerMaskPosition",
+            drop_none(
+                sticker=sticker,
+                mask_position=mask_position,
+            ),
+            None,
+            call_plans.setStickerMaskPosition,
+        )
+
+    def setStickerSetTitle(
+            self,
+            *,
+            name: str,
+            title: str,
+    ) -> bool:
+        return self._call(
+            "setStickerSetTitle",
+            drop_none(
+                name=name,
+                title=title,
+            ),
+            None,
+            call_plans.setStickerSetTitle,
+        )
+
+    def setStickerSetThumbnail(
+            self,
+            *,
+            name: str,
+            user_id: int,
+            format: str,  # noqa
+            thumbnail: Optional[Union['InputFile', str]] = None,
+    ) -> bool:
+        return self._call(
+            "setStickerSetThumbnail",
+            drop_none(
+                name=name,
+                user_id=user_id,
+                format=format,
+            ),
+            drop_none(
+                thumbnail=thumbnail,
+            ),
+            call_plans.setStickerSetThumbnail,
+        )
+
+    def setCustomEmojiStickerSetThumbnail(
+            self,
+            *,
+            name: str,
+            custom_emoji_id: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "setCustomEmojiStickerSetThumbnail",
+            drop_none(
+                name=name,
+                custom_emoji_id=custom_emoji_id,
+            ),
+            None,
+            call_plans.setCustomEmojiStickerSetThumbnail,
+        )
+
+    def deleteStickerSet(
+            self,
+            *,
+            name: str,
+    ) -> bool:
+        return self._call(
+            "deleteStickerSet",
+            drop_none(
+                name=name,
+            ),
+            None,
+            call_plans.deleteStickerSet,
+        )
+
+    def sendGift(
+            self,
+            *,
+            gift_id: str,
+            user_id: Optional[int] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            pay_for_upgrade: Optional[bool] = None,
+            text: Optional[str] = None,
+            text_parse_mode: Optional[str] = None,
+            text_entities: Optional[List['MessageEntity']] = None,
+    ) -> bool:
+        return self._call(
+            "sendGift",
+            drop_none(
+                gift_id=gift_id,
+                user_id=user_id,
+                chat_id=chat_id,
+                pay_for_upgrade=pay_for_upgrade,
+                text=text,
+                text_parse_mode=text_parse_mode,
+                text_entities=text_entities,
+            ),
+            None,
+            call_plans.sendGift,
+        )
+
+    def verifyUser(
+            self,
+            *,
+            user_id: int,
+            custom_description: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "verifyUser",
+            drop_none(
+                user_id=user_id,
+                custom_description=custom_description,
+            ),
+            None,
+            call_plans.verifyUser,
+        )
+
+    def verifyChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+            custom_description: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "verifyChat",
+            drop_none(
+                chat_id=chat_id,
+                custom_description=custom_description,
+            ),
+            None,
+            call_plans.verifyChat,
+        )
+
+    def removeUserVerification(
+            self,
+            *,
+            user_id: int,
+    ) -> bool:
+        return self._call(
+            "removeUserVerification",
+            drop_none(
+                user_id=user_id,
+            ),
+            None,
+            call_plans.removeUserVerification,
+        )
+
+    def removeChatVerification(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return self._call(
+            "removeChatVerification",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.removeChatVerification,
+        )
+
+    def answerInlineQuery(
+            self,
+            *,
+            inline_query_id: str,
+            results: List['InlineQueryResult'],
+            cache_time: Optional[int] = None,
+            is_personal: Optional[bool] = None,
+            next_offset: Optional[str] = None,
+            button: Optional['InlineQueryResultsButton'] = None,
+    ) -> bool:
+        return self._call(
+            "answerInlineQuery",
+            drop_none(
+                inline_query_id=inline_query_id,
+                results=results,
+                cache_time=cache_time,
+                is_personal=is_personal,
+                next_offset=next_offset,
+                button=button,
+            ),
+            None,
+            call_plans.answerInlineQuery,
+        )
+
+    def answerWebAppQuery(
+            self,
+            *,
+            web_app_query_id: str,
+            result: 'InlineQueryResult',
+    ) -> 'SentWebAppMessage':
+        return self._call(
+            "answerWebAppQuery",
+            drop_none(
+                web_app_query_id=web_app_query_id,
+                result=result,
+            ),
+            None,
+            call_plans.answerWebAppQuery,
+        )
+
+    def savePreparedInlineMessage(
+            self,
+            *,
+            user_id: int,
+            result: 'InlineQueryResult',
+            allow_user_chats: Optional[bool] = None,
+            allow_bot_chats: Optional[bool] = None,
+            allow_group_chats: Optional[bool] = None,
+            allow_channel_chats: Optional[bool] = None,
+    ) -> 'PreparedInlineMessage':
+        return self._call(
+            "savePreparedInlineMessage",
+            drop_none(
+                user_id=user_id,
+                result=result,
+                allow_user_chats=allow_user_chats,
+                allow_bot_chats=allow_bot_chats,
+                allow_group_chats=allow_group_chats,
+                allow_channel_chats=allow_channel_chats,
+            ),
+            None,
+            call_plans.savePreparedInlineMessage,
+        )
+
+    def sendInvoice(
+            self,
+            *,
+            chat_id: Union[int, str],
+            title: str,
+            description: str,
+            payload: str,
+            currency: str,
+            prices: List['LabeledPrice'],
+            message_thread_id: Optional[int] = None,
+            provider_token: Optional[str] = None,
+            max_tip_amount: Optional[int] = None,
+            suggested_tip_amounts: Optional[List[int]] = None,
+            start_parameter: Optional[str] = None,
+            provider_data: Optional[str] = None,
+            photo_url: Optional[str] = None,
+            photo_size: Optional[int] = None,
+            photo_width: Optional[int] = None,
+            photo_height: Optional[int] = None,
+            need_name: Optional[bool] = None,
+            need_phone_number: Optional[bool] = None,
+            need_email: Optional[bool] = None,
+            need_shipping_address: Optional[bool] = None,
+            send_phone_number_to_provider: Optional[bool] = None,
+            send_email_to_provider: Optional[bool] = None,
+            is_flexible: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendInvoice",
+            drop_none(
+                chat_id=chat_id,
+                title=title,
+                description=description,
+                payload=payload,
+                currency=currency,
+                prices=prices,
+                message_thread_id=message_thread_id,
+                provider_token=provider_token,
+                max_tip_amount=max_tip_amount,
+                suggested_tip_amounts=suggested_tip_amounts,
+                start_parameter=start_parameter,
+                provider_data=provider_data,
+                photo_url=photo_url,
+                photo_size=photo_size,
+                photo_width=photo_width,
+                photo_height=photo_height,
+                need_name=need_name,
+                need_phone_number=need_phone_number,
+                need_email=need_email,
+                need_shipping_address=need_shipping_address,
+                send_phone_number_to_provider=send_phone_number_to_provider,
+                send_email_to_provider=send_email_to_provider,
+                is_flexible=is_flexible,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendInvoice,
+        )
+
+    def createInvoiceLink(
+            self,
+            *,
+            title: str,
+            description: str,
+            payload: str,
+            currency: str,
+            prices: List['LabeledPrice'],
+            business_connection_id: Optional[str] = None,
+            provider_token: Optional[str] = None,
+            subscription_period: Optional[int] = None,
+            max_tip_amount: Optional[int] = None,
+            suggested_tip_amounts: Optional[List[int]] = None,
+            provider_data: Optional[str] = None,
+            photo_url: Optional[str] = None,
+            photo_size: Optional[int] = None,
+            photo_width: Optional[int] = None,
+            photo_height: Optional[int] = None,
+            need_name: Optional[bool] = None,
+            need_phone_number: Optional[bool] = None,
+            need_email: Optional[bool] = None,
+            need_shipping_address: Optional[bool] = None,
+            send_phone_number_to_provider: Optional[bool] = None,
+            send_email_to_provider: Optional[bool] = None,
+            is_flexible: Optional[bool] = None,
+    ) -> str:
+        return self._call(
+            "createInvoiceLink",
+            drop_none(
+                title=title,
+                description=description,
+                payload=payload,
+                currency=currency,
+                prices=prices,
+                business_connection_id=business_connection_id,
+                provider_token=provider_token,
+                subscription_period=subscription_period,
+                max_tip_amount=max_tip_amount,
+                suggested_tip_amounts=suggested_tip_amounts,
+                provider_data=provider_data,
+                photo_url=photo_url,
+                photo_size=photo_size,
+                photo_width=photo_width,
+                photo_height=photo_height,
+                need_name=need_name,
+                need_phone_number=need_phone_number,
+                need_email=need_email,
+                need_shipping_address=need_shipping_address,
+                send_phone_number_to_provider=send_phone_number_to_provider,
+                send_email_to_provider=send_email_to_provider,
+                is_flexible=is_flexible,
+            ),
+            None,
+            call_plans.createInvoiceLink,
+        )
+
+    def answerShippingQuery(
+            self,
+            *,
+            shipping_query_id: str,
+            ok: bool,
+            shipping_options: Optional[List['ShippingOption']] = None,
+            error_message: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "answerShippingQuery",
+            drop_none(
+                shipping_query_id=shipping_query_id,
+                ok=ok,
+                shipping_options=shipping_options,
+                error_message=error_message,
+            ),
+            None,
+            call_plans.answerShippingQuery,
+        )
+
+    def answerPreCheckoutQuery(
+            self,
+            *,
+            pre_checkout_query_id: str,
+            ok: bool,
+            error_message: Optional[str] = None,
+    ) -> bool:
+        return self._call(
+            "answerPreCheckoutQuery",
+            drop_none(
+                pre_checkout_query_id=pre_checkout_query_id,
+                ok=ok,
+                error_message=error_message,
+            ),
+            None,
+            call_plans.answerPreCheckoutQuery,
+        )
+
+    def getStarTransactions(
+            self,
+            *,
+            offset: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> 'StarTransactions':
+        return self._call(
+            "getStarTransactions",
+            drop_none(
+                offset=offset,
+                limit=limit,
+            ),
+            None,
+            call_plans.getStarTransactions,
+        )
+
+    def refundStarPayment(
+            self,
+            *,
+            user_id: int,
+            telegram_payment_charge_id: str,
+    ) -> bool:
+        return self._call(
+            "refundStarPayment",
+            drop_none(
+                user_id=user_id,
+                telegram_payment_charge_id=telegram_payment_charge_id,
+            ),
+            None,
+            call_plans.refundStarPayment,
+        )
+
+    def editUserStarSubscription(
+            self,
+            *,
+            user_id: int,
+            telegram_payment_charge_id: str,
+            is_canceled: bool,
+    ) -> bool:
+        return self._call(
+            "editUserStarSubscription",
+            drop_none(
+                user_id=user_id,
+                telegram_payment_charge_id=telegram_payment_charge_id,
+                is_canceled=is_canceled,
+            ),
+            None,
+            call_plans.editUserStarSubscription,
+        )
+
+    def setPassportDataErrors(
+            self,
+            *,
+            user_id: int,
+            errors: List['PassportElementError'],
+    ) -> bool:
+        return self._call(
+            "setPassportDataErrors",
+            drop_none(
+                user_id=user_id,
+                errors=errors,
+            ),
+            None,
+            call_plans.setPassportDataErrors,
+        )
+
+    def sendGame(
+            self,
+            *,
+            chat_id: int,
+            game_short_name: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> 'Message':
+        return self._call(
+            "sendGame",
+            drop_none(
+                chat_id=chat_id,
+                game_short_name=game_short_name,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendGame,
+        )
+
+    def setGameScore(
+            self,
+            *,
+            user_id: int,
+            score: int,
+            force: Optional[bool] = None,
+            disable_edit_message: Optional[bool] = None,
+            chat_id: Optional[int] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+    ) -> Union['Message', bool]:
+        return self._call(
+            "setGameScore",
+            drop_none(
+                user_id=user_id,
+                score=score,
+                force=force,
+                disable_edit_message=disable_edit_message,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+            ),
+            None,
+            call_plans.setGameScore,
+        )
+
+    def getGameHighScores(
+            self,
+            *,
+            user_id: int,
+            chat_id: Optional[int] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+    ) -> List['GameHighScore']:
+        return self._call(
+            "getGameHighScores",
+            drop_none(
+                user_id=user_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+            ),
+            None,
+            call_plans.getGameHighScores,
+        )
+
+
+class TeleapiClientAsync(TeleProxyAsync):
+    """
+    Concrete implementation of Teleapi methods with explicit signatures,
+    no attribute lookup magic on call. Files for InputMedia,
+    InputPaidMedia and InputSticker params can be passed as extra keyword
+    arguments and referred with attach://<name>.
+    """
+
+    async def getUpdates(
+            self,
+            *,
+            offset: Optional[int] = None,
+            limit: Optional[int] = None,
+            timeout: Optional[int] = None,
+            allowed_updates: Optional[List[str]] = None,
+    ) -> List['Update']:
+        return await self._call(
+            "getUpdates",
+            drop_none(
+                offset=offset,
+                limit=limit,
+                timeout=timeout,
+                allowed_updates=allowed_updates,
+            ),
+            None,
+            call_plans.getUpdates,
+        )
+
+    async def setWebhook(
+            self,
+            *,
+            url: str,
+            certificate: Optional['InputFile'] = None,
+            ip_address: Optional[str] = None,
+            max_connections: Optional[int] = None,
+            allowed_updates: Optional[List[str]] = None,
+            drop_pending_updates: Optional[bool] = None,
+            secret_token: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "setWebhook",
+            drop_none(
+                url=url,
+                ip_address=ip_address,
+                max_connections=max_connections,
+                allowed_updates=allowed_updates,
+                drop_pending_updates=drop_pending_updates,
+                secret_token=secret_token,
+            ),
+            drop_none(
+                certificate=certificate,
+            ),
+            call_plans.setWebhook,
+        )
+
+    async def deleteWebhook(
+            self,
+            *,
+            drop_pending_updates: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "deleteWebhook",
+            drop_none(
+                drop_pending_updates=drop_pending_updates,
+            ),
+            None,
+            call_plans.deleteWebhook,
+        )
+
+    async def getWebhookInfo(
+            self,
+    ) -> 'WebhookInfo':
+        return await self._call(
+            "getWebhookInfo",
+            drop_none(
+            ),
+            None,
+            call_plans.getWebhookInfo,
+        )
+
+    async def getMe(
+            self,
+    ) -> 'User':
+        return await self._call(
+            "getMe",
+            drop_none(
+            ),
+            None,
+            call_plans.getMe,
+        )
+
+    async def logOut(
+            self,
+    ) -> bool:
+        return await self._call(
+            "logOut",
+            drop_none(
+            ),
+            None,
+            call_plans.logOut,
+        )
+
+    async def close(
+            self,
+    ) -> bool:
+        return await self._call(
+            "close",
+            drop_none(
+            ),
+            None,
+            call_plans.close,
+        )
+
+    async def sendMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            text: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            parse_mode: Optional[str] = None,
+            entities: Optional[List['MessageEntity']] = None,
+            link_preview_options: Optional['LinkPreviewOptions'] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendMessage",
+            drop_none(
+                chat_id=chat_id,
+                text=text,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                parse_mode=parse_mode,
+                entities=entities,
+                link_preview_options=link_preview_options,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendMessage,
+        )
+
+    async def forwardMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_id: int,
+            message_thread_id: Optional[int] = None,
+            video_start_timestamp: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+    ) -> 'Message':
+        return await self._call(
+            "forwardMessage",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_id=message_id,
+                message_thread_id=message_thread_id,
+                video_start_timestamp=video_start_timestamp,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+            ),
+            None,
+            call_plans.forwardMessage,
+        )
+
+    async def forwardMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_ids: List[int],
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+    ) -> List['MessageId']:
+        return await self._call(
+            "forwardMessages",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_ids=message_ids,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+            ),
+            None,
+            call_plans.forwardMessages,
+        )
+
+    async def copyMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_id: int,
+            message_thread_id: Optional[int] = None,
+            video_start_timestamp: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'MessageId':
+        return await self._call(
+            "copyMessage",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_id=message_id,
+                message_thread_id=message_thread_id,
+                video_start_timestamp=video_start_timestamp,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.copyMessage,
+        )
+
+    async def copyMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            from_chat_id: Union[int, str],
+            message_ids: List[int],
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            remove_caption: Optional[bool] = None,
+    ) -> List['MessageId']:
+        return await self._call(
+            "copyMessages",
+            drop_none(
+                chat_id=chat_id,
+                from_chat_id=from_chat_id,
+                message_ids=message_ids,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                remove_caption=remove_caption,
+            ),
+            None,
+            call_plans.copyMessages,
+        )
+
+    async def sendPhoto(
+            self,
+            *,
+            chat_id: Union[int, str],
+            photo: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            has_spoiler: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendPhoto",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                has_spoiler=has_spoiler,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                photo=photo,
+            ),
+            call_plans.sendPhoto,
+        )
+
+    async def sendAudio(
+            self,
+            *,
+            chat_id: Union[int, str],
+            audio: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            duration: Optional[int] = None,
+            performer: Optional[str] = None,
+            title: Optional[str] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendAudio",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                duration=duration,
+                performer=performer,
+                title=title,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                audio=audio,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendAudio,
+        )
+
+    async def sendDocument(
+            self,
+            *,
+            chat_id: Union[int, str],
+            document: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            disable_content_type_detection: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendDocument",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                disable_content_type_detection=disable_content_type_detection,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                document=document,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendDocument,
+        )
+
+    async def sendVideo(
+            self,
+            *,
+            chat_id: Union[int, str],
+            video: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            duration: Optional[int] = None,
+            width: Optional[int] = None,
+            height: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            cover: Optional[Union['InputFile', str]] = None,
+            start_timestamp: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            has_spoiler: Optional[bool] = None,
+            supports_streaming: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendVideo",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                duration=duration,
+                width=width,
+                height=height,
+                start_timestamp=start_timestamp,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                has_spoiler=has_spoiler,
+                supports_streaming=supports_streaming,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                video=video,
+                thumbnail=thumbnail,
+                cover=cover,
+            ),
+            call_plans.sendVideo,
+        )
+
+    async def sendAnimation(
+            self,
+            *,
+            chat_id: Union[int, str],
+            animation: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            duration: Optional[int] = None,
+            width: Optional[int] = None,
+            height: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            has_spoiler: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendAnimation",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                duration=duration,
+                width=width,
+                height=height,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                has_spoiler=has_spoiler,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                animation=animation,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendAnimation,
+        )
+
+    async def sendVoice(
+            self,
+            *,
+            chat_id: Union[int, str],
+            voice: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            duration: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendVoice",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                duration=duration,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                voice=voice,
+            ),
+            call_plans.sendVoice,
+        )
+
+    async def sendVideoNote(
+            self,
+            *,
+            chat_id: Union[int, str],
+            video_note: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            duration: Optional[int] = None,
+            length: Optional[int] = None,
+            thumbnail: Optional[Union['InputFile', str]] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendVideoNote",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                duration=duration,
+                length=length,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                video_note=video_note,
+                thumbnail=thumbnail,
+            ),
+            call_plans.sendVideoNote,
+        )
+
+    async def sendPaidMedia(
+            self,
+            *,
+            chat_id: Union[int, str],
+            star_count: int,
+            media: List['InputPaidMedia'],
+            business_connection_id: Optional[str] = None,
+            payload: Optional[str] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+            **attachments: 'InputFile',
+    ) -> 'Message':
+        return await self._call(
+            "sendPaidMedia",
+            drop_none(
+                chat_id=chat_id,
+                star_count=star_count,
+                media=media,
+                business_connection_id=business_connection_id,
+                payload=payload,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.sendPaidMedia,
+        )
+
+    async def sendMediaGroup(
+            self,
+            *,
+            chat_id: Union[int, str],
+            media: List[Union['InputMediaAudio', 'InputMediaDocument', 'InputMediaPhoto', 'InputMediaVideo']],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            **attachments: 'InputFile',
+    ) -> List['Message']:
+        return await self._call(
+            "sendMediaGroup",
+            drop_none(
+                chat_id=chat_id,
+                media=media,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.sendMediaGroup,
+        )
+
+    async def sendLocation(
+            self,
+            *,
+            chat_id: Union[int, str],
+            latitude: float,
+            longitude: float,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            horizontal_accuracy: Optional[float] = None,
+            live_period: Optional[int] = None,
+            heading: Optional[int] = None,
+            proximity_alert_radius: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendLocation",
+            drop_none(
+                chat_id=chat_id,
+                latitude=latitude,
+                longitude=longitude,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                horizontal_accuracy=horizontal_accuracy,
+                live_period=live_period,
+                heading=heading,
+                proximity_alert_radius=proximity_alert_radius,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendLocation,
+        )
+
+    async def sendVenue(
+            self,
+            *,
+            chat_id: Union[int, str],
+            latitude: float,
+            longitude: float,
+            title: str,
+            address: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            foursquare_id: Optional[str] = None,
+            foursquare_type: Optional[str] = None,
+            google_place_id: Optional[str] = None,
+            google_place_type: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendVenue",
+            drop_none(
+                chat_id=chat_id,
+                latitude=latitude,
+                longitude=longitude,
+                title=title,
+                address=address,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                foursquare_id=foursquare_id,
+                foursquare_type=foursquare_type,
+                google_place_id=google_place_id,
+                google_place_type=google_place_type,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendVenue,
+        )
+
+    async def sendContact(
+            self,
+            *,
+            chat_id: Union[int, str],
+            phone_number: str,
+            first_name: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            last_name: Optional[str] = None,
+            vcard: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendContact",
+            drop_none(
+                chat_id=chat_id,
+                phone_number=phone_number,
+                first_name=first_name,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                last_name=last_name,
+                vcard=vcard,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendContact,
+        )
+
+    async def sendPoll(
+            self,
+            *,
+            chat_id: Union[int, str],
+            question: str,
+            options: List['InputPollOption'],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            question_parse_mode: Optional[str] = None,
+            question_entities: Optional[List['MessageEntity']] = None,
+            is_anonymous: Optional[bool] = None,
+            type: Optional[str] = None,  # noqa
+            allows_multiple_answers: Optional[bool] = None,
+            correct_option_id: Optional[int] = None,
+            explanation: Optional[str] = None,
+            explanation_parse_mode: Optional[str] = None,
+            explanation_entities: Optional[List['MessageEntity']] = None,
+            open_period: Optional[int] = None,
+            close_date: Optional[int] = None,
+            is_closed: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendPoll",
+            drop_none(
+                chat_id=chat_id,
+                question=question,
+                options=options,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                question_parse_mode=question_parse_mode,
+                question_entities=question_entities,
+                is_anonymous=is_anonymous,
+                type=type,
+                allows_multiple_answers=allows_multiple_answers,
+                correct_option_id=correct_option_id,
+                explanation=explanation,
+                explanation_parse_mode=explanation_parse_mode,
+                explanation_entities=explanation_entities,
+                open_period=open_period,
+                close_date=close_date,
+                is_closed=is_closed,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendPoll,
+        )
+
+    async def sendDice(
+            self,
+            *,
+            chat_id: Union[int, str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            emoji: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendDice",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                emoji=emoji,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendDice,
+        )
+
+    async def sendChatAction(
+            self,
+            *,
+            chat_id: Union[int, str],
+            action: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+    ) -> bool:
+        return await self._call(
+            "sendChatAction",
+            drop_none(
+                chat_id=chat_id,
+                action=action,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.sendChatAction,
+        )
+
+    async def setMessageReaction(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+            reaction: Optional[List['ReactionType']] = None,
+            is_big: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "setMessageReaction",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+                reaction=reaction,
+                is_big=is_big,
+            ),
+            None,
+            call_plans.setMessageReaction,
+        )
+
+    async def getUserProfilePhotos(
+            self,
+            *,
+            user_id: int,
+            offset: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> 'UserProfilePhotos':
+        return await self._call(
+            "getUserProfilePhotos",
+            drop_none(
+                user_id=user_id,
+                offset=offset,
+                limit=limit,
+            ),
+            None,
+            call_plans.getUserProfilePhotos,
+        )
+
+    async def setUserEmojiStatus(
+            self,
+            *,
+            user_id: int,
+            emoji_status_custom_emoji_id: Optional[str] = None,
+            emoji_status_expiration_date: Optional[int] = None,
+    ) -> bool:
+        return await self._call(
+            "setUserEmojiStatus",
+            drop_none(
+                user_id=user_id,
+                emoji_status_custom_emoji_id=emoji_status_custom_emoji_id,
+                emoji_status_expiration_date=emoji_status_expiration_date,
+            ),
+            None,
+            call_plans.setUserEmojiStatus,
+        )
+
+    async def getFile(
+            self,
+            *,
+            file_id: str,
+    ) -> 'File':
+        return await self._call(
+            "getFile",
+            drop_none(
+                file_id=file_id,
+            ),
+            None,
+            call_plans.getFile,
+        )
+
+    async def banChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            until_date: Optional[int] = None,
+            revoke_messages: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "banChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                until_date=until_date,
+                revoke_messages=revoke_messages,
+            ),
+            None,
+            call_plans.banChatMember,
+        )
+
+    async def unbanChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            only_if_banned: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "unbanChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                only_if_banned=only_if_banned,
+            ),
+            None,
+            call_plans.unbanChatMember,
+        )
+
+    async def restrictChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            permissions: 'ChatPermissions',
+            use_independent_chat_permissions: Optional[bool] = None,
+            until_date: Optional[int] = None,
+    ) -> bool:
+        return await self._call(
+            "restrictChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                permissions=permissions,
+                use_independent_chat_permissions=use_independent_chat_permissions,
+                until_date=until_date,
+            ),
+            None,
+            call_plans.restrictChatMember,
+        )
+
+    async def promoteChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            is_anonymous: Optional[bool] = None,
+            can_manage_chat: Optional[bool] = None,
+            can_delete_messages: Optional[bool] = None,
+            can_manage_video_chats: Optional[bool] = None,
+            can_restrict_members: Optional[bool] = None,
+            can_promote_members: Optional[bool] = None,
+            can_change_info: Optional[bool] = None,
+            can_invite_users: Optional[bool] = None,
+            can_post_stories: Optional[bool] = None,
+            can_edit_stories: Optional[bool] = None,
+            can_delete_stories: Optional[bool] = None,
+            can_post_messages: Optional[bool] = None,
+            can_edit_messages: Optional[bool] = None,
+            can_pin_messages: Optional[bool] = None,
+            can_manage_topics: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "promoteChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                is_anonymous=is_anonymous,
+                can_manage_chat=can_manage_chat,
+                can_delete_messages=can_delete_messages,
+                can_manage_video_chats=can_manage_video_chats,
+                can_restrict_members=can_restrict_members,
+                can_promote_members=can_promote_members,
+                can_change_info=can_change_info,
+                can_invite_users=can_invite_users,
+                can_post_stories=can_post_stories,
+                can_edit_stories=can_edit_stories,
+                can_delete_stories=can_delete_stories,
+                can_post_messages=can_post_messages,
+                can_edit_messages=can_edit_messages,
+                can_pin_messages=can_pin_messages,
+                can_manage_topics=can_manage_topics,
+            ),
+            None,
+            call_plans.promoteChatMember,
+        )
+
+    async def setChatAdministratorCustomTitle(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+            custom_title: str,
+    ) -> bool:
+        return await self._call(
+            "setChatAdministratorCustomTitle",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+                custom_title=custom_title,
+            ),
+            None,
+            call_plans.setChatAdministratorCustomTitle,
+        )
+
+    async def banChatSenderChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sender_chat_id: int,
+    ) -> bool:
+        return await self._call(
+            "banChatSenderChat",
+            drop_none(
+                chat_id=chat_id,
+                sender_chat_id=sender_chat_id,
+            ),
+            None,
+            call_plans.banChatSenderChat,
+        )
+
+    async def unbanChatSenderChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sender_chat_id: int,
+    ) -> bool:
+        return await self._call(
+            "unbanChatSenderChat",
+            drop_none(
+                chat_id=chat_id,
+                sender_chat_id=sender_chat_id,
+            ),
+            None,
+            call_plans.unbanChatSenderChat,
+        )
+
+    async def setChatPermissions(
+            self,
+            *,
+            chat_id: Union[int, str],
+            permissions: 'ChatPermissions',
+            use_independent_chat_permissions: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "setChatPermissions",
+            drop_none(
+                chat_id=chat_id,
+                permissions=permissions,
+                use_independent_chat_permissions=use_independent_chat_permissions,
+            ),
+            None,
+            call_plans.setChatPermissions,
+        )
+
+    async def exportChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> str:
+        return await self._call(
+            "exportChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.exportChatInviteLink,
+        )
+
+    async def createChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            name: Optional[str] = None,
+            expire_date: Optional[int] = None,
+            member_limit: Optional[int] = None,
+            creates_join_request: Optional[bool] = None,
+    ) -> 'ChatInviteLink':
+        return await self._call(
+            "createChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                name=name,
+                expire_date=expire_date,
+                member_limit=member_limit,
+                creates_join_request=creates_join_request,
+            ),
+            None,
+            call_plans.createChatInviteLink,
+        )
+
+    async def editChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            invite_link: str,
+            name: Optional[str] = None,
+            expire_date: Optional[int] = None,
+            member_limit: Optional[int] = None,
+            creates_join_request: Optional[bool] = None,
+    ) -> 'ChatInviteLink':
+        return await self._call(
+            "editChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                invite_link=invite_link,
+                name=name,
+                expire_date=expire_date,
+                member_limit=member_limit,
+                creates_join_request=creates_join_request,
+            ),
+            None,
+            call_plans.editChatInviteLink,
+        )
+
+    async def createChatSubscriptionInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            subscription_period: int,
+            subscription_price: int,
+            name: Optional[str] = None,
+    ) -> 'ChatInviteLink':
+        return await self._call(
+            "createChatSubscriptionInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                subscription_period=subscription_period,
+                subscription_price=subscription_price,
+                name=name,
+            ),
+            None,
+            call_plans.createChatSubscriptionInviteLink,
+        )
+
+    async def editChatSubscriptionInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            invite_link: str,
+            name: Optional[str] = None,
+    ) -> 'ChatInviteLink':
+        return await self._call(
+            "editChatSubscriptionInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                invite_link=invite_link,
+                name=name,
+            ),
+            None,
+            call_plans.editChatSubscriptionInviteLink,
+        )
+
+    async def revokeChatInviteLink(
+            self,
+            *,
+            chat_id: Union[int, str],
+            invite_link: str,
+    ) -> 'ChatInviteLink':
+        return await self._call(
+            "revokeChatInviteLink",
+            drop_none(
+                chat_id=chat_id,
+                invite_link=invite_link,
+            ),
+            None,
+            call_plans.revokeChatInviteLink,
+        )
+
+    async def approveChatJoinRequest(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> bool:
+        return await self._call(
+            "approveChatJoinRequest",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.approveChatJoinRequest,
+        )
+
+    async def declineChatJoinRequest(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> bool:
+        return await self._call(
+            "declineChatJoinRequest",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.declineChatJoinRequest,
+        )
+
+    async def setChatPhoto(
+            self,
+            *,
+            chat_id: Union[int, str],
+            photo: 'InputFile',
+    ) -> bool:
+        return await self._call(
+            "setChatPhoto",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            drop_none(
+                photo=photo,
+            ),
+            call_plans.setChatPhoto,
+        )
+
+    async def deleteChatPhoto(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "deleteChatPhoto",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.deleteChatPhoto,
+        )
+
+    async def setChatTitle(
+            self,
+            *,
+            chat_id: Union[int, str],
+            title: str,
+    ) -> bool:
+        return await self._call(
+            "setChatTitle",
+            drop_none(
+                chat_id=chat_id,
+                title=title,
+            ),
+            None,
+            call_plans.setChatTitle,
+        )
+
+    async def setChatDescription(
+            self,
+            *,
+            chat_id: Union[int, str],
+            description: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "setChatDescription",
+            drop_none(
+                chat_id=chat_id,
+                description=description,
+            ),
+            None,
+            call_plans.setChatDescription,
+        )
+
+    async def pinChatMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+            business_connection_id: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "pinChatMessage",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+                business_connection_id=business_connection_id,
+                disable_notification=disable_notification,
+            ),
+            None,
+            call_plans.pinChatMessage,
+        )
+
+    async def unpinChatMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            business_connection_id: Optional[str] = None,
+            message_id: Optional[int] = None,
+    ) -> bool:
+        return await self._call(
+            "unpinChatMessage",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_id=message_id,
+            ),
+            None,
+            call_plans.unpinChatMessage,
+        )
+
+    async def unpinAllChatMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "unpinAllChatMessages",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.unpinAllChatMessages,
+        )
+
+    async def leaveChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "leaveChat",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.leaveChat,
+        )
+
+    async def getChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> 'ChatFullInfo':
+        return await self._call(
+            "getChat",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChat,
+        )
+
+    async def getChatAdministrators(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> List['ChatMember']:
+        return await self._call(
+            "getChatAdministrators",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChatAdministrators,
+        )
+
+    async def getChatMemberCount(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> int:
+        return await self._call(
+            "getChatMemberCount",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChatMemberCount,
+        )
+
+    async def getChatMember(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> 'ChatMember':
+        return await self._call(
+            "getChatMember",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.getChatMember,
+        )
+
+    async def setChatStickerSet(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sticker_set_name: str,
+    ) -> bool:
+        return await self._call(
+            "setChatStickerSet",
+            drop_none(
+                chat_id=chat_id,
+                sticker_set_name=sticker_set_name,
+            ),
+            None,
+            call_plans.setChatStickerSet,
+        )
+
+    async def deleteChatStickerSet(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "deleteChatStickerSet",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.deleteChatStickerSet,
+        )
+
+    async def getForumTopicIconStickers(
+            self,
+    ) -> List['Sticker']:
+        return await self._call(
+            "getForumTopicIconStickers",
+            drop_none(
+            ),
+            None,
+            call_plans.getForumTopicIconStickers,
+        )
+
+    async def createForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            name: str,
+            icon_color: Optional[int] = None,
+            icon_custom_emoji_id: Optional[str] = None,
+    ) -> 'ForumTopic':
+        return await self._call(
+            "createForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                name=name,
+                icon_color=icon_color,
+                icon_custom_emoji_id=icon_custom_emoji_id,
+            ),
+            None,
+            call_plans.createForumTopic,
+        )
+
+    async def editForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+            name: Optional[str] = None,
+            icon_custom_emoji_id: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "editForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+                name=name,
+                icon_custom_emoji_id=icon_custom_emoji_id,
+            ),
+            None,
+            call_plans.editForumTopic,
+        )
+
+    async def closeForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return await self._call(
+            "closeForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.closeForumTopic,
+        )
+
+    async def reopenForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return await self._call(
+            "reopenForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.reopenForumTopic,
+        )
+
+    async def deleteForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return await self._call(
+            "deleteForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.deleteForumTopic,
+        )
+
+    async def unpinAllForumTopicMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_thread_id: int,
+    ) -> bool:
+        return await self._call(
+            "unpinAllForumTopicMessages",
+            drop_none(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+            ),
+            None,
+            call_plans.unpinAllForumTopicMessages,
+        )
+
+    async def editGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+            name: str,
+    ) -> bool:
+        return await self._call(
+            "editGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+                name=name,
+            ),
+            None,
+            call_plans.editGeneralForumTopic,
+        )
+
+    async def closeGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "closeGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.closeGeneralForumTopic,
+        )
+
+    async def reopenGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "reopenGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.reopenGeneralForumTopic,
+        )
+
+    async def hideGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "hideGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.hideGeneralForumTopic,
+        )
+
+    async def unhideGeneralForumTopic(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "unhideGeneralForumTopic",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.unhideGeneralForumTopic,
+        )
+
+    async def unpinAllGeneralForumTopicMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "unpinAllGeneralForumTopicMessages",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.unpinAllGeneralForumTopicMessages,
+        )
+
+    async def answerCallbackQuery(
+            self,
+            *,
+            callback_query_id: str,
+            text: Optional[str] = None,
+            show_alert: Optional[bool] = None,
+            url: Optional[str] = None,
+            cache_time: Optional[int] = None,
+    ) -> bool:
+        return await self._call(
+            "answerCallbackQuery",
+            drop_none(
+                callback_query_id=callback_query_id,
+                text=text,
+                show_alert=show_alert,
+                url=url,
+                cache_time=cache_time,
+            ),
+            None,
+            call_plans.answerCallbackQuery,
+        )
+
+    async def getUserChatBoosts(
+            self,
+            *,
+            chat_id: Union[int, str],
+            user_id: int,
+    ) -> 'UserChatBoosts':
+        return await self._call(
+            "getUserChatBoosts",
+            drop_none(
+                chat_id=chat_id,
+                user_id=user_id,
+            ),
+            None,
+            call_plans.getUserChatBoosts,
+        )
+
+    async def getBusinessConnection(
+            self,
+            *,
+            business_connection_id: str,
+    ) -> 'BusinessConnection':
+        return await self._call(
+            "getBusinessConnection",
+            drop_none(
+                business_connection_id=business_connection_id,
+            ),
+            None,
+            call_plans.getBusinessConnection,
+        )
+
+    async def setMyCommands(
+            self,
+            *,
+            commands: List['BotCommand'],
+            scope: Optional['BotCommandScope'] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "setMyCommands",
+            drop_none(
+                commands=commands,
+                scope=scope,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyCommands,
+        )
+
+    async def deleteMyCommands(
+            self,
+            *,
+            scope: Optional['BotCommandScope'] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "deleteMyCommands",
+            drop_none(
+                scope=scope,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.deleteMyCommands,
+        )
+
+    async def getMyCommands(
+            self,
+            *,
+            scope: Optional['BotCommandScope'] = None,
+            language_code: Optional[str] = None,
+    ) -> List['BotCommand']:
+        return await self._call(
+            "getMyCommands",
+            drop_none(
+                scope=scope,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyCommands,
+        )
+
+    async def setMyName(
+            self,
+            *,
+            name: Optional[str] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "setMyName",
+            drop_none(
+                name=name,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyName,
+        )
+
+    async def getMyName(
+            self,
+            *,
+            language_code: Optional[str] = None,
+    ) -> 'BotName':
+        return await self._call(
+            "getMyName",
+            drop_none(
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyName,
+        )
+
+    async def setMyDescription(
+            self,
+            *,
+            description: Optional[str] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "setMyDescription",
+            drop_none(
+                description=description,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyDescription,
+        )
+
+    async def getMyDescription(
+            self,
+            *,
+            language_code: Optional[str] = None,
+    ) -> 'BotDescription':
+        return await self._call(
+            "getMyDescription",
+            drop_none(
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyDescription,
+        )
+
+    async def setMyShortDescription(
+            self,
+            *,
+            short_description: Optional[str] = None,
+            language_code: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "setMyShortDescription",
+            drop_none(
+                short_description=short_description,
+                language_code=language_code,
+            ),
+            None,
+            call_plans.setMyShortDescription,
+        )
+
+    async def getMyShortDescription(
+            self,
+            *,
+            language_code: Optional[str] = None,
+    ) -> 'BotShortDescription':
+        return await self._call(
+            "getMyShortDescription",
+            drop_none(
+                language_code=language_code,
+            ),
+            None,
+            call_plans.getMyShortDescription,
+        )
+
+    async def setChatMenuButton(
+            self,
+            *,
+            chat_id: Optional[int] = None,
+            menu_button: Optional['MenuButton'] = None,
+    ) -> bool:
+        return await self._call(
+            "setChatMenuButton",
+            drop_none(
+                chat_id=chat_id,
+                menu_button=menu_button,
+            ),
+            None,
+            call_plans.setChatMenuButton,
+        )
+
+    async def getChatMenuButton(
+            self,
+            *,
+            chat_id: Optional[int] = None,
+    ) -> 'MenuButton':
+        return await self._call(
+            "getChatMenuButton",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.getChatMenuButton,
+        )
+
+    async def setMyDefaultAdministratorRights(
+            self,
+            *,
+            rights: Optional['ChatAdministratorRights'] = None,
+            for_channels: Optional[bool] = None,
+    ) -> bool:
+        return await self._call(
+            "setMyDefaultAdministratorRights",
+            drop_none(
+                rights=rights,
+                for_channels=for_channels,
+            ),
+            None,
+            call_plans.setMyDefaultAdministratorRights,
+        )
+
+    async def getMyDefaultAdministratorRights(
+            self,
+            *,
+            for_channels: Optional[bool] = None,
+    ) -> 'ChatAdministratorRights':
+        return await self._call(
+            "getMyDefaultAdministratorRights",
+            drop_none(
+                for_channels=for_channels,
+            ),
+            None,
+            call_plans.getMyDefaultAdministratorRights,
+        )
+
+    async def editMessageText(
+            self,
+            *,
+            text: str,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            entities: Optional[List['MessageEntity']] = None,
+            link_preview_options: Optional['LinkPreviewOptions'] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return await self._call(
+            "editMessageText",
+            drop_none(
+                text=text,
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                parse_mode=parse_mode,
+                entities=entities,
+                link_preview_options=link_preview_options,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageText,
+        )
+
+    async def editMessageCaption(
+            self,
+            *,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            caption: Optional[str] = None,
+            parse_mode: Optional[str] = None,
+            caption_entities: Optional[List['MessageEntity']] = None,
+            show_caption_above_media: Optional[bool] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return await self._call(
+            "editMessageCaption",
+            drop_none(
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                show_caption_above_media=show_caption_above_media,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageCaption,
+        )
+
+    async def editMessageMedia(
+            self,
+            *,
+            media: 'InputMedia',
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+            **attachments: 'InputFile',
+    ) -> Union['Message', bool]:
+        return await self._call(
+            "editMessageMedia",
+            drop_none(
+                media=media,
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.editMessageMedia,
+        )
+
+    async def editMessageLiveLocation(
+            self,
+            *,
+            latitude: float,
+            longitude: float,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            live_period: Optional[int] = None,
+            horizontal_accuracy: Optional[float] = None,
+            heading: Optional[int] = None,
+            proximity_alert_radius: Optional[int] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return await self._call(
+            "editMessageLiveLocation",
+            drop_none(
+                latitude=latitude,
+                longitude=longitude,
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                live_period=live_period,
+                horizontal_accuracy=horizontal_accuracy,
+                heading=heading,
+                proximity_alert_radius=proximity_alert_radius,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageLiveLocation,
+        )
+
+    async def stopMessageLiveLocation(
+            self,
+            *,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return await self._call(
+            "stopMessageLiveLocation",
+            drop_none(
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.stopMessageLiveLocation,
+        )
+
+    async def editMessageReplyMarkup(
+            self,
+            *,
+            business_connection_id: Optional[str] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> Union['Message', bool]:
+        return await self._call(
+            "editMessageReplyMarkup",
+            drop_none(
+                business_connection_id=business_connection_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.editMessageReplyMarkup,
+        )
+
+    async def stopPoll(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+            business_connection_id: Optional[str] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> 'Poll':
+        return await self._call(
+            "stopPoll",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+                business_connection_id=business_connection_id,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.stopPoll,
+        )
+
+    async def deleteMessage(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_id: int,
+    ) -> bool:
+        return await self._call(
+            "deleteMessage",
+            drop_none(
+                chat_id=chat_id,
+                message_id=message_id,
+            ),
+            None,
+            call_plans.deleteMessage,
+        )
+
+    async def deleteMessages(
+            self,
+            *,
+            chat_id: Union[int, str],
+            message_ids: List[int],
+    ) -> bool:
+        return await self._call(
+            "deleteMessages",
+            drop_none(
+                chat_id=chat_id,
+                message_ids=message_ids,
+            ),
+            None,
+            call_plans.deleteMessages,
+        )
+
+    async def sendSticker(
+            self,
+            *,
+            chat_id: Union[int, str],
+            sticker: Union['InputFile', str],
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            emoji: Optional[str] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional[Union['InlineKeyboardMarkup', 'ReplyKeyboardMarkup', 'ReplyKeyboardRemove', 'ForceReply']] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendSticker",
+            drop_none(
+                chat_id=chat_id,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                emoji=emoji,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            drop_none(
+                sticker=sticker,
+            ),
+            call_plans.sendSticker,
+        )
+
+    async def getStickerSet(
+            self,
+            *,
+            name: str,
+    ) -> 'StickerSet':
+        return await self._call(
+            "getStickerSet",
+            drop_none(
+                name=name,
+            ),
+            None,
+            call_plans.getStickerSet,
+        )
+
+    async def getCustomEmojiStickers(
+            self,
+            *,
+            custom_emoji_ids: List[str],
+    ) -> List['Sticker']:
+        return await self._call(
+            "getCustomEmojiStickers",
+            drop_none(
+                custom_emoji_ids=custom_emoji_ids,
+            ),
+            None,
+            call_plans.getCustomEmojiStickers,
+        )
+
+    async def uploadStickerFile(
+            self,
+            *,
+            user_id: int,
+            sticker: 'InputFile',
+            sticker_format: str,
+    ) -> 'File':
+        return await self._call(
+            "uploadStickerFile",
+            drop_none(
+                user_id=user_id,
+                sticker_format=sticker_format,
+            ),
+            drop_none(
+                sticker=sticker,
+            ),
+            call_plans.uploadStickerFile,
+        )
+
+    async def createNewStickerSet(
+            self,
+            *,
+            user_id: int,
+            name: str,
+            title: str,
+            stickers: List['InputSticker'],
+            sticker_type: Optional[str] = None,
+            needs_repainting: Optional[bool] = None,
+            **attachments: 'InputFile',
+    ) -> bool:
+        return await self._call(
+            "createNewStickerSet",
+            drop_none(
+                user_id=user_id,
+                name=name,
+                title=title,
+                stickers=stickers,
+                sticker_type=sticker_type,
+                needs_repainting=needs_repainting,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.createNewStickerSet,
+        )
+
+    async def addStickerToSet(
+            self,
+            *,
+            user_id: int,
+            name: str,
+            sticker: 'InputSticker',
+            **attachments: 'InputFile',
+    ) -> bool:
+        return await self._call(
+            "addStickerToSet",
+            drop_none(
+                user_id=user_id,
+                name=name,
+                sticker=sticker,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.addStickerToSet,
+        )
+
+    async def setStickerPositionInSet(
+            self,
+            *,
+            sticker: str,
+            position: int,
+    ) -> bool:
+        return await self._call(
+            "setStickerPositionInSet",
+            drop_none(
+                sticker=sticker,
+                position=position,
+            ),
+            None,
+            call_plans.setStickerPositionInSet,
+        )
+
+    async def deleteStickerFromSet(
+            self,
+            *,
+            sticker: str,
+    ) -> bool:
+        return await self._call(
+            "deleteStickerFromSet",
+            drop_none(
+                sticker=sticker,
+            ),
+            None,
+            call_plans.deleteStickerFromSet,
+        )
+
+    async def replaceStickerInSet(
+            self,
+            *,
+            user_id: int,
+            name: str,
+            old_sticker: str,
+            sticker: 'InputSticker',
+            **attachments: 'InputFile',
+    ) -> bool:
+        return await self._call(
+            "replaceStickerInSet",
+            drop_none(
+                user_id=user_id,
+                name=name,
+                old_sticker=old_sticker,
+                sticker=sticker,
+            ),
+            drop_none(
+                **attachments,
+            ),
+            call_plans.replaceStickerInSet,
+        )
+
+    async def setStickerEmojiList(
+            self,
+            *,
+            sticker: str,
+            emoji_list: List[str],
+    ) -> bool:
+        return await self._call(
+            "setStickerEmojiList",
+            drop_none(
+                sticker=sticker,
+                emoji_list=emoji_list,
+            ),
+            None,
+            call_plans.setStickerEmojiList,
+        )
+
+    async def setStickerKeywords(
+            self,
+            *,
+            sticker: str,
+            keywords: Optional[List[str]] = None,
+    ) -> bool:
+        return await self._call(
+            "setStickerKeywords",
+            drop_none(
+                sticker=sticker,
+                keywords=keywords,
+            ),
+            None,
+            call_plans.setStickerKeywords,
+        )
+
+    async def setStickerMaskPosition(
+            self,
+            *,
+            sticker: str,
+            mask_position: Optional['MaskPosition'] = None,
+    ) -> bool:
+        return await self._call(
+            "setStickerMaskPosition",
+            drop_none(
+                sticker=sticker,
+                mask_position=mask_position,
+            ),
+            None,
+            call_plans.setStickerMaskPosition,
+        )
+
+    async def setStickerSetTitle(
+            self,
+            *,
+            name: str,
+            title: str,
+    ) -> bool:
+        return await self._call(
+            "setStickerSetTitle",
+            drop_none(
+                name=name,
+                title=title,
+            ),
+            None,
+            call_plans.setStickerSetTitle,
+        )
+
+    async def setStickerSetThumbnail(
+            self,
+            *,
+            name: str,
+            user_id: int,
+            format: str,  # noqa
+            thumbnail: Optional[Union['InputFile', str]] = None,
+    ) -> bool:
+        return await self._call(
+            "setStickerSetThumbnail",
+            drop_none(
+                name=name,
+                user_id=user_id,
+                format=format,
+            ),
+            drop_none(
+                thumbnail=thumbnail,
+            ),
+            call_plans.setStickerSetThumbnail,
+        )
+
+    async def setCustomEmojiStickerSetThumbnail(
+            self,
+            *,
+            name: str,
+            custom_emoji_id: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "setCustomEmojiStickerSetThumbnail",
+            drop_none(
+                name=name,
+                custom_emoji_id=custom_emoji_id,
+            ),
+            None,
+            call_plans.setCustomEmojiStickerSetThumbnail,
+        )
+
+    async def deleteStickerSet(
+            self,
+            *,
+            name: str,
+    ) -> bool:
+        return await self._call(
+            "deleteStickerSet",
+            drop_none(
+                name=name,
+            ),
+            None,
+            call_plans.deleteStickerSet,
+        )
+
+    async def sendGift(
+            self,
+            *,
+            gift_id: str,
+            user_id: Optional[int] = None,
+            chat_id: Optional[Union[int, str]] = None,
+            pay_for_upgrade: Optional[bool] = None,
+            text: Optional[str] = None,
+            text_parse_mode: Optional[str] = None,
+            text_entities: Optional[List['MessageEntity']] = None,
+    ) -> bool:
+        return await self._call(
+            "sendGift",
+            drop_none(
+                gift_id=gift_id,
+                user_id=user_id,
+                chat_id=chat_id,
+                pay_for_upgrade=pay_for_upgrade,
+                text=text,
+                text_parse_mode=text_parse_mode,
+                text_entities=text_entities,
+            ),
+            None,
+            call_plans.sendGift,
+        )
+
+    async def verifyUser(
+            self,
+            *,
+            user_id: int,
+            custom_description: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "verifyUser",
+            drop_none(
+                user_id=user_id,
+                custom_description=custom_description,
+            ),
+            None,
+            call_plans.verifyUser,
+        )
+
+    async def verifyChat(
+            self,
+            *,
+            chat_id: Union[int, str],
+            custom_description: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "verifyChat",
+            drop_none(
+                chat_id=chat_id,
+                custom_description=custom_description,
+            ),
+            None,
+            call_plans.verifyChat,
+        )
+
+    async def removeUserVerification(
+            self,
+            *,
+            user_id: int,
+    ) -> bool:
+        return await self._call(
+            "removeUserVerification",
+            drop_none(
+                user_id=user_id,
+            ),
+            None,
+            call_plans.removeUserVerification,
+        )
+
+    async def removeChatVerification(
+            self,
+            *,
+            chat_id: Union[int, str],
+    ) -> bool:
+        return await self._call(
+            "removeChatVerification",
+            drop_none(
+                chat_id=chat_id,
+            ),
+            None,
+            call_plans.removeChatVerification,
+        )
+
+    async def answerInlineQuery(
+            self,
+            *,
+            inline_query_id: str,
+            results: List['InlineQueryResult'],
+            cache_time: Optional[int] = None,
+            is_personal: Optional[bool] = None,
+            next_offset: Optional[str] = None,
+            button: Optional['InlineQueryResultsButton'] = None,
+    ) -> bool:
+        return await self._call(
+            "answerInlineQuery",
+            drop_none(
+                inline_query_id=inline_query_id,
+                results=results,
+                cache_time=cache_time,
+                is_personal=is_personal,
+                next_offset=next_offset,
+                button=button,
+            ),
+            None,
+            call_plans.answerInlineQuery,
+        )
+
+    async def answerWebAppQuery(
+            self,
+            *,
+            web_app_query_id: str,
+            result: 'InlineQueryResult',
+    ) -> 'SentWebAppMessage':
+        return await self._call(
+            "answerWebAppQuery",
+            drop_none(
+                web_app_query_id=web_app_query_id,
+                result=result,
+            ),
+            None,
+            call_plans.answerWebAppQuery,
+        )
+
+    async def savePreparedInlineMessage(
+            self,
+            *,
+            user_id: int,
+            result: 'InlineQueryResult',
+            allow_user_chats: Optional[bool] = None,
+            allow_bot_chats: Optional[bool] = None,
+            allow_group_chats: Optional[bool] = None,
+            allow_channel_chats: Optional[bool] = None,
+    ) -> 'PreparedInlineMessage':
+        return await self._call(
+            "savePreparedInlineMessage",
+            drop_none(
+                user_id=user_id,
+                result=result,
+                allow_user_chats=allow_user_chats,
+                allow_bot_chats=allow_bot_chats,
+                allow_group_chats=allow_group_chats,
+                allow_channel_chats=allow_channel_chats,
+            ),
+            None,
+            call_plans.savePreparedInlineMessage,
+        )
+
+    async def sendInvoice(
+            self,
+            *,
+            chat_id: Union[int, str],
+            title: str,
+            description: str,
+            payload: str,
+            currency: str,
+            prices: List['LabeledPrice'],
+            message_thread_id: Optional[int] = None,
+            provider_token: Optional[str] = None,
+            max_tip_amount: Optional[int] = None,
+            suggested_tip_amounts: Optional[List[int]] = None,
+            start_parameter: Optional[str] = None,
+            provider_data: Optional[str] = None,
+            photo_url: Optional[str] = None,
+            photo_size: Optional[int] = None,
+            photo_width: Optional[int] = None,
+            photo_height: Optional[int] = None,
+            need_name: Optional[bool] = None,
+            need_phone_number: Optional[bool] = None,
+            need_email: Optional[bool] = None,
+            need_shipping_address: Optional[bool] = None,
+            send_phone_number_to_provider: Optional[bool] = None,
+            send_email_to_provider: Optional[bool] = None,
+            is_flexible: Optional[bool] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendInvoice",
+            drop_none(
+                chat_id=chat_id,
+                title=title,
+                description=description,
+                payload=payload,
+                currency=currency,
+                prices=prices,
+                message_thread_id=message_thread_id,
+                provider_token=provider_token,
+                max_tip_amount=max_tip_amount,
+                suggested_tip_amounts=suggested_tip_amounts,
+                start_parameter=start_parameter,
+                provider_data=provider_data,
+                photo_url=photo_url,
+                photo_size=photo_size,
+                photo_width=photo_width,
+                photo_height=photo_height,
+                need_name=need_name,
+                need_phone_number=need_phone_number,
+                need_email=need_email,
+                need_shipping_address=need_shipping_address,
+                send_phone_number_to_provider=send_phone_number_to_provider,
+                send_email_to_provider=send_email_to_provider,
+                is_flexible=is_flexible,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendInvoice,
+        )
+
+    async def createInvoiceLink(
+            self,
+            *,
+            title: str,
+            description: str,
+            payload: str,
+            currency: str,
+            prices: List['LabeledPrice'],
+            business_connection_id: Optional[str] = None,
+            provider_token: Optional[str] = None,
+            subscription_period: Optional[int] = None,
+            max_tip_amount: Optional[int] = None,
+            suggested_tip_amounts: Optional[List[int]] = None,
+            provider_data: Optional[str] = None,
+            photo_url: Optional[str] = None,
+            photo_size: Optional[int] = None,
+            photo_width: Optional[int] = None,
+            photo_height: Optional[int] = None,
+            need_name: Optional[bool] = None,
+            need_phone_number: Optional[bool] = None,
+            need_email: Optional[bool] = None,
+            need_shipping_address: Optional[bool] = None,
+            send_phone_number_to_provider: Optional[bool] = None,
+            send_email_to_provider: Optional[bool] = None,
+            is_flexible: Optional[bool] = None,
+    ) -> str:
+        return await self._call(
+            "createInvoiceLink",
+            drop_none(
+                title=title,
+                description=description,
+                payload=payload,
+                currency=currency,
+                prices=prices,
+                business_connection_id=business_connection_id,
+                provider_token=provider_token,
+                subscription_period=subscription_period,
+                max_tip_amount=max_tip_amount,
+                suggested_tip_amounts=suggested_tip_amounts,
+                provider_data=provider_data,
+                photo_url=photo_url,
+                photo_size=photo_size,
+                photo_width=photo_width,
+                photo_height=photo_height,
+                need_name=need_name,
+                need_phone_number=need_phone_number,
+                need_email=need_email,
+                need_shipping_address=need_shipping_address,
+                send_phone_number_to_provider=send_phone_number_to_provider,
+                send_email_to_provider=send_email_to_provider,
+                is_flexible=is_flexible,
+            ),
+            None,
+            call_plans.createInvoiceLink,
+        )
+
+    async def answerShippingQuery(
+            self,
+            *,
+            shipping_query_id: str,
+            ok: bool,
+            shipping_options: Optional[List['ShippingOption']] = None,
+            error_message: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "answerShippingQuery",
+            drop_none(
+                shipping_query_id=shipping_query_id,
+                ok=ok,
+                shipping_options=shipping_options,
+                error_message=error_message,
+            ),
+            None,
+            call_plans.answerShippingQuery,
+        )
+
+    async def answerPreCheckoutQuery(
+            self,
+            *,
+            pre_checkout_query_id: str,
+            ok: bool,
+            error_message: Optional[str] = None,
+    ) -> bool:
+        return await self._call(
+            "answerPreCheckoutQuery",
+            drop_none(
+                pre_checkout_query_id=pre_checkout_query_id,
+                ok=ok,
+                error_message=error_message,
+            ),
+            None,
+            call_plans.answerPreCheckoutQuery,
+        )
+
+    async def getStarTransactions(
+            self,
+            *,
+            offset: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> 'StarTransactions':
+        return await self._call(
+            "getStarTransactions",
+            drop_none(
+                offset=offset,
+                limit=limit,
+            ),
+            None,
+            call_plans.getStarTransactions,
+        )
+
+    async def refundStarPayment(
+            self,
+            *,
+            user_id: int,
+            telegram_payment_charge_id: str,
+    ) -> bool:
+        return await self._call(
+            "refundStarPayment",
+            drop_none(
+                user_id=user_id,
+                telegram_payment_charge_id=telegram_payment_charge_id,
+            ),
+            None,
+            call_plans.refundStarPayment,
+        )
+
+    async def editUserStarSubscription(
+            self,
+            *,
+            user_id: int,
+            telegram_payment_charge_id: str,
+            is_canceled: bool,
+    ) -> bool:
+        return await self._call(
+            "editUserStarSubscription",
+            drop_none(
+                user_id=user_id,
+                telegram_payment_charge_id=telegram_payment_charge_id,
+                is_canceled=is_canceled,
+            ),
+            None,
+            call_plans.editUserStarSubscription,
+        )
+
+    async def setPassportDataErrors(
+            self,
+            *,
+            user_id: int,
+            errors: List['PassportElementError'],
+    ) -> bool:
+        return await self._call(
+            "setPassportDataErrors",
+            drop_none(
+                user_id=user_id,
+                errors=errors,
+            ),
+            None,
+            call_plans.setPassportDataErrors,
+        )
+
+    async def sendGame(
+            self,
+            *,
+            chat_id: int,
+            game_short_name: str,
+            business_connection_id: Optional[str] = None,
+            message_thread_id: Optional[int] = None,
+            disable_notification: Optional[bool] = None,
+            protect_content: Optional[bool] = None,
+            allow_paid_broadcast: Optional[bool] = None,
+            message_effect_id: Optional[str] = None,
+            reply_parameters: Optional['ReplyParameters'] = None,
+            reply_markup: Optional['InlineKeyboardMarkup'] = None,
+    ) -> 'Message':
+        return await self._call(
+            "sendGame",
+            drop_none(
+                chat_id=chat_id,
+                game_short_name=game_short_name,
+                business_connection_id=business_connection_id,
+                message_thread_id=message_thread_id,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                message_effect_id=message_effect_id,
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            None,
+            call_plans.sendGame,
+        )
+
+    async def setGameScore(
+            self,
+            *,
+            user_id: int,
+            score: int,
+            force: Optional[bool] = None,
+            disable_edit_message: Optional[bool] = None,
+            chat_id: Optional[int] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+    ) -> Union['Message', bool]:
+        return await self._call(
+            "setGameScore",
+            drop_none(
+                user_id=user_id,
+                score=score,
+                force=force,
+                disable_edit_message=disable_edit_message,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+            ),
+            None,
+            call_plans.setGameScore,
+        )
+
+    async def getGameHighScores(
+            self,
+            *,
+            user_id: int,
+            chat_id: Optional[int] = None,
+            message_id: Optional[int] = None,
+            inline_message_id: Optional[str] = None,
+    ) -> List['GameHighScore']:
+        return await self._call(
+            "getGameHighScores",
+            drop_none(
+                user_id=user_id,
+                chat_id=chat_id,
+                message_id=message_id,
+                inline_message_id=inline_message_id,
+            ),
+            None,
+            call_plans.getGameHighScores,
+        )
+
+# EOF
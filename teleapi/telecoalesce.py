@@ -0,0 +1,94 @@
+import asyncio
+import json
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Hashable, Optional
+
+from teleapi.telemethods import METHODS
+from teleapi.telemiddleware import ApiCall, Handler, HandlerAsync
+
+# Single-flight middlewares: identical concurrent calls of read-only methods
+# share one request in flight, all callers get the same parsed result object.
+
+
+def is_read_only(api_method_name: str) -> bool:
+    info = METHODS.get(api_method_name)
+    return info is not None and info.read_only
+
+
+def call_key(call: ApiCall) -> Hashable:
+    return call.api_method_name, json.dumps(call.params, sort_keys=True, default=str)
+
+
+class SingleFlight:
+    """Thread-safe single-flight middleware for TeleProxy"""
+
+    def __init__(self, coalesce: Optional[Callable[[str], bool]] = None):
+        """
+        :param coalesce: predicate on api method name, read-only methods by default
+        """
+        self.coalesce = is_read_only if coalesce is None else coalesce
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+
+    def __call__(self, call: ApiCall, call_next: Handler):
+        if call.files or not self.coalesce(call.api_method_name):
+            return call_next(call)
+
+        key = call_key(call)
+        with self._lock:
+            f = self._in_flight.get(key)
+            leader = f is None
+            if leader:
+                f = self._in_flight[key] = Future()
+
+        if not leader:
+            return f.result()
+
+        try:
+            result = call_next(call)
+        except BaseException as e:
+            f.set_exception(e)
+            raise
+        else:
+            f.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+def _retrieve(t: asyncio.Future):
+    # avoid "exception was never retrieved" warning if all callers were cancelled
+    if not t.cancelled():
+        t.exception()
+
+
+class SingleFlightAsync:
+    """
+    Single-flight middleware for TeleProxyAsync. Shared request runs in its own task,
+    so it's not cancelled with any of its callers, including the first one.
+    """
+
+    def __init__(self, coalesce: Optional[Callable[[str], bool]] = None):
+        """
+        :param coalesce: predicate on api method name, read-only methods by default
+        """
+        self.coalesce = is_read_only if coalesce is None else coalesce
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def __call__(self, call: ApiCall, call_next: HandlerAsync):
+        if call.files or not self.coalesce(call.api_method_name):
+            return await call_next(call)
+
+        key = call_key(call)
+        t = self._in_flight.get(key)
+        if t is None:
+            t = self._in_flight[key] = asyncio.ensure_future(call_next(call))
+            t.add_done_callback(lambda _: self._done(key, t))
+        return await asyncio.shield(t)
+
+    def _done(self, key: Hashable, t: asyncio.Future):
+        if self._in_flight.get(key) is t:
+            del self._in_flight[key]
+        _retrieve(t)
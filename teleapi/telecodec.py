@@ -0,0 +1,73 @@
+import json
+from typing import Any, Protocol, Union
+
+
+class JsonCodec(Protocol):
+    def dumps(self, o: Any) -> str:
+        pass
+
+    def loads(self, s: Union[bytes, str]) -> Any:
+        pass
+
+
+class StdlibJsonCodec:
+    def dumps(self, o: Any) -> str:
+        return json.dumps(o)
+
+    def loads(self, s: Union[bytes, str]) -> Any:
+        return json.loads(s)
+
+
+class OrjsonCodec:
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, o: Any) -> str:
+        return self._dumps(o).decode()
+
+    def loads(self, s: Union[bytes, str]) -> Any:
+        return self._loads(s)
+
+
+class MsgspecCodec:
+    def __init__(self):
+        import msgspec
+
+        self._encode = msgspec.json.encode
+        self._decode = msgspec.json.decode
+
+    def dumps(self, o: Any) -> str:
+        return self._encode(o).decode()
+
+    def loads(self, s: Union[bytes, str]) -> Any:
+        return self._decode(s)
+
+
+class PydanticCoreCodec:
+    def __init__(self):
+        import pydantic_core
+
+        self._to_json = pydantic_core.to_json
+        self._from_json = pydantic_core.from_json
+
+    def dumps(self, o: Any) -> str:
+        return self._to_json(o).decode()
+
+    def loads(self, s: Union[bytes, str]) -> Any:
+        return self._from_json(s)
+
+
+def detect_codec() -> JsonCodec:
+    """The fastest of available codecs, stdlib json if none of optional libs is installed"""
+    for codec in [OrjsonCodec, MsgspecCodec, PydanticCoreCodec]:
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return StdlibJsonCodec()
+
+
+default_codec = detect_codec()
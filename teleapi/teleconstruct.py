@@ -0,0 +1,158 @@
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, Union, get_type_hints
+
+import pydantic
+from pydantic import BaseModel
+
+# Build models from trusted data (i.e. responses of Telegram Bot API server) with no validation.
+# Nested models, aliases and unions are resolved, but no type coercion is done.
+
+if pydantic.__version__.split(".")[0] == "1":
+
+    def model_fields(m) -> Dict[str, Optional[str]]:
+        return {name: f.alias for name, f in m.__fields__.items()}
+
+    def _construct(m, values: dict):
+        return m.construct(**values)
+
+else:
+
+    def model_fields(m) -> Dict[str, Optional[str]]:
+        return {name: f.alias for name, f in m.model_fields.items()}
+
+    def _construct(m, values: dict):
+        return m.model_construct(**values)
+
+
+Constructor = Callable[[Any], Any]
+
+_constructors: Dict[Any, Optional[Constructor]] = {}
+
+
+def is_model(t) -> bool:
+    return isinstance(t, type) and issubclass(t, BaseModel)
+
+
+class _ModelConstructor:
+    def __init__(self, model):
+        self.model = model
+        self._fields: Optional[Dict[str, Tuple[str, Optional[Constructor]]]] = None
+
+    def _compile(self) -> Dict[str, Tuple[str, Optional[Constructor]]]:
+        # done on first call, not in __init__, because models are recursive
+        hints = get_type_hints(self.model)
+        return {(alias or name): (name, constructor(hints[name])) for name, alias in model_fields(self.model).items()}
+
+    def __call__(self, data):
+        if not isinstance(data, dict):
+            return data
+
+        fields = self._fields
+        if fields is None:
+            fields = self._fields = self._compile()
+
+        values = {}
+        for k, v in data.items():
+            try:
+                name, c = fields[k]
+            except KeyError:
+                continue  # extra fields are ignored, as pydantic does
+            values[name] = v if c is None or v is None else c(v)
+        return _construct(self.model, values)
+
+
+def _list_constructor(c: Constructor) -> Constructor:
+    def construct(data):
+        return [c(o) for o in data]
+
+    return construct
+
+
+def _tag(model) -> Optional[Tuple[str, str]]:
+    """Field name and value of Literal tag field of model, if any"""
+    for name, t in get_type_hints(model).items():
+        if getattr(t, "__origin__", None) is Literal and len(t.__args__) == 1 and name in model_fields(model):
+            return name, t.__args__[0]
+    return None
+
+
+def _union_constructor(t) -> Optional[Constructor]:
+    members = [a for a in t.__args__ if a is not type(None)]
+    if len(members) == 1:
+        # Optional[...]
+        return constructor(members[0])
+
+    constructors = [c for c in map(constructor, members) if c is not None]
+    if not constructors:
+        return None  # scalars only
+
+    models = [a for a in members if is_model(a)]
+    if len(constructors) == 1:
+        # one member is built from list or dict, scalar members are used as is
+        c = constructors[0]
+        if models:
+            return c
+
+        def construct_nested(data):
+            return c(data) if isinstance(data, (list, dict)) else data
+
+        return construct_nested
+
+    # imported here, because teleproxy imports this module
+    from teleapi.teleproxy import validator
+
+    if len(constructors) > len(models):
+        # no way to tell list members from each other or from models
+        return validator(t)
+
+    tags = [_tag(m) for m in models]
+    # the same as discriminator of ApiUnion in apigen: the same field, distinct values
+    if all(tags) and len({name for name, _ in tags}) == 1 and len({value for _, value in tags}) == len(tags):
+        tag_name = tags[0][0]
+        by_tag = {value: constructor(m) for (_, value), m in zip(tags, models)}
+        validate = validator(t)
+
+        def construct(data):
+            if not isinstance(data, dict):
+                return data
+            member = by_tag.get(data.get(tag_name))
+            # unknown tag, i.e. of member added to api later, fails as it does with validation
+            return validate(data) if member is None else member(data)
+
+        return construct
+
+    # no way to choose union member without validation
+    return validator(t)
+
+
+def _compile(t) -> Optional[Constructor]:
+    if is_model(t):
+        return _ModelConstructor(t)
+
+    if getattr(t, "__metadata__", None) is not None:
+        # Annotated, i.e. discriminated union
+        return constructor(t.__origin__)
+
+    origin = getattr(t, "__origin__", None)
+    if origin is list:
+        c = constructor(t.__args__[0])
+        return None if c is None else _list_constructor(c)
+    if origin is Union:
+        return _union_constructor(t)
+
+    return None
+
+
+def constructor(t) -> Optional[Constructor]:
+    """
+    Constructor of type t from trusted data, or None if data is used as is (scalars).
+    """
+    try:
+        return _constructors[t]
+    except KeyError:
+        c = _constructors[t] = _compile(t)
+        return c
+
+
+def construct_as(t, o):
+    c = constructor(t)
+    return o if c is None or o is None else c(o)
@@ -0,0 +1,125 @@
+import re
+import sqlite3
+from collections import deque
+from threading import Lock
+from typing import Deque, Optional, Protocol, Set
+
+# De-duplication of updates by update_id within a bounded window of recent updates:
+# Telegram redelivers webhooks if response is slow, restarted poller gets updates
+# which were not confirmed by offset yet. Updates are checked before being parsed,
+# webhook body is only searched for update_id. Ingestion paths commit update as seen
+# only once it's handled or accepted, so updates lost on the way are not skipped when redelivered.
+
+_UPDATE_ID = re.compile(rb'"update_id"\s*:\s*(\d+)')
+
+
+def peek_update_id(body: bytes) -> Optional[int]:
+    """update_id of raw update with no parsing, it's the first field of updates sent by Telegram"""
+    m = _UPDATE_ID.search(body)
+    return int(m.group(1)) if m is not None else None
+
+
+class Dedup(Protocol):
+    def check(self, update_id: int) -> bool:
+        """Whether update was committed as seen before"""
+        pass
+
+    def commit(self, update_id: int):
+        """Remember update as seen"""
+        pass
+
+    def seen(self, update_id: int) -> bool:
+        """Whether update was seen before, then it's remembered as seen"""
+        pass
+
+
+class UpdateDedup:
+    """In-memory window of the last `maxlen` update ids, ring buffer plus set"""
+
+    def __init__(self, maxlen: int = 10000):
+        self.maxlen = maxlen
+        self.duplicates = 0
+        self._ring: Deque[int] = deque()
+        self._ids: Set[int] = set()
+        self._lock = Lock()
+
+    def check(self, update_id: int) -> bool:
+        with self._lock:
+            return self._check(update_id)
+
+    def commit(self, update_id: int):
+        with self._lock:
+            self._commit(update_id)
+
+    def seen(self, update_id: int) -> bool:
+        with self._lock:
+            if self._check(update_id):
+                return True
+            self._commit(update_id)
+            return False
+
+    def _check(self, update_id: int) -> bool:
+        if update_id in self._ids:
+            self.duplicates += 1
+            return True
+        return False
+
+    def _commit(self, update_id: int):
+        if update_id in self._ids:
+            return
+        if len(self._ring) >= self.maxlen:
+            self._ids.discard(self._ring.popleft())
+        self._ring.append(update_id)
+        self._ids.add(update_id)
+
+
+class SqliteUpdateDedup:
+    """
+    Persistent window of update ids, to survive restarts. Ids more than `maxlen`
+    below the greatest one are removed every `maxlen // 10` new ids.
+    """
+
+    def __init__(self, path: str, maxlen: int = 100000):
+        self.maxlen = maxlen
+        self.duplicates = 0
+        self._inserted = 0
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS teleapi_updates (update_id INTEGER PRIMARY KEY)")
+
+    def check(self, update_id: int) -> bool:
+        with self._lock:
+            cursor = self._db.execute("SELECT 1 FROM teleapi_updates WHERE update_id = ?", (update_id,))
+            if cursor.fetchone() is None:
+                return False
+            self.duplicates += 1
+            return True
+
+    def commit(self, update_id: int):
+        with self._lock:
+            self._commit(update_id)
+
+    def seen(self, update_id: int) -> bool:
+        with self._lock:
+            if self._commit(update_id):
+                return False
+            self.duplicates += 1
+            return True
+
+    def _commit(self, update_id: int) -> bool:
+        """Whether update is new"""
+        cursor = self._db.execute("INSERT OR IGNORE INTO teleapi_updates VALUES (?)", (update_id,))
+        if not cursor.rowcount:
+            return False
+        self._inserted += 1
+        if self._inserted >= max(self.maxlen // 10, 1):
+            self._inserted = 0
+            self._db.execute(
+                "DELETE FROM teleapi_updates WHERE update_id < (SELECT MAX(update_id) FROM teleapi_updates) - ?",
+                (self.maxlen,),
+            )
+        return True
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,209 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterable, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from teleapi.telereply import WebhookReply, _current_reply
+
+# Concurrent handling of updates on bounded pool of asyncio workers.
+# Updates of the same chat are handled one by one in order of arrival,
+# updates of different chats are handled concurrently, chats are served round-robin.
+# Updates are accepted up to `max_pending` not yet handled ones, then put() waits,
+# which slows down the poller or webhook receiver feeding the dispatcher.
+# Reply context of webhook request (see telereply) is passed along with update to its handler.
+
+# Optional fields of Update, one of which is present in any update
+UPDATE_KINDS = (
+    "message",
+    "edited_message",
+    "channel_post",
+    "edited_channel_post",
+    "business_connection",
+    "business_message",
+    "edited_business_message",
+    "deleted_business_messages",
+    "message_reaction",
+    "message_reaction_count",
+    "inline_query",
+    "chosen_inline_result",
+    "callback_query",
+    "shipping_query",
+    "pre_checkout_query",
+    "purchased_paid_media",
+    "poll",
+    "poll_answer",
+    "my_chat_member",
+    "chat_member",
+    "chat_join_request",
+    "chat_boost",
+    "removed_chat_boost",
+)
+
+Handler = Callable[[Any], Awaitable[Any]]
+OnError = Callable[[Any, Exception], Any]
+
+
+def _field(o: Any, name: str) -> Any:
+    """Field of model (or lazy model) or of raw dict, by name used in Bot API"""
+    if o is None:
+        return None
+    if isinstance(o, dict):
+        return o.get(name)
+    return getattr(o, "from_" if name == "from" else name, None)
+
+
+def update_kind(update: Any) -> Optional[str]:
+    """Name of the present optional field of Update, i.e. "message" or "callback_query" """
+    if isinstance(update, dict):
+        return next((k for k in update if k != "update_id"), None)
+    return next((k for k in UPDATE_KINDS if getattr(update, k, None) is not None), None)
+
+
+def chat_key(update: Any) -> Optional[int]:
+    """
+    Id of chat (or user, if there's no chat) the update belongs to, works with
+    Update models, lazy models and raw dicts. Poll updates belong to no chat.
+    """
+    kind = update_kind(update)
+    if kind is None:
+        return None
+    o = _field(update, kind)
+    chat = _field(o, "chat") or _field(_field(o, "message"), "chat")
+    if chat is not None:
+        return _field(chat, "id")
+    user_chat_id = _field(o, "user_chat_id")
+    if user_chat_id is not None:
+        return user_chat_id
+    owner = _field(o, "from") or _field(o, "user") or _field(o, "voter_chat")
+    return _field(owner, "id")
+
+
+class Dispatcher:
+    """
+    Use `await dispatcher.put(update)` to dispatch updates one by one,
+    or `await dispatcher.run(proxy.aiter_updates())` to dispatch a stream.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        concurrency: int = 16,
+        max_pending: int = 1000,
+        key: Callable[[Any], Optional[Hashable]] = chat_key,
+        on_error: Optional[OnError] = None,
+    ):
+        """
+        :param key: updates with the same key are handled in order, updates with None key in no order.
+        :param on_error: called with update and exception raised by handler.
+        """
+        self.handler = handler
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self.key = key
+        self.on_error = on_error
+        self.pending = 0
+        self.in_flight = 0
+        self.handled = 0
+        self.errors = 0
+        self._queues: Dict[Hashable, Deque[Tuple[Any, Optional[WebhookReply]]]] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+
+    def _start(self):
+        self._ready = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._workers = [asyncio.get_running_loop().create_task(self._work()) for _ in range(self.concurrency)]
+
+    async def put(self, update: Any):
+        """Returns once update is accepted, handling is done by workers"""
+        if self._ready is None:
+            self._start()
+        key = self.key(update)
+        if key is None:
+            key = object()
+        await self._slots.acquire()
+        reply = _current_reply.get()
+        if reply is not None:
+            reply.defer()
+        self.pending += 1
+        self._idle.clear()
+        queue = self._queues.get(key)
+        if queue is None:
+            self._queues[key] = deque([(update, reply)])
+            self._ready.put_nowait(key)
+        else:
+            queue.append((update, reply))
+
+    async def _work(self):
+        while True:
+            key = await self._ready.get()
+            queue = self._queues[key]
+            update, reply = queue.popleft()
+            self.in_flight += 1
+            token = _current_reply.set(reply)
+            try:
+                await self.handler(update)
+            except Exception as e:
+                self.errors += 1
+                if self.on_error is not None:
+                    try:
+                        self.on_error(update, e)
+                    except Exception:
+                        pass  # worker must survive broken error handler
+            finally:
+                _current_reply.reset(token)
+                if reply is not None:
+                    reply.close()
+                self.in_flight -= 1
+                self.pending -= 1
+                self.handled += 1
+                self._slots.release()
+                if queue:
+                    # to the end of line, so chats with many updates don't starve others
+                    self._ready.put_nowait(key)
+                else:
+                    del self._queues[key]
+                if not self.pending:
+                    self._idle.set()
+
+    async def run(self, updates: AsyncIterable[Any]):
+        """Dispatch all updates of the stream, then wait until they are handled"""
+        async for update in updates:
+            await self.put(update)
+        await self.join()
+
+    async def join(self):
+        """Wait until all accepted updates are handled"""
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def close(self):
+        """Stop workers, updates not yet handled are dropped"""
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queues.clear()
+        self._ready = None
+
+    def stats(self) -> Dict[str, int]:
+        """Pending are accepted updates not yet handled, including in flight ones"""
+        return {
+            "pending": self.pending,
+            "in_flight": self.in_flight,
+            "queues": len(self._queues),
+            "max_queue": max(map(len, list(self._queues.values())), default=0),
+            "handled": self.handled,
+            "errors": self.errors,
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if exc_info[0] is None:
+            await self.join()
+        await self.close()
@@ -0,0 +1,119 @@
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_type_hints
+
+from pydantic import BaseModel
+
+from teleapi.teleconstruct import is_model, model_fields
+
+# Lazy view of models over raw response data. Fields are validated on first
+# access and cached on instance, nested models are lazy too, so only fields
+# which are actually used are validated.
+
+Converter = Callable[[Any], Any]
+
+_converters: Dict[Any, Converter] = {}
+_fields: Dict[Any, Dict[str, Tuple[str, Converter]]] = {}
+
+
+def _lazy_model(model) -> Converter:
+    def convert(data):
+        if not isinstance(data, dict):
+            return data
+        return LazyModel(model, data)
+
+    return convert
+
+
+def _lazy_list(c: Converter) -> Converter:
+    def convert(data):
+        return [c(o) for o in data]
+
+    return convert
+
+
+def _optional(c: Converter) -> Converter:
+    def convert(data):
+        return None if data is None else c(data)
+
+    return convert
+
+
+def _compile(t) -> Converter:
+    from teleapi.teleproxy import validator
+
+    if is_model(t):
+        return _lazy_model(t)
+
+    origin = getattr(t, "__origin__", None)
+    if origin is list and is_model(t.__args__[0]):
+        return _lazy_list(converter(t.__args__[0]))
+    if origin is Union:
+        members = [a for a in t.__args__ if a is not type(None)]
+        if len(members) == 1 and len(t.__args__) == 2:
+            return _optional(converter(members[0]))
+
+    return validator(t)
+
+
+def converter(t) -> Converter:
+    try:
+        return _converters[t]
+    except KeyError:
+        c = _converters[t] = _compile(t)
+        return c
+
+
+def _model_lazy_fields(model) -> Dict[str, Tuple[str, Converter]]:
+    try:
+        return _fields[model]
+    except KeyError:
+        hints = get_type_hints(model)
+        fields = _fields[model] = {
+            name: (alias or name, converter(hints[name])) for name, alias in model_fields(model).items()
+        }
+        return fields
+
+
+class LazyModel:
+    """
+    Lazy view of pydantic model over raw dict.
+    Fields are validated on first access and then cached on instance.
+    """
+
+    def __init__(self, model, raw: dict):
+        self.__dict__["_model"] = model
+        self.__dict__["_raw"] = raw
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            key, c = _model_lazy_fields(self._model)[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = self._raw.get(key)
+        value = c(value) if value is not None else None
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        raise TypeError(f"{self._model.__name__} lazy view is immutable")
+
+    def __eq__(self, other):
+        if isinstance(other, LazyModel):
+            return self._model is other._model and self._raw == other._raw
+        if isinstance(other, BaseModel):
+            return self.to_model() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Lazy{self._model.__name__}({self._raw!r})"
+
+    def to_model(self) -> BaseModel:
+        """Fully validated model"""
+        from teleapi.teleproxy import validate_model
+
+        return validate_model(self._model, self._raw)
+
+
+def lazy_as(t, o: Optional[Any]):
+    return None if o is None else converter(t)(o)
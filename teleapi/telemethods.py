@@ -0,0 +1,1363 @@
+from typing import Dict, NamedTuple, Tuple
+
+
+class ApiMethodInfo(NamedTuple):
+    """
+    Classification of api method: read_only methods don't change anything,
+    idempotent ones can be safely repeated, upload ones can take files,
+    bulk ones take a list of identifiers to process many objects at once.
+    Limits are (min, max) of length or value of params, taken from docs.
+    """
+
+    name: str
+    return_type: str
+    read_only: bool
+    idempotent: bool
+    upload: bool
+    bulk: bool
+    file_params: Tuple[str, ...]
+    limits: Dict[str, Tuple[int, int]]
+
+
+METHODS: Dict[str, ApiMethodInfo] = {
+    "getUpdates": ApiMethodInfo(
+        name='getUpdates',
+        return_type="List['Update']",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'limit': (1, 100)},
+    ),
+    "setWebhook": ApiMethodInfo(
+        name='setWebhook',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=True,
+        bulk=False,
+        file_params=('certificate',),
+        limits={'max_connections': (1, 100), 'secret_token': (1, 256)},
+    ),
+    "deleteWebhook": ApiMethodInfo(
+        name='deleteWebhook',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getWebhookInfo": ApiMethodInfo(
+        name='getWebhookInfo',
+        return_type="'WebhookInfo'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getMe": ApiMethodInfo(
+        name='getMe',
+        return_type="'User'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "logOut": ApiMethodInfo(
+        name='logOut',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "close": ApiMethodInfo(
+        name='close',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "sendMessage": ApiMethodInfo(
+        name='sendMessage',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'text': (1, 4096)},
+    ),
+    "forwardMessage": ApiMethodInfo(
+        name='forwardMessage',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "forwardMessages": ApiMethodInfo(
+        name='forwardMessages',
+        return_type="List['MessageId']",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=True,
+        file_params=(),
+        limits={'message_ids': (1, 100)},
+    ),
+    "copyMessage": ApiMethodInfo(
+        name='copyMessage',
+        return_type="'MessageId'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'caption': (0, 1024)},
+    ),
+    "copyMessages": ApiMethodInfo(
+        name='copyMessages',
+        return_type="List['MessageId']",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=True,
+        file_params=(),
+        limits={'message_ids': (1, 100)},
+    ),
+    "sendPhoto": ApiMethodInfo(
+        name='sendPhoto',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('photo',),
+        limits={'caption': (0, 1024)},
+    ),
+    "sendAudio": ApiMethodInfo(
+        name='sendAudio',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('audio', 'thumbnail'),
+        limits={'caption': (0, 1024)},
+    ),
+    "sendDocument": ApiMethodInfo(
+        name='sendDocument',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('document', 'thumbnail'),
+        limits={'caption': (0, 1024)},
+    ),
+    "sendVideo": ApiMethodInfo(
+        name='sendVideo',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('video', 'thumbnail', 'cover'),
+        limits={'caption': (0, 1024)},
+    ),
+    "sendAnimation": ApiMethodInfo(
+        name='sendAnimation',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('animation', 'thumbnail'),
+        limits={'caption': (0, 1024)},
+    ),
+    "sendVoice": ApiMethodInfo(
+        name='sendVoice',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('voice',),
+        limits={'caption': (0, 1024)},
+    ),
+    "sendVideoNote": ApiMethodInfo(
+        name='sendVideoNote',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('video_note', 'thumbnail'),
+        limits={},
+    ),
+    "sendPaidMedia": ApiMethodInfo(
+        name='sendPaidMedia',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=(),
+        limits={'star_count': (1, 2500), 'payload': (0, 128), 'caption': (0, 1024)},
+    ),
+    "sendMediaGroup": ApiMethodInfo(
+        name='sendMediaGroup',
+        return_type="List['Message']",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=(),
+        limits={'media': (2, 10)},
+    ),
+    "sendLocation": ApiMethodInfo(
+        name='sendLocation',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'horizontal_accuracy': (0, 1500)},
+    ),
+    "sendVenue": ApiMethodInfo(
+        name='sendVenue',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "sendContact": ApiMethodInfo(
+        name='sendContact',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'vcard': (0, 2048)},
+    ),
+    "sendPoll": ApiMethodInfo(
+        name='sendPoll',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'question': (1, 300), 'options': (2, 10), 'explanation': (0, 200), 'open_period': (5, 600)},
+    ),
+    "sendDice": ApiMethodInfo(
+        name='sendDice',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "sendChatAction": ApiMethodInfo(
+        name='sendChatAction',
+        return_type='bool',
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setMessageReaction": ApiMethodInfo(
+        name='setMessageReaction',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getUserProfilePhotos": ApiMethodInfo(
+        name='getUserProfilePhotos',
+        return_type="'UserProfilePhotos'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'limit': (1, 100)},
+    ),
+    "setUserEmojiStatus": ApiMethodInfo(
+        name='setUserEmojiStatus',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getFile": ApiMethodInfo(
+        name='getFile',
+        return_type="'File'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "banChatMember": ApiMethodInfo(
+        name='banChatMember',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "unbanChatMember": ApiMethodInfo(
+        name='unbanChatMember',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "restrictChatMember": ApiMethodInfo(
+        name='restrictChatMember',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "promoteChatMember": ApiMethodInfo(
+        name='promoteChatMember',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setChatAdministratorCustomTitle": ApiMethodInfo(
+        name='setChatAdministratorCustomTitle',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'custom_title': (0, 16)},
+    ),
+    "banChatSenderChat": ApiMethodInfo(
+        name='banChatSenderChat',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "unbanChatSenderChat": ApiMethodInfo(
+        name='unbanChatSenderChat',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setChatPermissions": ApiMethodInfo(
+        name='setChatPermissions',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "exportChatInviteLink": ApiMethodInfo(
+        name='exportChatInviteLink',
+        return_type='str',
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "createChatInviteLink": ApiMethodInfo(
+        name='createChatInviteLink',
+        return_type="'ChatInviteLink'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'name': (0, 32), 'member_limit': (1, 99999)},
+    ),
+    "editChatInviteLink": ApiMethodInfo(
+        name='editChatInviteLink',
+        return_type="'ChatInviteLink'",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'name': (0, 32), 'member_limit': (1, 99999)},
+    ),
+    "createChatSubscriptionInviteLink": ApiMethodInfo(
+        name='createChatSubscriptionInviteLink',
+        return_type="'ChatInviteLink'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'subscription_price': (1, 2500), 'name': (0, 32)},
+    ),
+    "editChatSubscriptionInviteLink": ApiMethodInfo(
+        name='editChatSubscriptionInviteLink',
+        return_type="'ChatInviteLink'",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'name': (0, 32)},
+    ),
+    "revokeChatInviteLink": ApiMethodInfo(
+        name='revokeChatInviteLink',
+        return_type="'ChatInviteLink'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "approveChatJoinRequest": ApiMethodInfo(
+        name='approveChatJoinRequest',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "declineChatJoinRequest": ApiMethodInfo(
+        name='declineChatJoinRequest',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setChatPhoto": ApiMethodInfo(
+        name='setChatPhoto',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=True,
+        bulk=False,
+        file_params=('photo',),
+        limits={},
+    ),
+    "deleteChatPhoto": ApiMethodInfo(
+        name='deleteChatPhoto',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setChatTitle": ApiMethodInfo(
+        name='setChatTitle',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'title': (1, 128)},
+    ),
+    "setChatDescription": ApiMethodInfo(
+        name='setChatDescription',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'description': (0, 255)},
+    ),
+    "pinChatMessage": ApiMethodInfo(
+        name='pinChatMessage',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "unpinChatMessage": ApiMethodInfo(
+        name='unpinChatMessage',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "unpinAllChatMessages": ApiMethodInfo(
+        name='unpinAllChatMessages',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "leaveChat": ApiMethodInfo(
+        name='leaveChat',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getChat": ApiMethodInfo(
+        name='getChat',
+        return_type="'ChatFullInfo'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getChatAdministrators": ApiMethodInfo(
+        name='getChatAdministrators',
+        return_type="List['ChatMember']",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getChatMemberCount": ApiMethodInfo(
+        name='getChatMemberCount',
+        return_type='int',
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getChatMember": ApiMethodInfo(
+        name='getChatMember',
+        return_type="'ChatMember'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setChatStickerSet": ApiMethodInfo(
+        name='setChatStickerSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "deleteChatStickerSet": ApiMethodInfo(
+        name='deleteChatStickerSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getForumTopicIconStickers": ApiMethodInfo(
+        name='getForumTopicIconStickers',
+        return_type="List['Sticker']",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "createForumTopic": ApiMethodInfo(
+        name='createForumTopic',
+        return_type="'ForumTopic'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'name': (1, 128)},
+    ),
+    "editForumTopic": ApiMethodInfo(
+        name='editForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'name': (0, 128)},
+    ),
+    "closeForumTopic": ApiMethodInfo(
+        name='closeForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "reopenForumTopic": ApiMethodInfo(
+        name='reopenForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "deleteForumTopic": ApiMethodInfo(
+        name='deleteForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "unpinAllForumTopicMessages": ApiMethodInfo(
+        name='unpinAllForumTopicMessages',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "editGeneralForumTopic": ApiMethodInfo(
+        name='editGeneralForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'name': (1, 128)},
+    ),
+    "closeGeneralForumTopic": ApiMethodInfo(
+        name='closeGeneralForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "reopenGeneralForumTopic": ApiMethodInfo(
+        name='reopenGeneralForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "hideGeneralForumTopic": ApiMethodInfo(
+        name='hideGeneralForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "unhideGeneralForumTopic": ApiMethodInfo(
+        name='unhideGeneralForumTopic',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "unpinAllGeneralForumTopicMessages": ApiMethodInfo(
+        name='unpinAllGeneralForumTopicMessages',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "answerCallbackQuery": ApiMethodInfo(
+        name='answerCallbackQuery',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'text': (0, 200)},
+    ),
+    "getUserChatBoosts": ApiMethodInfo(
+        name='getUserChatBoosts',
+        return_type="'UserChatBoosts'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getBusinessConnection": ApiMethodInfo(
+        name='getBusinessConnection',
+        return_type="'BusinessConnection'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setMyCommands": ApiMethodInfo(
+        name='setMyCommands',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "deleteMyCommands": ApiMethodInfo(
+        name='deleteMyCommands',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getMyCommands": ApiMethodInfo(
+        name='getMyCommands',
+        return_type="List['BotCommand']",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setMyName": ApiMethodInfo(
+        name='setMyName',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'name': (0, 64)},
+    ),
+    "getMyName": ApiMethodInfo(
+        name='getMyName',
+        return_type="'BotName'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setMyDescription": ApiMethodInfo(
+        name='setMyDescription',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'description': (0, 512)},
+    ),
+    "getMyDescription": ApiMethodInfo(
+        name='getMyDescription',
+        return_type="'BotDescription'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setMyShortDescription": ApiMethodInfo(
+        name='setMyShortDescription',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'short_description': (0, 120)},
+    ),
+    "getMyShortDescription": ApiMethodInfo(
+        name='getMyShortDescription',
+        return_type="'BotShortDescription'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setChatMenuButton": ApiMethodInfo(
+        name='setChatMenuButton',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getChatMenuButton": ApiMethodInfo(
+        name='getChatMenuButton',
+        return_type="'MenuButton'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setMyDefaultAdministratorRights": ApiMethodInfo(
+        name='setMyDefaultAdministratorRights',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getMyDefaultAdministratorRights": ApiMethodInfo(
+        name='getMyDefaultAdministratorRights',
+        return_type="'ChatAdministratorRights'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "editMessageText": ApiMethodInfo(
+        name='editMessageText',
+        return_type="Union['Message', bool]",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'text': (1, 4096)},
+    ),
+    "editMessageCaption": ApiMethodInfo(
+        name='editMessageCaption',
+        return_type="Union['Message', bool]",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'caption': (0, 1024)},
+    ),
+    "editMessageMedia": ApiMethodInfo(
+        name='editMessageMedia',
+        return_type="Union['Message', bool]",
+        read_only=False,
+        idempotent=True,
+        upload=True,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "editMessageLiveLocation": ApiMethodInfo(
+        name='editMessageLiveLocation',
+        return_type="Union['Message', bool]",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'horizontal_accuracy': (0, 1500)},
+    ),
+    "stopMessageLiveLocation": ApiMethodInfo(
+        name='stopMessageLiveLocation',
+        return_type="Union['Message', bool]",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "editMessageReplyMarkup": ApiMethodInfo(
+        name='editMessageReplyMarkup',
+        return_type="Union['Message', bool]",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "stopPoll": ApiMethodInfo(
+        name='stopPoll',
+        return_type="'Poll'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "deleteMessage": ApiMethodInfo(
+        name='deleteMessage',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "deleteMessages": ApiMethodInfo(
+        name='deleteMessages',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=True,
+        file_params=(),
+        limits={'message_ids': (1, 100)},
+    ),
+    "sendSticker": ApiMethodInfo(
+        name='sendSticker',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('sticker',),
+        limits={},
+    ),
+    "getStickerSet": ApiMethodInfo(
+        name='getStickerSet',
+        return_type="'StickerSet'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getCustomEmojiStickers": ApiMethodInfo(
+        name='getCustomEmojiStickers',
+        return_type="List['Sticker']",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=True,
+        file_params=(),
+        limits={},
+    ),
+    "uploadStickerFile": ApiMethodInfo(
+        name='uploadStickerFile',
+        return_type="'File'",
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=('sticker',),
+        limits={},
+    ),
+    "createNewStickerSet": ApiMethodInfo(
+        name='createNewStickerSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=(),
+        limits={'name': (1, 64), 'title': (1, 64), 'stickers': (1, 50)},
+    ),
+    "addStickerToSet": ApiMethodInfo(
+        name='addStickerToSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setStickerPositionInSet": ApiMethodInfo(
+        name='setStickerPositionInSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "deleteStickerFromSet": ApiMethodInfo(
+        name='deleteStickerFromSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "replaceStickerInSet": ApiMethodInfo(
+        name='replaceStickerInSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=False,
+        upload=True,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setStickerEmojiList": ApiMethodInfo(
+        name='setStickerEmojiList',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'emoji_list': (1, 20)},
+    ),
+    "setStickerKeywords": ApiMethodInfo(
+        name='setStickerKeywords',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'keywords': (0, 20)},
+    ),
+    "setStickerMaskPosition": ApiMethodInfo(
+        name='setStickerMaskPosition',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setStickerSetTitle": ApiMethodInfo(
+        name='setStickerSetTitle',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'title': (1, 64)},
+    ),
+    "setStickerSetThumbnail": ApiMethodInfo(
+        name='setStickerSetThumbnail',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=True,
+        bulk=False,
+        file_params=('thumbnail',),
+        limits={},
+    ),
+    "setCustomEmojiStickerSetThumbnail": ApiMethodInfo(
+        name='setCustomEmojiStickerSetThumbnail',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "deleteStickerSet": ApiMethodInfo(
+        name='deleteStickerSet',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "sendGift": ApiMethodInfo(
+        name='sendGift',
+        return_type='bool',
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'text': (0, 128)},
+    ),
+    "verifyUser": ApiMethodInfo(
+        name='verifyUser',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'custom_description': (0, 70)},
+    ),
+    "verifyChat": ApiMethodInfo(
+        name='verifyChat',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'custom_description': (0, 70)},
+    ),
+    "removeUserVerification": ApiMethodInfo(
+        name='removeUserVerification',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "removeChatVerification": ApiMethodInfo(
+        name='removeChatVerification',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "answerInlineQuery": ApiMethodInfo(
+        name='answerInlineQuery',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "answerWebAppQuery": ApiMethodInfo(
+        name='answerWebAppQuery',
+        return_type="'SentWebAppMessage'",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "savePreparedInlineMessage": ApiMethodInfo(
+        name='savePreparedInlineMessage',
+        return_type="'PreparedInlineMessage'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "sendInvoice": ApiMethodInfo(
+        name='sendInvoice',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'title': (1, 32), 'description': (1, 255), 'payload': (1, 128)},
+    ),
+    "createInvoiceLink": ApiMethodInfo(
+        name='createInvoiceLink',
+        return_type='str',
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'title': (1, 32), 'description': (1, 255), 'payload': (1, 128)},
+    ),
+    "answerShippingQuery": ApiMethodInfo(
+        name='answerShippingQuery',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "answerPreCheckoutQuery": ApiMethodInfo(
+        name='answerPreCheckoutQuery',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getStarTransactions": ApiMethodInfo(
+        name='getStarTransactions',
+        return_type="'StarTransactions'",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={'limit': (1, 100)},
+    ),
+    "refundStarPayment": ApiMethodInfo(
+        name='refundStarPayment',
+        return_type='bool',
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "editUserStarSubscription": ApiMethodInfo(
+        name='editUserStarSubscription',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setPassportDataErrors": ApiMethodInfo(
+        name='setPassportDataErrors',
+        return_type='bool',
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "sendGame": ApiMethodInfo(
+        name='sendGame',
+        return_type="'Message'",
+        read_only=False,
+        idempotent=False,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "setGameScore": ApiMethodInfo(
+        name='setGameScore',
+        return_type="Union['Message', bool]",
+        read_only=False,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+    "getGameHighScores": ApiMethodInfo(
+        name='getGameHighScores',
+        return_type="List['GameHighScore']",
+        read_only=True,
+        idempotent=True,
+        upload=False,
+        bulk=False,
+        file_params=(),
+        limits={},
+    ),
+}
@@ -0,0 +1,121 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, List, Optional, Sequence
+
+# Per api method call counters and latency histograms, broken down into
+# serialize / transport / parse phases, plus total call latency.
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+PHASES = ("serialize", "transport", "parse", "total")
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        res = []
+        total = 0
+        for c in self.counts:
+            total += c
+            res.append(total)
+        return res
+
+    def snapshot(self) -> dict:
+        return {
+            "buckets": dict(zip([*self.buckets, float("inf")], self.cumulative())),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class MethodMetrics:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.calls = 0
+        self.errors: Dict[str, int] = {}
+        self.phases = {p: Histogram(buckets) for p in PHASES}
+        self._lock = Lock()
+
+    def observe(self, phase: str, seconds: float):
+        with self._lock:
+            self.phases[phase].observe(seconds)
+
+    def call(self, seconds: float, error: Optional[BaseException] = None):
+        with self._lock:
+            self.calls += 1
+            self.phases["total"].observe(seconds)
+            if error is not None:
+                code = str(getattr(error, "error_code", type(error).__name__))
+                self.errors[code] = self.errors.get(code, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": dict(self.errors),
+                "phases": {p: h.snapshot() for p, h in self.phases.items()},
+            }
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "teleapi"):
+        self.buckets = buckets
+        self.prefix = prefix
+        self.methods: Dict[str, MethodMetrics] = {}
+        self._lock = Lock()
+
+    def method(self, api_method_name: str) -> MethodMetrics:
+        try:
+            return self.methods[api_method_name]
+        except KeyError:
+            with self._lock:
+                return self.methods.setdefault(api_method_name, MethodMetrics(self.buckets))
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {name: m.snapshot() for name, m in list(self.methods.items())}
+
+    def render_prometheus(self) -> str:
+        """Metrics in Prometheus text exposition format"""
+        p = self.prefix
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {p}_calls_total Bot API calls.",
+            f"# TYPE {p}_calls_total counter",
+        ]
+        for name, m in snapshot.items():
+            lines.append(f"{p}_calls_total{_labels(method=name)} {m['calls']}")
+
+        lines += [
+            f"# HELP {p}_errors_total Failed Bot API calls by error code.",
+            f"# TYPE {p}_errors_total counter",
+        ]
+        for name, m in snapshot.items():
+            for code, n in m["errors"].items():
+                lines.append(f"{p}_errors_total{_labels(method=name, error_code=code)} {n}")
+
+        lines += [
+            f"# HELP {p}_duration_seconds Bot API call latency by phase.",
+            f"# TYPE {p}_duration_seconds histogram",
+        ]
+        for name, m in snapshot.items():
+            for phase, h in m["phases"].items():
+                for le, n in h["buckets"].items():
+                    le = "+Inf" if le == float("inf") else repr(float(le))
+                    lines.append(f"{p}_duration_seconds_bucket{_labels(method=name, phase=phase, le=le)} {n}")
+                lines.append(f"{p}_duration_seconds_sum{_labels(method=name, phase=phase)} {h['sum']}")
+                lines.append(f"{p}_duration_seconds_count{_labels(method=name, phase=phase)} {h['count']}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,54 @@
+from typing import Any, Awaitable, Callable, Optional, Protocol, Sequence, Union
+
+from teleapi.teletransport import ApiResponse
+
+
+class ApiCall:
+    """
+    Api call passed through middleware chain. Middleware can modify method name,
+    params (already serialized) and files before passing it further, raw response
+    is available after call_next() returns.
+    """
+
+    __slots__ = ("api_method_name", "params", "files", "plan", "response")
+
+    def __init__(self, api_method_name: str, params: dict, files: dict, plan: Any = None):
+        self.api_method_name = api_method_name
+        self.params = params
+        self.files = files
+        # teleproxy.CallPlan to parse response with, if not the default one of api method
+        self.plan = plan
+        self.response: Optional[Union[ApiResponse, dict, bytes, str]] = None
+
+    def __repr__(self):
+        return f"ApiCall({self.api_method_name!r}, {self.params!r}, {list(self.files)!r})"
+
+
+Handler = Callable[[ApiCall], Any]
+HandlerAsync = Callable[[ApiCall], Awaitable[Any]]
+
+
+class Middleware(Protocol):
+    def __call__(self, call: ApiCall, call_next: Handler) -> Any:
+        """Return parsed result of call, usually just result of call_next(call)"""
+        pass
+
+
+class MiddlewareAsync(Protocol):
+    async def __call__(self, call: ApiCall, call_next: HandlerAsync) -> Any:
+        """Return parsed result of call, usually just result of await call_next(call)"""
+        pass
+
+
+def _bind(middleware, call_next):
+    def handler(call: ApiCall):
+        return middleware(call, call_next)
+
+    return handler
+
+
+def build_chain(middlewares: Sequence[Union[Middleware, MiddlewareAsync]], handler):
+    """First middleware is the outermost one"""
+    for m in reversed(middlewares):
+        handler = _bind(m, handler)
+    return handler
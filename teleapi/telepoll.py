@@ -0,0 +1,279 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from teleapi.telededup import Dedup
+
+if TYPE_CHECKING:
+    from teleapi.teleupdates import UpdateParser
+
+# Pipelined long polling: the next getUpdates is sent while updates of the previous
+# batch are being handled, received updates wait in a bounded buffer.
+# Offset of each poll confirms only updates handed out to consumer, so updates which are
+# buffered but not yet handed out are delivered again if stream is closed or process dies.
+# Telegram returns unconfirmed updates first, so the buffer is capped by `limit` of a poll,
+# updates received again are dropped, and polls with buffered updates don't wait (timeout 0).
+# After each poll, polling pauses until consumer takes updates down to a quarter of the buffer
+# (or half of buffered ones if fewer), so each poll brings mostly new updates: no more than
+# a third of updates handed out are received twice under load.
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_Item = Tuple[float, Any]
+
+
+class _UpdatePoller:
+    def __init__(
+        self,
+        proxy,
+        offset: Optional[int],
+        limit: int,
+        timeout: int,
+        buffer: int,
+        allowed_updates: Optional[List[str]],
+        dedup: Optional[Dedup] = None,
+        parser: Optional["UpdateParser"] = None,
+    ):
+        self.proxy = proxy
+        self.offset = offset
+        self.limit = limit
+        self.timeout = timeout
+        # buffered updates are not confirmed, so each poll returns them again before new ones
+        self.buffer = max(min(buffer, limit), 1)
+        if allowed_updates is None and parser is not None:
+            allowed_updates = parser.allowed_updates
+        self.allowed_updates = allowed_updates
+        self.dedup = dedup
+        self.plan = parser.plan if parser is not None else None
+        self.polls = 0
+        self.empty_polls = 0
+        self.updates = 0
+        self.downloaded = 0
+        self.duplicates = 0
+        self.max_buffered = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._buffer: Deque[_Item] = deque()
+        self._closed = False
+        self._next_id: Optional[int] = None
+        self._resume_at = 0
+        self._skip_to: Optional[int] = None
+
+    def _params(self) -> dict:
+        params: Dict[str, Any] = {
+            "limit": self.buffer,
+            "timeout": 0 if self._buffer else self.timeout,
+        }
+        if self.offset is not None:
+            params["offset"] = self.offset
+        if self.allowed_updates is not None:
+            params["allowed_updates"] = self.allowed_updates
+        return params
+
+    def _received(self, updates: list):
+        now = time.monotonic()
+        self.polls += 1
+        fresh = 0
+        for u in updates:
+            if self._next_id is not None and u.update_id < self._next_id:
+                continue  # buffered already
+            self._next_id = u.update_id + 1
+            fresh += 1
+            if self.dedup is not None and self.dedup.check(u.update_id):
+                self.duplicates += 1
+                if self._buffer:
+                    # skipped when buffered updates before it are handed out
+                    self._skip_to = self._next_id
+                else:
+                    self.offset = self._next_id
+                continue
+            self._buffer.append((now, u))
+            self._skip_to = None
+        self.downloaded += len(updates)
+        self.updates += fresh
+        if not fresh:
+            self.empty_polls += 1
+        # the next poll receives buffered updates again
+        self._resume_at = min(self.buffer // 4, len(self._buffer) // 2)
+        self.max_buffered = max(self.max_buffered, len(self._buffer))
+
+    def _paused(self) -> bool:
+        """Whether poller waits for consumer to take updates"""
+        if self._closed:
+            return False
+        return len(self._buffer) > self._resume_at
+
+    def _take(self):
+        received, update = self._buffer.popleft()
+        if isinstance(update, _Failure):
+            self._closed = True
+            raise update.error
+        self.offset = update.update_id + 1
+        if not self._buffer and self._skip_to is not None:
+            # duplicates after the last buffered update, otherwise polls would return them forever
+            self.offset = self._skip_to
+            self._skip_to = None
+        if self.dedup is not None:
+            self.dedup.commit(update.update_id)
+        self.last_lag = time.monotonic() - received
+        self.max_lag = max(self.max_lag, self.last_lag)
+        return update
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Lag is time between receiving update and handing it out, downloaded counts updates received again"""
+        return {
+            "polls": self.polls,
+            "empty_polls": self.empty_polls,
+            "updates": self.updates,
+            "downloaded": self.downloaded,
+            "duplicates": self.duplicates,
+            "buffered": len(self._buffer),
+            "max_buffered": self.max_buffered,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+        }
+
+
+class UpdateStream(_UpdatePoller):
+    """
+    Iterable of updates, polled by background thread. Errors of getUpdates
+    stop the stream and are raised to consumer, use RetryPolicy of proxy to ride
+    them out. Leaving `for` loop closes the stream.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def _poll(self):
+        cond = self._cond
+        while True:
+            with cond:
+                while self._paused():
+                    cond.wait()
+                if self._closed:
+                    return
+                params = self._params()
+            try:
+                updates = self.proxy._call("getUpdates", params, None, self.plan)
+            except Exception as e:
+                with cond:
+                    self._buffer.append((time.monotonic(), _Failure(e)))
+                    cond.notify_all()
+                return
+            with cond:
+                if self._closed:
+                    return
+                self._received(updates)
+                cond.notify_all()
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._poll, name="teleapi-updates", daemon=True)
+            self._thread.start()
+        cond = self._cond
+        try:
+            while True:
+                with cond:
+                    while not self._buffer and not self._closed:
+                        cond.wait()
+                    if not self._buffer:
+                        return
+                    update = self._take()
+                    cond.notify_all()
+                yield update
+        finally:
+            self.close()
+
+    def close(self):
+        """Poll in flight (if any) is completed in background, buffered updates aren't confirmed"""
+        with self._cond:
+            self._closed = True
+            self._buffer.clear()
+            self._cond.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class UpdateStreamAsync(_UpdatePoller):
+    """
+    Async iterable of updates, polled by background task. Errors of getUpdates
+    stop the stream and are raised to consumer, use RetryPolicy of proxy to ride
+    them out. Use `async with` or `aclose()` to stop polling.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._cond: Optional[asyncio.Condition] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _poll(self):
+        cond = self._cond
+        while True:
+            async with cond:
+                await cond.wait_for(lambda: not self._paused())
+                if self._closed:
+                    return
+                params = self._params()
+            try:
+                updates = await self.proxy._call("getUpdates", params, None, self.plan)
+            except Exception as e:
+                async with cond:
+                    self._buffer.append((time.monotonic(), _Failure(e)))
+                    cond.notify_all()
+                return
+            async with cond:
+                self._received(updates)
+                cond.notify_all()
+            if not updates:
+                # transport may return with no suspension, let consumer run
+                await asyncio.sleep(0)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        if self._task is None:
+            self._cond = asyncio.Condition()
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+        cond = self._cond
+        try:
+            while True:
+                async with cond:
+                    await cond.wait_for(lambda: self._buffer or self._closed)
+                    if not self._buffer:
+                        return
+                    update = self._take()
+                    cond.notify_all()
+                yield update
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        """Poll in flight (if any) is cancelled, buffered updates aren't confirmed"""
+        self._closed = True
+        self._buffer.clear()
+        if self._task is not None:
+            async with self._cond:
+                self._cond.notify_all()
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
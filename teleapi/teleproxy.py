@@ -1,78 +1,652 @@
+import asyncio
+import time
+from contextlib import nullcontext
 from io import IOBase
-from typing import Union, get_type_hints
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import pydantic
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
+from typing_extensions import get_type_hints
+
+from teleapi.telecodec import JsonCodec, default_codec
 
 if pydantic.__version__.split(".")[0] == "1":
     from pydantic import parse_obj_as
 
-    def to_dict(t, o):
+    def _root_model(t):
         class M(BaseModel):
             __root__: t
 
-        return M(__root__=o).dict(exclude_unset=True, by_alias=True)["__root__"]
+        return M
+
+    def serializer(t) -> Callable[[Any], Any]:
+        m = _root_model(t)
+
+        def serialize(o):
+            return m(__root__=o).dict(exclude_unset=True, by_alias=True)["__root__"]
+
+        return serialize
+
+    def validator(t) -> Callable[[Any], Any]:
+        m = _root_model(t)
+
+        def validate(o):
+            return m(__root__=o).__root__
+
+        return validate
+
+    def to_dict(t, o):
+        return serializer(t)(o)
+
+    def validate_model(m, o):
+        return m.parse_obj(o)
+
+    def validate_model_json(m, o):
+        return m.parse_obj(default_codec.loads(o))
 
 else:
+    from functools import partial
+
     from pydantic import TypeAdapter
 
+    def serializer(t) -> Callable[[Any], Any]:
+        return partial(TypeAdapter(t).dump_python, exclude_unset=True)
+
+    def validator(t) -> Callable[[Any], Any]:
+        return TypeAdapter(t).validate_python
+
     def parse_obj_as(t, o):
-        return TypeAdapter(t).validate_python(o)
+        return validator(t)(o)
 
     def to_dict(t, o):
-        return TypeAdapter(t).dump_python(o, exclude_unset=True)
+        return serializer(t)(o)
 
+    def validate_model(m, o):
+        return m.model_validate(o)
 
-from teleapi.teleapi import Teleapi
+    def validate_model_json(m, o):
+        return m.model_validate_json(o)
+
+
+from teleapi.teleapi import ResponseParameters, Teleapi
+from teleapi.telebatch import BatchResult, Call, batch, batch_async
+from teleapi.teleconstruct import constructor
+from teleapi.telededup import Dedup
+from teleapi.telelazy import lazy_as
+from teleapi.telemetrics import MetricsRegistry
+from teleapi.telemiddleware import ApiCall, Middleware, MiddlewareAsync, build_chain
+from teleapi.telepoll import UpdateStream, UpdateStreamAsync
+from teleapi.teleretry import RetryPolicy
+from teleapi.teletracing import NOOP_SPAN, Tracer, current_span
 from teleapi.teletransport import ApiResponse, TeleTransport, TeleTransportAsync
 
+if TYPE_CHECKING:
+    from teleapi.teleupdates import UpdateParser
+
 
 class TeleError(Exception):
-    def __init__(self, message: str, error_code: int):
+    def __init__(self, message: str, error_code: int, parameters: Optional[ResponseParameters] = None):
         super().__init__(message)
         self.error_code = error_code
+        self.parameters = parameters
+
+    @property
+    def retry_after(self) -> Optional[int]:
+        return self.parameters.retry_after if self.parameters is not None else None
+
+    @property
+    def migrate_to_chat_id(self) -> Optional[int]:
+        return self.parameters.migrate_to_chat_id if self.parameters is not None else None
+
+
+_PLAIN_TYPES = (int, str, bool, float, type(None))
+
+
+def is_plain(t) -> bool:
+    """Plain types (scalars, unions and lists of scalars) are sent as is, with no pydantic involved"""
+    if t in _PLAIN_TYPES:
+        return True
+    origin = getattr(t, "__origin__", None)
+    if origin is Union or origin is list:
+        return all(is_plain(a) for a in t.__args__)
+    return False
+
+
+class CallPlan:
+    """
+    Everything needed to call api method, which can be computed once:
+    resolved type hints, per-parameter serializers (None for plain types),
+    result validator and ApiResponse envelope with typed result, so response
+    is validated in one pass, and result constructor for trusted mode.
+    Return type can be replaced, i.e. by narrower model to parse less.
+    """
+
+    def __init__(self, api_method_name: str, return_type: Any = None):
+        # with extras, to keep discriminators of unions
+        hints = get_type_hints(getattr(Teleapi, api_method_name), include_extras=True)
+        if return_type is not None:
+            hints["return"] = return_type
+        self.api_method_name = api_method_name
+        self.hints = hints
+        self.serializers = {k: None if is_plain(t) else serializer(t) for k, t in hints.items() if k != "return"}
+        self.validate_result = validator(hints["return"])
+        self.envelope = create_model(
+            f"{api_method_name}ApiResponse",
+            __base__=ApiResponse,
+            result=(Optional[hints["return"]], None),
+        )
+        self.result_constructor = constructor(hints["return"])
+
+
+_call_plans: Dict[str, CallPlan] = {}
+
+
+def get_call_plan(api_method_name: str) -> CallPlan:
+    try:
+        return _call_plans[api_method_name]
+    except KeyError:
+        plan = _call_plans[api_method_name] = CallPlan(api_method_name)
+        return plan
+
+
+def _attribute_plan(api_method_name: str) -> CallPlan:
+    """Call plan for attribute lookup, which must fail with AttributeError only"""
+    try:
+        return get_call_plan(api_method_name)
+    except AttributeError:
+        raise
+    except Exception as e:
+        raise AttributeError(f"Can't make call plan of {api_method_name}: {e}") from e
+
+
+class _CallPlans:
+    """Call plans by attribute, i.e. `call_plans.sendMessage`, bound to generated client methods"""
+
+    def __getattr__(self, api_method_name: str) -> CallPlan:
+        if api_method_name.startswith("__"):
+            raise AttributeError(api_method_name)
+        plan = _attribute_plan(api_method_name)
+        # cached on instance, so next time it's found without calling __getattr__
+        setattr(self, api_method_name, plan)
+        return plan
+
+
+call_plans = _CallPlans()
+
+
+def _plan_of(call: ApiCall) -> CallPlan:
+    """Plan call was made with, unless middleware changed api method"""
+    plan = call.plan
+    if plan is None or plan.api_method_name != call.api_method_name:
+        return get_call_plan(call.api_method_name)
+    return plan
+
+
+def drop_none(**kwargs) -> dict:
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _serialize(serializers: dict, k: str, v):
+    s = serializers[k]
+    return v if s is None else s(v)
+
+
+def _prepare_request(plan: CallPlan, kwargs: dict, files: Optional[dict], iobase):
+    serializers = plan.serializers
 
+    if files is None:
+        # any of params can be a file
+        params = {k: _serialize(serializers, k, v) for k, v in kwargs.items() if not isinstance(v, iobase)}
+        files = {k: v for k, v in kwargs.items() if isinstance(v, iobase)}
+        return params, files
 
-def _prepare_request(api_method_name: str, kwargs: dict, iobase):
-    hints = get_type_hints(getattr(Teleapi, api_method_name))
-    params = {k: to_dict(hints[k], v) for k, v in kwargs.items() if not isinstance(v, iobase)}
-    files = {k: v for k, v in kwargs.items() if isinstance(v, iobase)}
-    return hints, params, files
+    params = {k: _serialize(serializers, k, v) for k, v in kwargs.items()}
+    for k, v in files.items():
+        if not isinstance(v, iobase):
+            if k not in serializers:
+                # attachment referred by attach://<name>, there's nothing to attach but file
+                raise TypeError(f"Attachment {k} of {plan.api_method_name} must be a file, not {type(v).__name__}")
+            params[k] = _serialize(serializers, k, v)
+    files = {k: v for k, v in files.items() if isinstance(v, iobase)}
+    return params, files
 
 
-def _parse_response(resp: Union[ApiResponse, dict], hints: dict):
-    if not isinstance(resp, ApiResponse):
-        resp = parse_obj_as(ApiResponse, resp)
+def _parse_response(resp: Union[ApiResponse, dict, bytes, str], plan: CallPlan, codec: Optional[JsonCodec]):
+    if isinstance(resp, ApiResponse):
+        if not resp.ok:
+            raise TeleError(resp.description, resp.error_code or 0, resp.parameters)
+        return plan.validate_result(resp.result)
+
+    if isinstance(resp, (bytes, str)):
+        if codec is None:
+            # decoding is fused with validation where pydantic can do it
+            resp = validate_model_json(plan.envelope, resp)
+        else:
+            resp = validate_model(plan.envelope, codec.loads(resp))
+    else:
+        resp = validate_model(plan.envelope, resp)
 
     if not resp.ok:
-        raise TeleError(resp.description, resp.error_code or 0)
+        raise TeleError(resp.description, resp.error_code or 0, resp.parameters)
+
+    return resp.result
+
+
+def _decode_response(resp: Union[ApiResponse, dict, bytes, str], codec: Optional[JsonCodec]):
+    if isinstance(resp, ApiResponse):
+        if not resp.ok:
+            raise TeleError(resp.description, resp.error_code or 0, resp.parameters)
+        return resp.result
+
+    if isinstance(resp, (bytes, str)):
+        resp = (codec or default_codec).loads(resp)
+
+    if not resp["ok"]:
+        parameters = resp.get("parameters")
+        raise TeleError(
+            resp.get("description"),
+            resp.get("error_code") or 0,
+            parse_obj_as(ResponseParameters, parameters) if parameters is not None else None,
+        )
+
+    return resp.get("result")
+
+
+def _rewind(files: dict) -> Optional[Dict[str, int]]:
+    """Positions of files to rewind them before retry, None if some of files can not be rewound"""
+    try:
+        return {k: f.tell() for k, f in files.items() if f.seekable()}
+    except (AttributeError, OSError):
+        return None
+
+
+def _construct_response(resp: Union[ApiResponse, dict, bytes, str], plan: CallPlan, codec: Optional[JsonCodec]):
+    result = _decode_response(resp, codec)
+    c = plan.result_constructor
+    return result if c is None or result is None else c(result)
+
 
-    return parse_obj_as(hints["return"], resp.result)
+def _lazy_response(resp: Union[ApiResponse, dict, bytes, str], plan: CallPlan, codec: Optional[JsonCodec]):
+    result = _decode_response(resp, codec)
+    if isinstance(result, BaseModel):
+        return result
+    return lazy_as(plan.hints["return"], result)
+
+
+def _span(tracer: Optional[Tracer], api_method_name: str, kwargs: dict):
+    if tracer is None:
+        return nullcontext(NOOP_SPAN)
+    chat_id = kwargs.get("chat_id")
+    if chat_id is None:
+        return tracer.span(f"teleapi.{api_method_name}", method=api_method_name)
+    return tracer.span(f"teleapi.{api_method_name}", method=api_method_name, chat_id=chat_id)
+
+
+def _payload_size(params: dict) -> int:
+    """Approximate size of request, files are not counted"""
+    return len(default_codec.dumps(params)) if params else 0
+
+
+def _named(proxy: Callable, cls: type, api_method_name: str) -> Callable:
+    """Name and docs of api method for tracebacks and introspection"""
+    proxy.__name__ = api_method_name
+    proxy.__qualname__ = f"{cls.__name__}.{api_method_name}"
+    proxy.__doc__ = getattr(Teleapi, api_method_name).__doc__
+    return proxy
+
+
+def _uncached(state: dict) -> dict:
+    """State of proxy with no cached api methods, which are closures and can't be pickled"""
+    return {k: v for k, v in state.items() if k not in _call_plans}
 
 
 class TeleProxy:
-    def __init__(self, transport: TeleTransport, iobase=IOBase):
+    def __init__(
+        self,
+        transport: TeleTransport,
+        iobase=IOBase,
+        codec: Optional[JsonCodec] = None,
+        trusted: bool = False,
+        lazy: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        middlewares: Sequence[Middleware] = (),
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        :param trusted: build result models from responses with no validation,
+            for responses of api.telegram.org or own Bot API server.
+        :param lazy: return lazy views of result models (teleapi.telelazy.LazyModel),
+            which validate fields on first access.
+        :param retry: retry flood control, network and 5xx errors according to policy.
+        :param middlewares: called around every api call, the first one is the outermost.
+        :param metrics: registry to record per method call counts, errors and latencies.
+        :param tracer: tracer to record spans of api calls.
+        """
         self.transport = transport
         self.iobase = iobase
+        self.codec = codec
+        self.retry = retry
+        self._parse_response = _lazy_response if lazy else _construct_response if trusted else _parse_response
+        self.middlewares = list(middlewares)
+        self._chain = build_chain(self.middlewares, self._terminal) if self.middlewares else None
+        self.metrics = metrics
+        self.tracer = tracer
+
+    def _call(self, api_method_name: str, kwargs: dict, files: Optional[dict] = None, plan: Optional[CallPlan] = None):
+        if self.metrics is not None or self.tracer is not None:
+            return self._call_instrumented(api_method_name, kwargs, files, plan)
+
+        if plan is None:
+            plan = get_call_plan(api_method_name)
+        params, files = _prepare_request(plan, kwargs, files, self.iobase)
+        if self._chain is None:
+            return self._send(plan, params, files)
+        return self._chain(ApiCall(api_method_name, params, files, plan))
+
+    def _call_instrumented(self, api_method_name: str, kwargs: dict, files: Optional[dict], plan: Optional[CallPlan]):
+        metrics = self.metrics.method(api_method_name) if self.metrics is not None else None
+        with _span(self.tracer, api_method_name, kwargs) as span:
+            started = time.perf_counter()
+            try:
+                if plan is None:
+                    plan = get_call_plan(api_method_name)
+                params, files = _prepare_request(plan, kwargs, files, self.iobase)
+                if metrics is not None:
+                    metrics.observe("serialize", time.perf_counter() - started)
+                if span is not NOOP_SPAN:
+                    span.set("request.size", _payload_size(params))
+                if self._chain is None:
+                    result = self._send(plan, params, files)
+                else:
+                    result = self._chain(ApiCall(api_method_name, params, files, plan))
+            except Exception as e:
+                if metrics is not None:
+                    metrics.call(time.perf_counter() - started, e)
+                raise
+            if metrics is not None:
+                metrics.call(time.perf_counter() - started)
+            return result
+
+    def _attempt(self, plan: CallPlan, params: dict, files: dict, call: Optional[ApiCall]):
+        if self.metrics is None and self.tracer is None:
+            resp = self.transport.request(plan.api_method_name, params, files)
+            if call is not None:
+                call.response = resp
+            return self._parse_response(resp, plan, self.codec)
+
+        metrics = self.metrics.method(plan.api_method_name) if self.metrics is not None else None
+        started = time.perf_counter()
+        try:
+            resp = self.transport.request(plan.api_method_name, params, files)
+        finally:
+            if metrics is not None:
+                metrics.observe("transport", time.perf_counter() - started)
+        if call is not None:
+            call.response = resp
+        if isinstance(resp, (bytes, str)):
+            current_span().set("response.size", len(resp))
+        started = time.perf_counter()
+        try:
+            return self._parse_response(resp, plan, self.codec)
+        finally:
+            if metrics is not None:
+                metrics.observe("parse", time.perf_counter() - started)
+
+    def _send(self, plan: CallPlan, params: dict, files: dict, call: Optional[ApiCall] = None):
+        if self.retry is None:
+            return self._attempt(plan, params, files, call)
+
+        api_method_name = plan.api_method_name
+        positions = _rewind(files)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return self._attempt(plan, params, files, call)
+            except Exception as e:
+                delay = self.retry.delay(api_method_name, attempt, e)
+                if delay is None or positions is None or len(positions) != len(files):
+                    raise
+            current_span().set("retries", attempt)
+            time.sleep(delay)
+            for k, pos in positions.items():
+                files[k].seek(pos)
+
+    def _terminal(self, call: ApiCall):
+        return self._send(_plan_of(call), call.params, call.files, call)
+
+    def add_middleware(self, middleware: Middleware):
+        """Middlewares are called in order they were added, the first one is the outermost"""
+        self.middlewares.append(middleware)
+        self._chain = build_chain(self.middlewares, self._terminal)
+
+    def batch(
+        self, calls: Iterable[Union[Call, tuple]], concurrency: int = 8, ordered: bool = False
+    ) -> Iterator[BatchResult]:
+        """
+        Run calls, i.e. ("sendMessage", {"chat_id": 1, "text": "Hi"}), in thread pool with bounded concurrency.
+        Results (or errors) are yielded as they complete, or in order of calls if `ordered`.
+        """
+        return batch(self, calls, concurrency, ordered)
+
+    def iter_updates(
+        self,
+        offset: Optional[int] = None,
+        limit: int = 100,
+        timeout: int = 50,
+        buffer: int = 100,
+        allowed_updates: Optional[List[str]] = None,
+        dedup: Optional[Dedup] = None,
+        parser: Optional["UpdateParser"] = None,
+    ) -> UpdateStream:
+        """
+        Long polling with offset management, `for update in bot.iter_updates(): ...`.
+        The next getUpdates is sent while current updates are handled, up to `buffer` updates
+        (no more than `limit`) are prefetched. Only updates handed out are confirmed, so buffered
+        ones are delivered again if stream is closed. Waiting polls are sent with `timeout`,
+        polls with updates still buffered return at once.
+        Lag and poll counters are available by `stats()` of returned stream.
+        Updates seen before by `dedup` (i.e. after restart) are skipped.
+        Only kinds of updates handled by `parser` are validated and requested by default.
+        """
+        return UpdateStream(self, offset, limit, timeout, buffer, allowed_updates, dedup, parser)
 
     def __getattr__(self, api_method_name: str):
+        if api_method_name.startswith("__"):
+            raise AttributeError(api_method_name)
+        plan = _attribute_plan(api_method_name)
+
         def proxy(**kwargs):
-            hints, params, files = _prepare_request(api_method_name, kwargs, self.iobase)
-            resp = self.transport.request(api_method_name, params, files)
-            return _parse_response(resp, hints)
+            return self._call(api_method_name, kwargs, None, plan)
 
+        # cached on instance, so next time it's found without calling __getattr__
+        setattr(self, api_method_name, _named(proxy, type(self), api_method_name))
         return proxy
 
+    def __getstate__(self):
+        return _uncached(self.__dict__)
+
 
 class TeleProxyAsync:
-    def __init__(self, transport: TeleTransportAsync, iobase=IOBase):
+    def __init__(
+        self,
+        transport: TeleTransportAsync,
+        iobase=IOBase,
+        codec: Optional[JsonCodec] = None,
+        trusted: bool = False,
+        lazy: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        middlewares: Sequence[MiddlewareAsync] = (),
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        :param trusted: build result models from responses with no validation,
+            for responses of api.telegram.org or own Bot API server.
+        :param lazy: return lazy views of result models (teleapi.telelazy.LazyModel),
+            which validate fields on first access.
+        :param retry: retry flood control, network and 5xx errors according to policy.
+        :param middlewares: called around every api call, the first one is the outermost.
+        :param metrics: registry to record per method call counts, errors and latencies.
+        :param tracer: tracer to record spans of api calls.
+        """
         self.transport = transport
         self.iobase = iobase
+        self.codec = codec
+        self.retry = retry
+        self._parse_response = _lazy_response if lazy else _construct_response if trusted else _parse_response
+        self.middlewares = list(middlewares)
+        self._chain = build_chain(self.middlewares, self._terminal) if self.middlewares else None
+        self.metrics = metrics
+        self.tracer = tracer
+
+    async def _call(
+        self, api_method_name: str, kwargs: dict, files: Optional[dict] = None, plan: Optional[CallPlan] = None
+    ):
+        if self.metrics is not None or self.tracer is not None:
+            return await self._call_instrumented(api_method_name, kwargs, files, plan)
+
+        if plan is None:
+            plan = get_call_plan(api_method_name)
+        params, files = _prepare_request(plan, kwargs, files, self.iobase)
+        if self._chain is None:
+            return await self._send(plan, params, files)
+        return await self._chain(ApiCall(api_method_name, params, files, plan))
+
+    async def _call_instrumented(
+        self, api_method_name: str, kwargs: dict, files: Optional[dict], plan: Optional[CallPlan]
+    ):
+        metrics = self.metrics.method(api_method_name) if self.metrics is not None else None
+        with _span(self.tracer, api_method_name, kwargs) as span:
+            started = time.perf_counter()
+            try:
+                if plan is None:
+                    plan = get_call_plan(api_method_name)
+                params, files = _prepare_request(plan, kwargs, files, self.iobase)
+                if metrics is not None:
+                    metrics.observe("serialize", time.perf_counter() - started)
+                if span is not NOOP_SPAN:
+                    span.set("request.size", _payload_size(params))
+                if self._chain is None:
+                    result = await self._send(plan, params, files)
+                else:
+                    result = await self._chain(ApiCall(api_method_name, params, files, plan))
+            except Exception as e:
+                if metrics is not None:
+                    metrics.call(time.perf_counter() - started, e)
+                raise
+            if metrics is not None:
+                metrics.call(time.perf_counter() - started)
+            return result
+
+    async def _attempt(self, plan: CallPlan, params: dict, files: dict, call: Optional[ApiCall]):
+        if self.metrics is None and self.tracer is None:
+            resp = await self.transport.request_async(plan.api_method_name, params, files)
+            if call is not None:
+                call.response = resp
+            return self._parse_response(resp, plan, self.codec)
+
+        metrics = self.metrics.method(plan.api_method_name) if self.metrics is not None else None
+        started = time.perf_counter()
+        try:
+            resp = await self.transport.request_async(plan.api_method_name, params, files)
+        finally:
+            if metrics is not None:
+                metrics.observe("transport", time.perf_counter() - started)
+        if call is not None:
+            call.response = resp
+        if isinstance(resp, (bytes, str)):
+            current_span().set("response.size", len(resp))
+        started = time.perf_counter()
+        try:
+            return self._parse_response(resp, plan, self.codec)
+        finally:
+            if metrics is not None:
+                metrics.observe("parse", time.perf_counter() - started)
+
+    async def _send(self, plan: CallPlan, params: dict, files: dict, call: Optional[ApiCall] = None):
+        if self.retry is None:
+            return await self._attempt(plan, params, files, call)
+
+        api_method_name = plan.api_method_name
+        positions = _rewind(files)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._attempt(plan, params, files, call)
+            except Exception as e:
+                delay = self.retry.delay(api_method_name, attempt, e)
+                if delay is None or positions is None or len(positions) != len(files):
+                    raise
+            current_span().set("retries", attempt)
+            await asyncio.sleep(delay)
+            for k, pos in positions.items():
+                files[k].seek(pos)
+
+    async def _terminal(self, call: ApiCall):
+        return await self._send(_plan_of(call), call.params, call.files, call)
+
+    def add_middleware(self, middleware: MiddlewareAsync):
+        """Middlewares are called in order they were added, the first one is the outermost"""
+        self.middlewares.append(middleware)
+        self._chain = build_chain(self.middlewares, self._terminal)
+
+    def batch(
+        self, calls: Iterable[Union[Call, tuple]], concurrency: int = 8, ordered: bool = False
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Run calls, i.e. ("sendMessage", {"chat_id": 1, "text": "Hi"}), concurrently with bounded concurrency.
+        Results (or errors) are yielded as they complete, or in order of calls if `ordered`.
+        """
+        return batch_async(self, calls, concurrency, ordered)
+
+    def aiter_updates(
+        self,
+        offset: Optional[int] = None,
+        limit: int = 100,
+        timeout: int = 50,
+        buffer: int = 100,
+        allowed_updates: Optional[List[str]] = None,
+        dedup: Optional[Dedup] = None,
+        parser: Optional["UpdateParser"] = None,
+    ) -> UpdateStreamAsync:
+        """
+        Long polling with offset management, `async for update in bot.aiter_updates(): ...`.
+        The next getUpdates is sent while current updates are handled, up to `buffer` updates
+        (no more than `limit`) are prefetched. Only updates handed out are confirmed, so buffered
+        ones are delivered again if stream is closed. Waiting polls are sent with `timeout`,
+        polls with updates still buffered return at once.
+        Lag and poll counters are available by `stats()` of returned stream.
+        Updates seen before by `dedup` (i.e. after restart) are skipped.
+        Only kinds of updates handled by `parser` are validated and requested by default.
+        """
+        return UpdateStreamAsync(self, offset, limit, timeout, buffer, allowed_updates, dedup, parser)
 
     def __getattr__(self, api_method_name: str):
+        if api_method_name.startswith("__"):
+            raise AttributeError(api_method_name)
+        plan = _attribute_plan(api_method_name)
+
         async def proxy(**kwargs):
-            hints, params, files = _prepare_request(api_method_name, kwargs, self.iobase)
-            resp = await self.transport.request_async(api_method_name, params, files)
-            return _parse_response(resp, hints)
+            return await self._call(api_method_name, kwargs, None, plan)
 
+        # cached on instance, so next time it's found without calling __getattr__
+        setattr(self, api_method_name, _named(proxy, type(self), api_method_name))
         return proxy
+
+    def __getstate__(self):
+        return _uncached(self.__dict__)
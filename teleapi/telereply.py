@@ -0,0 +1,84 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from teleapi.telemethods import METHODS
+from teleapi.telemiddleware import ApiCall, HandlerAsync
+
+# Answer in webhook response: Telegram accepts one api call as body of response
+# to webhook request, i.e. {"method": "sendMessage", "chat_id": 1, "text": "Hi"}.
+# Handler of update runs within reply context of its webhook request, the first call
+# of mutating method with no files made in it becomes the response, saving a request.
+# Result of such call is unknown, so it returns REPLIED sentinel.
+
+
+class _Replied:
+    def __repr__(self):
+        return "REPLIED"
+
+
+REPLIED = _Replied()
+
+# results of these are needed or they make no sense as webhook response
+NOT_REPLIED = {"getUpdates", "setWebhook", "deleteWebhook", "logOut", "close"}
+
+
+def is_repliable(api_method_name: str) -> bool:
+    info = METHODS.get(api_method_name)
+    return info is not None and not info.read_only and api_method_name not in NOT_REPLIED
+
+
+class WebhookReply:
+    """Reply context of webhook request, holds the call to be sent as response"""
+
+    def __init__(self):
+        self.deferred = False
+        self._call: Optional[dict] = None
+        self._done = asyncio.Event()
+
+    def take(self, api_method_name: str, params: dict) -> bool:
+        """Take the call as response, False if response is already taken or sent"""
+        if self._done.is_set():
+            return False
+        self._call = {"method": api_method_name, **params}
+        self._done.set()
+        return True
+
+    def close(self):
+        """No call is taken from now on, response is sent with no call if none was taken"""
+        self._done.set()
+
+    def defer(self):
+        """Context is passed along with update to be closed once update is handled, i.e. by Dispatcher"""
+        self.deferred = True
+
+    async def wait(self, timeout: float) -> Optional[dict]:
+        """The call taken in time, if any"""
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.close()
+        return self._call
+
+
+_current_reply: ContextVar[Optional[WebhookReply]] = ContextVar("teleapi_current_reply", default=None)
+
+
+def current_reply() -> Optional[WebhookReply]:
+    return _current_reply.get()
+
+
+class ReplyInWebhook:
+    """
+    Middleware for TeleProxyAsync, which turns the first repliable call of handler
+    into response to webhook request (WebhookApp with `reply=True`), the call returns REPLIED.
+    Add it last, so other middlewares see the call.
+    """
+
+    async def __call__(self, call: ApiCall, call_next: HandlerAsync) -> Any:
+        reply = _current_reply.get()
+        if reply is not None and not call.files and is_repliable(call.api_method_name):
+            if reply.take(call.api_method_name, call.params):
+                return REPLIED
+        return await call_next(call)
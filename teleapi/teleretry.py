@@ -0,0 +1,88 @@
+import random
+from typing import Optional, Tuple, Type
+
+from teleapi.telemethods import METHODS
+
+
+def is_idempotent(api_method_name: str) -> bool:
+    """
+    Idempotent methods can be safely repeated if it's unknown whether the first attempt
+    reached Telegram (network errors, 5xx). Send/forward/copy/create/... methods are not,
+    repeating may duplicate messages etc.
+    """
+    info = METHODS.get(api_method_name)
+    return info is not None and info.idempotent
+
+
+def _default_transient_errors() -> Tuple[Type[BaseException], ...]:
+    errors = [OSError, TimeoutError]
+    try:
+        import httpx
+    except ImportError:
+        pass
+    else:
+        errors.append(httpx.TransportError)
+    return tuple(errors)
+
+
+class RetryPolicy:
+    """
+    Flood control (429) errors are retried after exactly `retry_after` seconds
+    for any method, because Telegram rejects such request without executing it.
+    Transient network errors and 5xx responses are retried with exponential
+    backoff and jitter for idempotent methods only (or for any, if `retry_unsafe`).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        max_retry_after: Optional[float] = None,
+        retry_unsafe: bool = False,
+        transient_errors: Optional[Tuple[Type[BaseException], ...]] = None,
+    ):
+        """
+        :param max_attempts: total number of attempts, including the first one
+        :param max_retry_after: do not wait for flood control longer than this, raise instead
+        :param retry_unsafe: retry non-idempotent methods on transient errors too
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_unsafe = retry_unsafe
+        self.transient_errors = _default_transient_errors() if transient_errors is None else transient_errors
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def is_transient(self, e: BaseException) -> bool:
+        from teleapi.teleproxy import TeleError
+
+        if isinstance(e, TeleError):
+            return e.error_code >= 500
+        if isinstance(e, self.transient_errors):
+            return True
+        # HTTP status errors of requests-like libs, i.e. httpx.HTTPStatusError
+        return getattr(getattr(e, "response", None), "status_code", 0) >= 500
+
+    def delay(self, api_method_name: str, attempt: int, e: BaseException) -> Optional[float]:
+        """Time to wait before next attempt after failed `attempt`, or None if error should be raised"""
+        from teleapi.teleproxy import TeleError
+
+        if attempt >= self.max_attempts:
+            return None
+
+        if isinstance(e, TeleError) and e.error_code == 429:
+            if e.retry_after is None:
+                return self._backoff(attempt)
+            if self.max_retry_after is not None and e.retry_after > self.max_retry_after:
+                return None
+            return e.retry_after
+
+        if self.is_transient(e) and (self.retry_unsafe or is_idempotent(api_method_name)):
+            return self._backoff(attempt)
+
+        return None
@@ -0,0 +1,239 @@
+import multiprocessing
+import os
+import queue
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from teleapi.teleapi import Update
+from teleapi.telecodec import JsonCodec, default_codec
+from teleapi.telededup import Dedup
+from teleapi.teledispatch import chat_key
+from teleapi.teleproxy import TeleProxy, _decode_response
+from teleapi.teletransport import TeleTransport
+from teleapi.teleupdates import UpdateParser
+from teleapi.telewebhook import parse_update
+
+# Multi-process handling of updates: the parent process long-polls getUpdates
+# (or receives webhooks) and forwards raw update bytes to worker processes,
+# sharded by chat id, so updates of the same chat are handled in order by one worker.
+# Each worker builds its own proxy and parses updates itself.
+# Offset of getUpdates is moved past an update only after a worker acknowledged it,
+# so updates in flight are delivered again if the parent dies. As Telegram returns
+# unconfirmed updates first, no more than `limit` of one poll are in flight then,
+# `confirm_on_dispatch` trades redelivery for a window of `max_in_flight`.
+
+Handler = Callable[[TeleProxy, Update], Any]
+OnError = Callable[[int, str], Any]
+
+
+def _worker(handler: Handler, proxy_factory: Callable[[], TeleProxy], parse: Callable[[bytes], Update], inbox, acks):
+    proxy = proxy_factory()
+    while True:
+        item = inbox.get()
+        if item is None:
+            return
+        update_id, raw = item
+        error = None
+        try:
+            handler(proxy, parse(raw))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        acks.put((update_id, error))
+
+
+class ShardedRunner:
+    """
+    Handler and proxy factory are called in worker processes, so they must be picklable
+    (i.e. module level functions). Use `poll(transport)` for long polling,
+    or `dispatch(update)` for updates received by webhook, and `stop()` to finish.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        proxy_factory: Callable[[], TeleProxy],
+        processes: Optional[int] = None,
+        max_in_flight: int = 1000,
+        codec: Optional[JsonCodec] = None,
+        on_error: Optional[OnError] = None,
+        start_method: Optional[str] = None,
+        dedup: Optional[Dedup] = None,
+        parser: Optional[UpdateParser] = None,
+    ):
+        """
+        :param max_in_flight: dispatched but not acknowledged updates, dispatch() waits above it,
+            poll() clamps it to `limit` unless updates are confirmed on dispatch.
+        :param on_error: called in parent process with update_id and description of handler's error.
+        :param dedup: updates seen before are not forwarded to workers, updates are seen once acknowledged.
+        :param parser: parses only handled kinds of updates in workers, which are the only ones polled by default.
+        """
+        self.handler = handler
+        self.proxy_factory = proxy_factory
+        self.processes = processes or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight
+        self.codec = codec or default_codec
+        self.on_error = on_error
+        self.dedup = dedup
+        self.parser = parser
+        self.handled = 0
+        self.duplicates = 0
+        self.errors = 0
+        self._context = multiprocessing.get_context(start_method)
+        self._inboxes: List[Any] = []
+        self._workers: List[Any] = []
+        self._acks: Any = None
+        self._in_flight: Set[int] = set()
+        self._next_id: Optional[int] = None
+        self._stopped = False
+
+    def start(self):
+        if self._workers:
+            return
+        self._stopped = False
+        self._acks = self._context.Queue()
+        self._inboxes = [self._context.Queue() for _ in range(self.processes)]
+        self._workers = [
+            self._context.Process(
+                target=_worker,
+                args=(self.handler, self.proxy_factory, self.parser or parse_update, inbox, self._acks),
+                name=f"teleapi-worker-{i}",
+                daemon=True,
+            )
+            for i, inbox in enumerate(self._inboxes)
+        ]
+        for w in self._workers:
+            w.start()
+
+    def shard(self, update: dict) -> int:
+        key = chat_key(update)
+        return hash(update["update_id"] if key is None else key) % self.processes
+
+    def dispatch(self, update: dict):
+        """Forward decoded update to its worker"""
+        self._dispatch(update, self.max_in_flight)
+
+    def _dispatch(self, update: dict, window: int):
+        self.start()
+        self.collect()
+        while len(self._in_flight) >= window:
+            self.collect(timeout=1)
+        update_id = update["update_id"]
+        if self._next_id is None or update_id >= self._next_id:
+            self._next_id = update_id + 1
+        if self.dedup is not None and self.dedup.check(update_id):
+            self.duplicates += 1
+            return
+        self._in_flight.add(update_id)
+        self._inboxes[self.shard(update)].put((update_id, self.codec.dumps(update)))
+
+    def collect(self, timeout: Optional[float] = None):
+        """Process acknowledgements of workers, waiting for the first one up to `timeout` if given"""
+        block = timeout is not None
+        while True:
+            try:
+                update_id, error = self._acks.get(block, timeout)
+            except queue.Empty:
+                return
+            block = False
+            self._in_flight.discard(update_id)
+            if self.dedup is not None:
+                # not on dispatch, so updates redelivered after parent died are handled
+                self.dedup.commit(update_id)
+            self.handled += 1
+            if error is not None:
+                self.errors += 1
+                if self.on_error is not None:
+                    self.on_error(update_id, error)
+
+    @property
+    def offset(self) -> Optional[int]:
+        """Offset confirming all acknowledged updates, which are before the first one in flight"""
+        if self._in_flight:
+            return min(self._in_flight)
+        return self._next_id
+
+    def poll(
+        self,
+        transport: TeleTransport,
+        timeout: int = 50,
+        limit: int = 100,
+        allowed_updates: Optional[List[str]] = None,
+        confirm_on_dispatch: bool = False,
+    ):
+        """
+        Long poll until stop() is called (i.e. from signal handler), then confirm acknowledged updates.
+        Updates are requested by transport directly, because they are parsed by workers.
+
+        Telegram returns unconfirmed updates first, so updates in flight are no more than `limit`
+        (max_in_flight is clamped to it), and one slow update holds back polling of new ones.
+        Polls wait until half of updates received again are acknowledged, still up to half of each poll
+        are updates in flight received and decoded again, and polls are once a second while not full.
+        :param confirm_on_dispatch: move offset past updates once they are dispatched, so `max_in_flight`
+            updates are in flight, but ones not yet handled are lost if the parent process dies.
+        """
+        self.start()
+        window = self.max_in_flight if confirm_on_dispatch else min(self.max_in_flight, limit)
+        if allowed_updates is None and self.parser is not None:
+            allowed_updates = self.parser.allowed_updates
+        while not self._stopped:
+            offset = self._next_id if confirm_on_dispatch else self.offset
+            # polls return unconfirmed updates with no waiting
+            waiting = confirm_on_dispatch or not self._in_flight
+            params: Dict[str, Any] = {"limit": limit, "timeout": timeout if waiting else 0}
+            if offset is not None:
+                params["offset"] = offset
+            if allowed_updates is not None:
+                params["allowed_updates"] = allowed_updates
+            updates = _decode_response(transport.request("getUpdates", params, {}), self.codec)
+            for update in updates:
+                # updates in flight are not confirmed yet, so they are received again
+                if self._next_id is None or update["update_id"] >= self._next_id:
+                    self._dispatch(update, window)
+            if not confirm_on_dispatch:
+                self._wait_progress(offset, limit, len(updates) >= limit)
+        self.join()
+        offset = self._next_id if confirm_on_dispatch else self.offset
+        if offset is not None:
+            transport.request("getUpdates", {"offset": offset, "limit": 1, "timeout": 0}, {})
+
+    def _wait_progress(self, offset: Optional[int], limit: int, full: bool):
+        """
+        Wait before the next poll, which returns updates from offset again, until acknowledgements move offset
+        over half of updates the last poll returned again (up to `limit`), so each poll is mostly new updates.
+        If the last poll was not full, new updates may follow updates in flight, they are polled every second.
+        """
+        # acknowledged updates after the first one in flight are received again too
+        again = min(limit, self._next_id - (self.offset if offset is None else offset))
+        deadline = time.monotonic() + 1
+        while self._in_flight and not self._stopped:
+            if self.offset != offset and self._next_id - self.offset <= again // 2:
+                return
+            left = deadline - time.monotonic()
+            if not full and left <= 0:
+                return
+            self.collect(timeout=1 if full else left)
+
+    def stop(self):
+        """Stop polling, poll() returns after dispatched updates are handled"""
+        self._stopped = True
+
+    def join(self):
+        """Wait until all dispatched updates are handled, then stop workers"""
+        while self._in_flight and any(w.is_alive() for w in self._workers):
+            self.collect(timeout=1)
+        for inbox in self._inboxes:
+            inbox.put(None)
+        for w in self._workers:
+            w.join()
+        self.collect()
+        self._workers = []
+        self._inboxes = []
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "processes": len(self._workers),
+            "in_flight": len(self._in_flight),
+            "handled": self.handled,
+            "errors": self.errors,
+            "duplicates": self.duplicates,
+        }
@@ -26,11 +26,17 @@ class ApiResponse(BaseModel):
     parameters: Optional[ResponseParameters] = None
 
 
+# Transport can return raw response body (bytes or str), so it's parsed and
+# validated by TeleProxy in one pass, or already decoded dict, or ApiResponse.
+
+
 class TeleTransport(Protocol):
-    def request(self, api_method_name: str, params: dict, files: dict) -> Union[ApiResponse, dict]:
+    def request(self, api_method_name: str, params: dict, files: dict) -> Union[ApiResponse, dict, bytes, str]:
         pass
 
 
 class TeleTransportAsync(Protocol):
-    async def request_async(self, api_method_name: str, params: dict, files: dict) -> Union[ApiResponse, dict]:
+    async def request_async(
+        self, api_method_name: str, params: dict, files: dict
+    ) -> Union[ApiResponse, dict, bytes, str]:
         pass
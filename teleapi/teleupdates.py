@@ -0,0 +1,44 @@
+from typing import Any, Iterable, List, Optional, Type, Union
+
+from pydantic import create_model
+
+from teleapi.teleapi import Update
+from teleapi.teledispatch import UPDATE_KINDS
+from teleapi.teleproxy import CallPlan, validate_model_json
+
+# Selective parsing of updates: only kinds of updates the bot handles are validated,
+# other optional fields of Update are kept as raw dicts. The same kinds make
+# `allowed_updates` of getUpdates / setWebhook, so Telegram doesn't send the rest at all.
+
+
+class UpdateParser:
+    def __init__(self, kinds: Iterable[str]):
+        """
+        :param kinds: handled optional fields of Update, i.e. {"message", "callback_query"}.
+        """
+        kinds = set(kinds)
+        unknown = kinds.difference(UPDATE_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown kinds of updates: {', '.join(sorted(unknown))}")
+        self.kinds = tuple(k for k in UPDATE_KINDS if k in kinds)
+        self.model: Type[Update] = create_model(
+            "SelectedUpdate",
+            __base__=Update,
+            **{k: (Optional[Any], None) for k in UPDATE_KINDS if k not in kinds},
+        )
+        self.plan = CallPlan("getUpdates", List[self.model])
+
+    @property
+    def allowed_updates(self) -> List[str]:
+        return list(self.kinds)
+
+    def parse(self, body: Union[bytes, str]) -> Update:
+        """Update from raw json, i.e. body of webhook request"""
+        return validate_model_json(self.model, body)
+
+    def __call__(self, body: Union[bytes, str]) -> Update:
+        return self.parse(body)
+
+    def __reduce__(self):
+        # model is created on the fly, so parser is rebuilt from kinds
+        return UpdateParser, (self.kinds,)
@@ -0,0 +1,162 @@
+import hmac
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from teleapi.teleapi import Update
+from teleapi.telecodec import default_codec
+from teleapi.telededup import Dedup, peek_update_id
+from teleapi.teleproxy import validate_model_json
+from teleapi.telereply import WebhookReply, _current_reply
+
+# Minimal ASGI app receiving Telegram webhooks with no web framework involved:
+# secret token is checked in constant time, request body is validated into Update
+# in one pass from bytes and passed to sink (i.e. Dispatcher.put), then 200 is returned
+# with no waiting for update to be handled.
+# With `reply=True`, response waits (up to `reply_timeout`) for the first repliable
+# call made by handler of the update, which is sent as response body (see telereply).
+
+Sink = Callable[[Any], Awaitable[Any]]
+Headers = List[Tuple[bytes, bytes]]
+
+SECRET_TOKEN_HEADER = b"x-telegram-bot-api-secret-token"
+
+
+def parse_update(body: bytes) -> Update:
+    return validate_model_json(Update, body)
+
+
+class WebhookApp:
+    def __init__(
+        self,
+        sink: Sink,
+        secret_token: Optional[str] = None,
+        path: Optional[str] = None,
+        parse: Optional[Callable[[bytes], Any]] = parse_update,
+        max_body_size: int = 1 << 20,
+        on_startup: Optional[Callable[[], Awaitable[Any]]] = None,
+        on_shutdown: Optional[Callable[[], Awaitable[Any]]] = None,
+        reply: bool = False,
+        reply_timeout: float = 1.0,
+        dedup: Optional[Dedup] = None,
+    ):
+        """
+        :param secret_token: secret_token passed to setWebhook, requests with no such token are rejected.
+        :param path: the only path accepted, any path if None.
+        :param parse: makes update from request body, None to pass raw body bytes to sink.
+        :param on_startup: called on ASGI lifespan startup, i.e. to call setWebhook.
+        :param reply: send the first repliable call of handler as response, needs ReplyInWebhook middleware.
+        :param dedup: redelivered updates are answered with 200 and not parsed or passed to sink,
+            update is committed as seen once sink accepted it.
+        """
+        self.sink = sink
+        self.secret_token = secret_token.encode() if secret_token is not None else None
+        self.path = path
+        self.parse = parse
+        self.max_body_size = max_body_size
+        self.on_startup = on_startup
+        self.on_shutdown = on_shutdown
+        self.reply = reply
+        self.reply_timeout = reply_timeout
+        self.dedup = dedup
+        self.received = 0
+        self.rejected = 0
+        self.replied = 0
+        self.duplicates = 0
+
+    async def __call__(self, scope: dict, receive, send):
+        if scope["type"] == "lifespan":
+            return await self._lifespan(receive, send)
+        if scope["type"] != "http":
+            return
+
+        status = self._check(scope)
+        if status != 200:
+            self.rejected += 1
+            return await _respond(send, status)
+
+        body = await _read_body(receive, self.max_body_size)
+        if body is None:
+            self.rejected += 1
+            return await _respond(send, 413)
+
+        update_id = peek_update_id(body) if self.dedup is not None else None
+        if update_id is not None and self.dedup.check(update_id):
+            self.duplicates += 1
+            return await _respond(send, 200)
+
+        try:
+            update = body if self.parse is None else self.parse(body)
+        except ValueError:
+            self.rejected += 1
+            return await _respond(send, 400)
+
+        self.received += 1
+        if not self.reply:
+            await self.sink(update)
+            self._accepted(update_id)
+            return await _respond(send, 200)
+
+        reply = WebhookReply()
+        token = _current_reply.set(reply)
+        try:
+            await self.sink(update)
+        finally:
+            _current_reply.reset(token)
+        self._accepted(update_id)
+        if not reply.deferred:
+            # sink has handled update itself
+            reply.close()
+        call = await reply.wait(self.reply_timeout)
+        if call is None:
+            return await _respond(send, 200)
+        self.replied += 1
+        await _respond(send, 200, default_codec.dumps(call).encode(), [(b"content-type", b"application/json")])
+
+    def _accepted(self, update_id: Optional[int]):
+        # not before, so update is not skipped when Telegram retries after sink failed
+        if update_id is not None:
+            self.dedup.commit(update_id)
+
+    def _check(self, scope: dict) -> int:
+        if self.path is not None and scope["path"] != self.path:
+            return 404
+        if scope["method"] != "POST":
+            return 405
+        if self.secret_token is not None:
+            token = next((v for k, v in scope["headers"] if k == SECRET_TOKEN_HEADER), b"")
+            if not hmac.compare_digest(token, self.secret_token):
+                return 401
+        return 200
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if self.on_startup is not None:
+                    await self.on_startup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self.on_shutdown is not None:
+                    await self.on_shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+async def _read_body(receive, max_size: int) -> Optional[bytes]:
+    """Request body, None if it's larger than max_size"""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_size:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _respond(send, status: int, body: bytes = b"", headers: Optional[Headers] = None):
+    headers = headers or []
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
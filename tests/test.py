@@ -1,8 +1,44 @@
+import asyncio
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 
-from teleapi.teleapi import Chat, Message, MessageEntity, Teleapi
-from teleapi.teleproxy import TeleError, TeleProxy
+import teleapi.teleproxy as teleproxy_module
+from teleapi.teleapi import (
+    Chat,
+    ChatMemberLeft,
+    ChatMemberOwner,
+    InlineQueryResult,
+    InlineQueryResultCachedPhoto,
+    InputMediaPhoto,
+    InputMediaVideo,
+    Message,
+    MessageEntity,
+    ResponseParameters,
+    Teleapi,
+    Update,
+)
+from teleapi.telebatch import call
+from teleapi.telebroadcast import BroadcastScheduler, broadcast, broadcast_async
+from teleapi.telecache import Cache, ResultCache
+from teleapi.teleclient import TeleapiClient
+from teleapi.telecoalesce import SingleFlight, SingleFlightAsync
+from teleapi.telecodec import StdlibJsonCodec, default_codec
+from teleapi.teleconstruct import construct_as
+from teleapi.telededup import SqliteUpdateDedup, UpdateDedup, peek_update_id
+from teleapi.teledispatch import Dispatcher, chat_key
+from teleapi.telemethods import METHODS
+from teleapi.telemetrics import MetricsRegistry
+from teleapi.teleproxy import TeleError, TeleProxy, TeleProxyAsync, call_plans, get_call_plan
+from teleapi.telereply import REPLIED, ReplyInWebhook
+from teleapi.teleretry import RetryPolicy
+from teleapi.telesharding import ShardedRunner
+from teleapi.teletracing import InMemoryExporter, Tracer
 from teleapi.teletransport import ApiResponse, TeleTransport
+from teleapi.teleupdates import UpdateParser
+from teleapi.telewebhook import WebhookApp
 
 msg = Message(
     message_id=1,
@@ -68,3 +104,689 @@ api = factory(TestTransportFile())
 
 f = StringIO("foo")
 assert api.sendPhoto(chat_id=1, photo=f) == msg
+
+assert get_call_plan("sendMessage") is get_call_plan("sendMessage") is call_plans.sendMessage
+
+client = TeleapiClient(TestTransportGood())
+assert client.sendMessage(chat_id=123, text="msg", entities=[MessageEntity(type="qq", offset=1, length=1)]) == msg
+assert pickle.loads(pickle.dumps(TeleapiClient(None))).transport is None
+
+proxy = TeleProxy(TestTransportGood())
+assert proxy.sendMessage is proxy.sendMessage and proxy.sendMessage.__qualname__ == "TeleProxy.sendMessage"
+send = proxy.sendMessage
+assert send(chat_id=123, text="msg", entities=[MessageEntity(type="qq", offset=1, length=1)]) == msg
+assert pickle.loads(pickle.dumps(proxy)).transport
+try:
+    proxy.sendNothing
+    assert False
+except AttributeError:
+    pass
+
+
+def broken_call_plan(_api_method_name: str):
+    raise TypeError("broken hints")
+
+
+teleproxy_module.get_call_plan = broken_call_plan
+assert not hasattr(TeleProxy(None), "sendPoll") and not hasattr(TeleProxyAsync(None), "sendPoll")
+teleproxy_module.get_call_plan = get_call_plan
+
+client = TeleapiClient(TestTransportFile())
+assert client.sendPhoto(chat_id=1, photo=StringIO("foo")) == msg
+
+
+class TestTransportAttachments:
+    def request(self, api_method_name: str, params: dict, files: dict) -> dict:
+        assert files["pic"].read() == "foo"
+        if api_method_name == "sendMediaGroup":
+            assert [m["type"] for m in params["media"]] == ["photo", "video"]
+            return {"ok": True, "result": [msg.dict(exclude_none=True)]}
+        assert params["media"] == {"type": "photo", "media": "attach://pic"}
+        return {"ok": True, "result": msg.dict(exclude_none=True)}
+
+
+client = TeleapiClient(TestTransportAttachments())
+photo = InputMediaPhoto(type="photo", media="attach://pic")
+assert client.editMessageMedia(chat_id=1, message_id=1, media=photo, pic=StringIO("foo")) == msg
+media = [photo, InputMediaVideo(type="video", media="file_id")]
+assert client.sendMediaGroup(chat_id=1, media=media, pic=StringIO("foo")) == [msg]
+try:
+    client.editMessageMedia(chat_id=1, message_id=1, media=photo, pic="file_id")
+    assert False
+except TypeError:
+    pass
+
+assert [k for k, s in get_call_plan("sendMessage").serializers.items() if s is not None] == [
+    "entities",
+    "link_preview_options",
+    "reply_parameters",
+    "reply_markup",
+]
+
+
+class TestTransportRaw:
+    def request(self, _api_method_name: str, _params: dict, _files: dict) -> bytes:
+        return (
+            b'{"ok": true, "result": [{"update_id": 1, '
+            b'"message": {"message_id": 1, "date": 123, "chat": {"id": 2, "type": "private"}, '
+            b'"from": {"id": 3, "is_bot": false, "first_name": "foo"}}}]}'
+        )
+
+
+updates = factory(TestTransportRaw()).getUpdates()
+assert updates[0].update_id == 1 and updates[0].message.chat == msg.chat and updates[0].message.from_.id == 3
+
+assert factory(TestTransportRaw()).getUpdates() == TeleProxy(TestTransportRaw(), codec=StdlibJsonCodec()).getUpdates()
+assert StdlibJsonCodec().loads(default_codec.dumps({"a": [1, "б"]})) == {"a": [1, "б"]}
+
+assert TeleProxy(TestTransportRaw(), trusted=True).getUpdates() == updates
+
+
+class TestTransportLists:
+    def request(self, _api_method_name: str, _params: dict, _files: dict) -> bytes:
+        return (
+            b'{"ok": true, "result": [{"update_id": 1, '
+            b'"message": {"message_id": 1, "date": 123, "chat": {"id": 2, "type": "private"}, '
+            b'"entities": [{"type": "bold", "offset": 0, "length": 3}], '
+            b'"photo": [{"file_id": "a", "file_unique_id": "b", "width": 1, "height": 1}]}}]}'
+        )
+
+
+trusted_updates = TeleProxy(TestTransportLists(), trusted=True).getUpdates()
+assert trusted_updates == TeleProxy(TestTransportLists()).getUpdates()
+assert trusted_updates[0].message.entities[0].type == "bold" and trusted_updates[0].message.photo[0].width == 1
+
+lazy_updates = TeleProxy(TestTransportRaw(), lazy=True).getUpdates()
+assert lazy_updates[0].message.from_.first_name == "foo"
+assert lazy_updates[0].edited_message is None
+assert lazy_updates[0].to_model() == updates[0]
+
+
+class TestTransportEcho:
+    def request(self, _api_method_name: str, params: dict, _files: dict) -> dict:
+        if params["chat_id"] < 0:
+            return {"ok": False, "description": "Bad chat", "error_code": 400}
+        result = {"message_id": params["chat_id"], "date": 1, "chat": {"id": 1, "type": "private"}}
+        return {"ok": True, "result": result}
+
+    async def request_async(self, api_method_name: str, params: dict, files: dict) -> dict:
+        return self.request(api_method_name, params, files)
+
+
+calls = (("sendMessage", {"chat_id": i, "text": "Hi"}) for i in range(-2, 30))
+results = list(TeleProxy(TestTransportEcho()).batch(calls, concurrency=4, ordered=True))
+assert [r.index for r in results] == list(range(32))
+assert [r.ok for r in results[:3]] == [False, False, True] and results[5].result.message_id == 3
+
+
+async def run_batch_async():
+    calls = [call("sendMessage", chat_id=i, text="Hi") for i in range(-2, 30)]
+    return [r async for r in TeleProxyAsync(TestTransportEcho()).batch(calls, concurrency=4)]
+
+
+results = asyncio.run(run_batch_async())
+assert sorted(r.index for r in results) == list(range(32)) and sum(r.ok for r in results) == 30
+
+progress = broadcast(TeleProxy(TestTransportEcho()), [-1, 1, 2, 3], [call("sendMessage", text="Hi")], start=1)
+assert (progress.cursor, progress.sent, progress.failed) == (4, 3, 0)
+progress = asyncio.run(broadcast_async(TeleProxyAsync(TestTransportEcho()), [-1, 1], [("sendMessage", {"text": "Hi"})]))
+assert (progress.cursor, progress.sent, progress.failed) == (2, 1, 1)
+
+scheduler = BroadcastScheduler([-1, -2], [("sendMessage", {"text": "Hi"})] * 3, rate=1000)
+now = time.monotonic()
+r, _ = scheduler.poll(now)
+for i in range(1, 4):
+    # group rate allows bursts, 1000 per second overall
+    other, _ = scheduler.poll(now + i / 100)
+    scheduler.complete(other, now + i / 100)
+scheduler.complete(r, now, TeleError("Too Many Requests", 429, ResponseParameters(retry_after=5)))
+assert scheduler.poll(now + 1) == 4  # flood control pauses all recipients
+
+
+class TestTransportFlaky:
+    def __init__(self, error):
+        self.error = error
+        self.attempts = 0
+
+    def request(self, _api_method_name: str, _params: dict, _files: dict) -> dict:
+        self.attempts += 1
+        if self.attempts == 1:
+            if isinstance(self.error, Exception):
+                raise self.error
+            return self.error
+        return {"ok": True, "result": True}
+
+
+flood = {"ok": False, "description": "Too Many Requests", "error_code": 429, "parameters": {"retry_after": 0}}
+for kwargs in [{}, {"trusted": True}]:
+    try:
+        TeleProxy(TestTransportFlaky(flood), **kwargs).deleteMessage(chat_id=1, message_id=1)
+    except TeleError as e:
+        assert e.error_code == 429 and e.retry_after == 0
+    else:
+        assert False
+
+assert METHODS["getChat"].read_only and not METHODS["getUpdates"].read_only and METHODS["getUpdates"].idempotent
+assert not METHODS["sendMessage"].idempotent and METHODS["sendMessage"].limits["text"] == (1, 4096)
+assert METHODS["sendPhoto"].upload and METHODS["sendPhoto"].file_params == ("photo",)
+assert METHODS["sendMediaGroup"].upload and not METHODS["sendMediaGroup"].file_params
+assert METHODS["deleteMessages"].bulk and not METHODS["deleteMessage"].bulk
+
+retry = RetryPolicy(backoff=0)
+assert TeleProxy(TestTransportFlaky(flood), retry=retry).sendChatAction(chat_id=1, action="typing")
+assert TeleProxy(TestTransportFlaky(ConnectionError()), retry=retry).deleteMessage(chat_id=1, message_id=1)
+try:
+    TeleProxy(TestTransportFlaky(ConnectionError()), retry=retry).sendChatAction(chat_id=1, action="typing")
+except ConnectionError:
+    pass
+else:
+    assert False
+
+
+def double_chat_id(c, call_next):
+    c.params["chat_id"] *= 2
+    result = call_next(c)
+    assert c.response["ok"]
+    return result.message_id
+
+
+async def shift_message_id(c, call_next):
+    return (await call_next(c)).message_id + 1
+
+
+async def double_chat_id_async(c, call_next):
+    c.params["chat_id"] *= 2
+    return await call_next(c)
+
+
+assert TeleProxy(TestTransportEcho(), middlewares=[double_chat_id]).sendMessage(chat_id=2, text="Hi") == 4
+proxy = TeleProxyAsync(TestTransportEcho())
+proxy.add_middleware(shift_message_id)
+proxy.add_middleware(double_chat_id_async)
+assert asyncio.run(proxy.sendMessage(chat_id=2, text="Hi")) == 5
+
+metrics = MetricsRegistry()
+proxy = TeleProxy(TestTransportEcho(), metrics=metrics, middlewares=[double_chat_id])
+assert proxy.sendMessage(chat_id=1, text="Hi") == 2
+try:
+    proxy.sendMessage(chat_id=-1, text="Hi")
+except TeleError:
+    pass
+snapshot = metrics.snapshot()["sendMessage"]
+assert snapshot["calls"] == 2 and snapshot["errors"] == {"400": 1}
+assert snapshot["phases"]["transport"]["count"] == 2 and snapshot["phases"]["parse"]["count"] == 2
+assert 'teleapi_errors_total{method="sendMessage",error_code="400"} 1' in metrics.render_prometheus()
+
+exporter = InMemoryExporter()
+tracer = Tracer(exporter)
+TeleProxy(TestTransportFlaky(flood), retry=retry, tracer=tracer).sendChatAction(chat_id=1, action="typing")
+span = exporter.spans[0]
+assert span.attributes["chat_id"] == 1 and span.attributes["retries"] == 1 and span.attributes["request.size"] > 0
+
+
+async def handle_update():
+    proxy = TeleProxyAsync(TestTransportEcho(), tracer=tracer)
+    with tracer.span("update") as span:
+        await asyncio.gather(proxy.sendMessage(chat_id=1, text="Hi"), proxy.sendMessage(chat_id=2, text="Hi"))
+    return span
+
+
+exporter.clear()
+root = asyncio.run(handle_update())
+parents = [(s.trace_id, s.parent_id) for s in exporter.spans]
+assert parents == [(root.trace_id, root.span_id)] * 2 + [(root.trace_id, None)]
+
+exporter.clear()
+TeleProxy(TestTransportEcho(), tracer=Tracer(exporter, sample_rate=0)).sendMessage(chat_id=1, text="Hi")
+assert not exporter.spans
+
+
+def chat_full_info(chat_id: int) -> dict:
+    return {"id": chat_id, "type": "group", "accent_color_id": 1, "max_reaction_count": 1}
+
+
+class TestTransportSlow:
+    def __init__(self):
+        self.requests = 0
+
+    def request(self, _api_method_name: str, params: dict, _files: dict) -> dict:
+        self.requests += 1
+        time.sleep(0.05)
+        return {"ok": True, "result": chat_full_info(params["chat_id"])}
+
+    async def request_async(self, _api_method_name: str, params: dict, _files: dict) -> dict:
+        self.requests += 1
+        await asyncio.sleep(0.05)
+        return {"ok": True, "result": chat_full_info(params["chat_id"])}
+
+
+async def get_chats(proxy):
+    return await asyncio.gather(*[proxy.getChat(chat_id=i % 2) for i in range(10)])
+
+
+transport = TestTransportSlow()
+chats = asyncio.run(get_chats(TeleProxyAsync(transport, middlewares=[SingleFlightAsync()])))
+assert transport.requests == 2 and chats[0] is chats[2] and chats[1].id == 1
+
+
+async def get_chat_cancel_leader(proxy):
+    leader = asyncio.ensure_future(proxy.getChat(chat_id=1))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(proxy.getChat(chat_id=1))
+    await asyncio.sleep(0)
+    leader.cancel()
+    return await follower
+
+
+transport = TestTransportSlow()
+assert asyncio.run(get_chat_cancel_leader(TeleProxyAsync(transport, middlewares=[SingleFlightAsync()]))).id == 1
+assert transport.requests == 1
+
+transport = TestTransportSlow()
+proxy = TeleProxy(transport, middlewares=[SingleFlight()])
+with ThreadPoolExecutor(10) as executor:
+    chats = list(executor.map(lambda i: proxy.getChat(chat_id=i % 2), range(10)))
+assert transport.requests == 2 and chats[0] is chats[2]
+
+
+class TestTransportChat:
+    def __init__(self):
+        self.requests = 0
+
+    def request(self, api_method_name: str, params: dict, _files: dict) -> dict:
+        self.requests += 1
+        if api_method_name == "getChat":
+            return {"ok": True, "result": chat_full_info(params["chat_id"])}
+        return {"ok": True, "result": True}
+
+
+transport = TestTransportChat()
+cache = Cache(ResultCache(maxsize=2))
+proxy = TeleProxy(transport, middlewares=[cache])
+assert proxy.getChat(chat_id=1) is proxy.getChat(chat_id=1) and transport.requests == 1
+proxy.setChatTitle(chat_id=2, title="Foo")
+proxy.getChat(chat_id=1)
+proxy.setChatTitle(chat_id=1, title="Foo")
+proxy.getChat(chat_id=1)
+proxy.getChat(chat_id=2)
+proxy.getChat(chat_id=3)
+assert transport.requests == 6
+assert cache.cache.stats() == {"size": 2, "hits": 2, "misses": 4, "evictions": 1, "invalidations": 1}
+
+
+class TestTransportUpdates:
+    def __init__(self, total: int):
+        self.total = total
+        self.offsets = []
+
+    def request(self, api_method_name: str, params: dict, _files: dict) -> dict:
+        assert api_method_name == "getUpdates" and params["limit"] <= 3
+        offset = params.get("offset", 1)
+        self.offsets.append(offset)
+        result = [{"update_id": i} for i in range(offset, min(offset + params["limit"], self.total + 1))]
+        return {"ok": True, "result": result}
+
+    async def request_async(self, api_method_name: str, params: dict, files: dict) -> dict:
+        return self.request(api_method_name, params, files)
+
+
+def take_updates(stream, n):
+    updates = []
+    for update in stream:
+        updates.append(update.update_id)
+        if len(updates) == n:
+            break
+    return updates
+
+
+transport = TestTransportUpdates(10)
+stream = TeleProxy(transport).iter_updates(limit=5, buffer=3)
+assert take_updates(stream, 10) == list(range(1, 11))
+assert stream.stats()["updates"] == 10 and stream.stats()["max_buffered"] <= 3
+assert transport.offsets == sorted(transport.offsets) and stream.offset == 11
+
+# buffered updates are not confirmed, so they are received again after stream is closed
+stream = TeleProxy(TestTransportUpdates(10)).iter_updates(limit=3)
+assert take_updates(stream, 2) == [1, 2] and stream.offset == 3
+assert take_updates(TeleProxy(TestTransportUpdates(10)).iter_updates(stream.offset, limit=3), 8) == list(range(3, 11))
+
+
+async def take_updates_async(proxy, n):
+    updates = []
+    async with proxy.aiter_updates(limit=3, timeout=0) as stream:
+        async for update in stream:
+            updates.append(update.update_id)
+            if len(updates) == n:
+                break
+    return updates
+
+
+transport = TestTransportUpdates(5)
+assert asyncio.run(take_updates_async(TeleProxyAsync(transport), 5)) == [1, 2, 3, 4, 5]
+
+
+class TestTransportBacklog:
+    def request(self, _api_method_name: str, params: dict, _files: dict) -> dict:
+        offset = params.get("offset", 1)
+        time.sleep(0.002)
+        return {"ok": True, "result": [{"update_id": i} for i in range(offset, min(offset + params["limit"], 1001))]}
+
+
+# buffered updates are received again by each poll, but only a few of them
+stream = TeleProxy(TestTransportBacklog()).iter_updates()
+assert take_updates(stream, 1000) == list(range(1, 1001))
+assert stream.stats()["downloaded"] <= 1.5 * 1000
+
+
+assert chat_key({"update_id": 1, "callback_query": {"from": {"id": 5}, "message": {"chat": {"id": 7}}}}) == 7
+assert chat_key({"update_id": 1, "inline_query": {"from": {"id": 5}}}) == 5
+assert chat_key({"update_id": 1, "poll": {"id": "x"}}) is None
+assert chat_key(Update(update_id=1, message=msg)) == msg.chat.id
+
+
+async def dispatch_updates():
+    handled = []
+    active = set()
+
+    async def handle(update):
+        chat_id = update["message"]["chat"]["id"]
+        assert chat_id not in active
+        active.add(chat_id)
+        await asyncio.sleep(0.001)
+        active.discard(chat_id)
+        handled.append((chat_id, update["update_id"]))
+        if update["update_id"] == 7:
+            raise ValueError()
+
+    dispatcher = Dispatcher(handle, concurrency=3, max_pending=4)
+    async with dispatcher:
+        for i in range(12):
+            await dispatcher.put({"update_id": i, "message": {"chat": {"id": i % 3}}})
+            assert dispatcher.stats()["pending"] <= 4
+    return handled, dispatcher.stats()
+
+
+handled, stats = asyncio.run(dispatch_updates())
+assert len(handled) == 12 and stats["errors"] == 1 and stats["pending"] == 0
+for c in range(3):
+    assert [i for chat_id, i in handled if chat_id == c] == list(range(c, 12, 3))
+
+
+async def dispatch_with_broken_callbacks():
+    def on_error(_update, _e):
+        raise RuntimeError()
+
+    async def handle(_update):
+        raise ValueError()
+
+    dispatcher = Dispatcher(handle, concurrency=1, max_pending=1, key=lambda u: u["chat_id"], on_error=on_error)
+    async with dispatcher:
+        for i in range(3):
+            await dispatcher.put({"chat_id": i})
+        try:
+            await dispatcher.put({})
+            assert False
+        except KeyError:
+            pass
+        await dispatcher.put({"chat_id": 3})
+    return dispatcher.stats()
+
+
+assert asyncio.run(asyncio.wait_for(dispatch_with_broken_callbacks(), 5))["errors"] == 4
+
+
+def sharded_handler(_proxy, update):
+    assert isinstance(update, Update)
+    if update.update_id == 3:
+        raise ValueError("three")
+
+
+def slow_sharded_handler(_proxy, _update):
+    time.sleep(0.001)
+
+
+def sharded_proxy():
+    return TeleProxy(None)
+
+
+class TestTransportSharded:
+    def __init__(self, runner: ShardedRunner, total: int):
+        self.runner = runner
+        self.total = total
+        self.offsets = []
+        self.downloaded = 0
+
+    def request(self, api_method_name: str, params: dict, _files: dict) -> bytes:
+        assert api_method_name == "getUpdates"
+        offset = params.get("offset", 1)
+        self.offsets.append(offset)
+        self.downloaded += max(min(params["limit"], self.total + 1 - offset), 0)
+        if offset > self.total:
+            self.runner.stop()
+        updates = [
+            {"update_id": i, "message": {"message_id": i, "date": 123, "chat": {"id": i % 2, "type": "private"}}}
+            for i in range(offset, min(offset + params["limit"], self.total + 1))
+        ]
+        return default_codec.dumps({"ok": True, "result": updates})
+
+
+if "fork" in multiprocessing.get_all_start_methods():
+    errors = []
+    runner = ShardedRunner(
+        sharded_handler, sharded_proxy, processes=2, on_error=lambda *e: errors.append(e), start_method="fork"
+    )
+    transport = TestTransportSharded(runner, 6)
+    runner.poll(transport, timeout=0)
+    assert runner.stats() == {"processes": 0, "in_flight": 0, "handled": 6, "errors": 1, "duplicates": 0}
+    assert errors == [(3, "ValueError: three")] and transport.offsets[0] == 1 and transport.offsets[-1] == 7
+
+    runner = ShardedRunner(sharded_handler, sharded_proxy, processes=2, max_in_flight=4, start_method="fork")
+    transport = TestTransportSharded(runner, 12)
+    runner.poll(transport, timeout=0, limit=5, confirm_on_dispatch=True)
+    assert runner.stats()["handled"] == 12 and transport.offsets == [1, 6, 11, 13, 13]
+
+    # updates in flight are received again, but only a part of them
+    runner = ShardedRunner(slow_sharded_handler, sharded_proxy, processes=2, start_method="fork")
+    transport = TestTransportSharded(runner, 500)
+    runner.poll(transport, timeout=0, limit=50)
+    print(transport.downloaded, transport.offsets)
+    assert runner.stats()["handled"] == 500 and transport.downloaded <= 2 * 500 + 50
+
+
+async def asgi_post(app, body: bytes, headers=(), path="/hook", method="POST"):
+    sent = []
+    chunks = [body[:10], body[10:]]
+
+    async def receive():
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    async def send(message):
+        sent.append(message)
+
+    await app({"type": "http", "method": method, "path": path, "headers": list(headers)}, receive, send)
+    return sent[0]["status"], sent[1]["body"]
+
+
+async def receive_webhooks():
+    updates = []
+
+    async def sink(update):
+        updates.append(update)
+
+    app = WebhookApp(sink, secret_token="s3cret", path="/hook")
+    token = [(b"x-telegram-bot-api-secret-token", b"s3cret")]
+    body = default_codec.dumps({"update_id": 5, "message": msg.dict(exclude_none=True)}).encode()
+    statuses = [
+        await asgi_post(app, body, token),
+        await asgi_post(app, body, [(b"x-telegram-bot-api-secret-token", b"wrong")]),
+        await asgi_post(app, body),
+        await asgi_post(app, body, token, path="/other"),
+        await asgi_post(app, body, token, method="GET"),
+        await asgi_post(app, b"{not json", token),
+    ]
+    return statuses, updates
+
+
+statuses, updates = asyncio.run(receive_webhooks())
+assert [status for status, _ in statuses] == [200, 401, 401, 404, 405, 400]
+assert len(updates) == 1 and isinstance(updates[0], Update) and updates[0].message == msg
+
+
+async def reply_in_webhook():
+    bot = TeleProxyAsync(TestTransportEcho(), middlewares=[ReplyInWebhook()])
+    results = []
+
+    async def echo(update):
+        results.append(await bot.sendMessage(chat_id=update.update_id, text="Hi"))
+        results.append(await bot.sendMessage(chat_id=update.update_id, text="Again"))
+
+    body = default_codec.dumps({"update_id": 2, "message": msg.dict(exclude_none=True)}).encode()
+    async with Dispatcher(echo) as dispatcher:
+        response = await asgi_post(WebhookApp(dispatcher.put, reply=True), body)
+    direct = await asgi_post(WebhookApp(echo, reply=True), body)
+    return response, direct, results
+
+
+response, direct, results = asyncio.run(reply_in_webhook())
+assert response == direct and response[0] == 200
+assert default_codec.loads(response[1]) == {"method": "sendMessage", "chat_id": 2, "text": "Hi"}
+assert results[0] is REPLIED and results[1].message_id == 2 and results[2] is REPLIED
+
+
+dedup = UpdateDedup(maxlen=2)
+assert [dedup.seen(i) for i in (1, 2, 1, 3, 1)] == [False, False, True, False, False]
+dedup = SqliteUpdateDedup(":memory:", maxlen=10)
+assert [dedup.seen(i) for i in (1, 2, 1)] == [False, False, True] and dedup.duplicates == 1
+assert peek_update_id(b'{"update_id": 42, "message": {}}') == 42 and peek_update_id(b"{}") is None
+
+stream = TeleProxy(TestTransportUpdates(6)).iter_updates(limit=3, buffer=3, dedup=UpdateDedup())
+stream.dedup.seen(2)
+assert take_updates(stream, 5) == [1, 3, 4, 5, 6] and stream.stats()["duplicates"] == 1
+
+
+class TestTransportWaiting:
+    def __init__(self, ids):
+        self.ids = ids
+        self.polls = 0
+
+    def request(self, _api_method_name: str, params: dict, _files: dict) -> dict:
+        self.polls += 1
+        result = [{"update_id": i} for i in self.ids if i >= params.get("offset", 0)]
+        if not result:
+            time.sleep(params["timeout"] / 1000)  # long poll, timeout is in ms here
+        return {"ok": True, "result": result}
+
+
+# update 6 was handled before restart, offset must move past it
+transport = TestTransportWaiting([5, 6])
+dedup = UpdateDedup()
+dedup.commit(6)
+for update in TeleProxy(transport).iter_updates(timeout=10, dedup=dedup):
+    time.sleep(0.2)
+    break
+assert transport.polls < 50
+
+
+async def receive_redelivered():
+    updates = []
+
+    async def sink(update):
+        updates.append(update)
+
+    app = WebhookApp(sink, dedup=UpdateDedup())
+    body = default_codec.dumps({"update_id": 5, "message": msg.dict(exclude_none=True)}).encode()
+    await asgi_post(app, body)
+    await asgi_post(app, body)
+    return app.duplicates, updates
+
+
+duplicates, updates = asyncio.run(receive_redelivered())
+assert duplicates == 1 and len(updates) == 1
+
+
+async def receive_after_failure():
+    updates = []
+
+    async def sink(update):
+        updates.append(update)
+        if len(updates) == 1:
+            raise RuntimeError()
+
+    app = WebhookApp(sink, parse=None, dedup=UpdateDedup())
+    try:
+        await asgi_post(app, b'{"update_id": 5}')
+        assert False
+    except RuntimeError:
+        pass
+    # retried by Telegram after error response
+    await asgi_post(app, b'{"update_id": 5}')
+    return app.duplicates, updates
+
+
+assert asyncio.run(receive_after_failure()) == (0, [b'{"update_id": 5}'] * 2)
+
+for dedup in (UpdateDedup(), SqliteUpdateDedup(":memory:")):
+    assert not dedup.check(7) and not dedup.check(7)
+    dedup.commit(7)
+    assert dedup.check(7) and dedup.seen(7)
+
+
+parser = UpdateParser({"callback_query", "message"})
+assert parser.allowed_updates == ["message", "callback_query"]
+update = parser.parse(default_codec.dumps({"update_id": 1, "message": msg.dict(exclude_none=True)}))
+assert isinstance(update, Update) and update.message == msg
+update = parser.parse(b'{"update_id": 2, "poll": {"id": "x"}}')
+assert update.poll == {"id": "x"} and pickle.loads(pickle.dumps(parser)).kinds == parser.kinds
+try:
+    UpdateParser({"messages"})
+    assert False
+except ValueError:
+    pass
+
+
+class TestTransportSelected(TestTransportUpdates):
+    def request(self, api_method_name: str, params: dict, _files: dict) -> dict:
+        assert params["allowed_updates"] == ["message"]
+        result = [{"update_id": 1, "message": msg.dict(exclude_none=True)}, {"update_id": 2, "poll": {"id": "x"}}]
+        return {"ok": True, "result": result[params.get("offset", 1) - 1 :]}
+
+
+stream = TeleProxy(TestTransportSelected(2)).iter_updates(parser=UpdateParser({"message"}))
+assert take_updates(stream, 2) == [1, 2]
+
+
+class TestTransportAdmins:
+    def request(self, api_method_name: str, params: dict, _files: dict) -> dict:
+        assert api_method_name == "getChatAdministrators"
+        user = {"id": 1, "is_bot": False, "first_name": "A"}
+        result = [{"status": "creator", "user": user, "is_anonymous": False}, {"status": "left", "user": user}]
+        return {"ok": True, "result": result}
+
+
+for trusted in (False, True):
+    admins = TeleProxy(TestTransportAdmins(), trusted=trusted).getChatAdministrators(chat_id=1)
+    assert [type(a) for a in admins] == [ChatMemberOwner, ChatMemberLeft]
+try:
+    ChatMemberLeft(status="creator", user=admins[0].user)
+    assert False
+except ValueError:
+    pass
+
+
+class TestTransportNewMember:
+    def request(self, _api_method_name: str, _params: dict, _files: dict) -> dict:
+        user = {"id": 1, "is_bot": False, "first_name": "A"}
+        return {"ok": True, "result": [{"status": "superadmin", "user": user}]}
+
+
+for trusted in (False, True):
+    try:
+        TeleProxy(TestTransportNewMember(), trusted=trusted).getChatAdministrators(chat_id=1)
+        assert False
+    except ValueError:
+        pass
+
+# members of InlineQueryResult share tags, i.e. "photo" of cached and not cached results
+result = construct_as(InlineQueryResult, {"type": "photo", "id": "1", "photo_file_id": "f"})
+assert isinstance(result, InlineQueryResultCachedPhoto)